@@ -1,31 +1,140 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
+import asyncio
+import bisect
+import csv
+import gzip
+import heapq
+import io
 import json
+import math
 import os
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
 from dotenv import load_dotenv
 import database as db
+import league_backup
 
 # Load environment variables
 load_dotenv()
 
-# Bot setup
+class LeagueCommandTree(app_commands.CommandTree):
+    """Command tree that scopes every interaction to its server's league"""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.guild_id is None:
+            if interaction.type is discord.InteractionType.application_command:
+                await interaction.response.send_message(
+                    "❌ League commands only work inside a league server!",
+                    ephemeral=True
+                )
+            return False
+        use_league(interaction.guild_id)
+        if interaction.type is discord.InteractionType.application_command:
+            get_shard_metrics(shard_of(interaction.guild_id)).commands += 1
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        if not isinstance(getattr(error, 'original', None), db.DatabaseUnavailable):
+            await super().on_error(interaction, error)
+            return
+        message = "⚠️ The league database is unreachable right now. Please try again in a minute."
+        if interaction.response.is_done():
+            await interaction.followup.send(message, ephemeral=True)
+        else:
+            await interaction.response.send_message(message, ephemeral=True)
+
+# Sharded mode runs one gateway connection per shard, each serving a slice of
+# the servers. SHARD_COUNT pins the number of shards; otherwise Discord's
+# recommendation is used.
+SHARDED = os.getenv('SHARDED', '').lower() in ('1', 'true', 'yes')
+SHARD_COUNT = int(os.getenv('SHARD_COUNT')) if os.getenv('SHARD_COUNT') else None
+# Instances can split the shards between them: SHARD_IDS (e.g. "0,1") picks
+# this instance's shards out of SHARD_COUNT.
+SHARD_IDS = [int(i) for i in os.getenv('SHARD_IDS').split(',')] if os.getenv('SHARD_IDS') else None
+
+# Instances sharing a database coordinate through it. With STANDBY set an
+# instance waits for the gateway lock of its shards before connecting, so one
+# serves while the others take over within seconds if it dies. Background
+# jobs run only on the instance holding the jobs lock.
+STANDBY = os.getenv('STANDBY', '').lower() in ('1', 'true', 'yes')
+LEADER_POLL_SECONDS = float(os.getenv('LEADER_POLL_SECONDS', '3'))
+# How often writes logged while the database was unreachable are retried
+WRITE_REPLAY_SECONDS = 5
+LOCK_SUFFIX = f":{','.join(map(str, SHARD_IDS))}" if SHARD_IDS else ''
+GATEWAY_LOCK = 'gateway' + LOCK_SUFFIX
+JOBS_LOCK = 'jobs' + LOCK_SUFFIX
+
+# Member lists are only downloaded at startup when CHUNK_MEMBERS is set.
+# Otherwise owners are looked up on demand with resolve_member(s).
+CHUNK_MEMBERS = os.getenv('CHUNK_MEMBERS', '').lower() in ('1', 'true', 'yes')
+
+# Longest rate limit discord.py waits out by itself
+RATE_LIMIT_WAIT_SECONDS = 30.0
+
+# Bot setup. Message content isn't needed: every command is a slash command.
 intents = discord.Intents.default()
-intents.message_content = True
 intents.members = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+bot_options = {
+    'command_prefix': '!',
+    'intents': intents,
+    'tree_cls': LeagueCommandTree,
+    'chunk_guilds_at_startup': CHUNK_MEMBERS,
+    # Longer rate limits raise discord.RateLimited instead of stalling the
+    # caller, so the outbox reschedules the side-effect for when it lifts
+    'max_ratelimit_timeout': RATE_LIMIT_WAIT_SECONDS
+}
+if SHARDED:
+    bot = commands.AutoShardedBot(shard_count=SHARD_COUNT, shard_ids=SHARD_IDS, **bot_options)
+else:
+    bot = commands.Bot(**bot_options)
 
-# Data file paths
+# Data file paths. Every league (Discord server) keeps its stores in its own
+# directory under LEAGUES_DIR; the store paths below are relative to it.
 DATA_DIR = 'data'
-TEAMS_FILE = os.path.join(DATA_DIR, 'teams.json')
-SCHEDULE_FILE = os.path.join(DATA_DIR, 'schedule.json')
-STANDINGS_FILE = os.path.join(DATA_DIR, 'standings.json')
-CONFIG_FILE = os.path.join(DATA_DIR, 'config.json')
-GAMES_FILE = os.path.join(DATA_DIR, 'games.json')
-HEAD_TO_HEAD_FILE = os.path.join(DATA_DIR, 'head_to_head.json')
-NFL_TEAMS_FILE = os.path.join(DATA_DIR, 'nfl_teams.json')
+LEAGUES_DIR = os.path.join(DATA_DIR, 'leagues')
+TEAMS_FILE = 'teams.json'
+SCHEDULE_FILE = 'schedule.json'
+STANDINGS_FILE = 'standings.json'
+CONFIG_FILE = 'config.json'
+GAMES_FILE = 'games.json'
+HEAD_TO_HEAD_FILE = 'head_to_head.json'
+RANKING_SNAPSHOTS_FILE = 'rankings_season_{season}.json'
+PLAYOFFS_FILE = 'playoffs.json'
+PENDING_REPORTS_FILE = 'pending_reports.json'
+OUTBOX_FILE = 'outbox.json'
+BACKUP_DIR = 'backups'
+ARCHIVE_DIR = 'archive'
+SEASON_ARCHIVE_FILE = os.path.join(ARCHIVE_DIR, 'season_{season}.json.gz')
+ALL_TIME_FILE = 'all_time.json'
+# Stores a single-league deployment kept directly in DATA_DIR
+LEGACY_LEAGUE_FILES = [
+    TEAMS_FILE, SCHEDULE_FILE, STANDINGS_FILE, CONFIG_FILE, GAMES_FILE, HEAD_TO_HEAD_FILE,
+    PLAYOFFS_FILE, PENDING_REPORTS_FILE, ALL_TIME_FILE, BACKUP_DIR, ARCHIVE_DIR
+]
+# Server that takes over the data of a single-league deployment (default: the
+# bot's only server, if it is in exactly one)
+LEGACY_GUILD_ID = os.getenv('LEGACY_GUILD_ID')
+
+# Leagues whose in-memory indexes are kept at once; the least recently used is evicted
+LEAGUE_CACHE_SIZE = int(os.getenv('LEAGUE_CACHE_SIZE', '50'))
+
+# Channel posts and pins that follow league changes go through the outbox:
+# requests for the same update within OUTBOX_COALESCE_SECONDS are merged, a
+# few are carried out per pass, and failures are retried with backoff.
+OUTBOX_POLL_SECONDS = 2
+OUTBOX_COALESCE_SECONDS = 3
+OUTBOX_BATCH = 5
+OUTBOX_RETRY_SECONDS = 10
+OUTBOX_MAX_BACKOFF_SECONDS = 600
+OUTBOX_MAX_ATTEMPTS = 8
+
+# Scheduled backups (hours between runs, archives to keep)
+BACKUP_INTERVAL_HOURS = float(os.getenv('BACKUP_INTERVAL_HOURS', '24'))
+BACKUP_KEEP = int(os.getenv('BACKUP_KEEP', '7'))
 
 # NFL Teams Database
 NFL_TEAMS = {
@@ -52,22 +161,48 @@ TEAM_ABBREVIATIONS = {
 }
 
 # Ensure data directory exists
-os.makedirs(DATA_DIR, exist_ok=True)
+os.makedirs(LEAGUES_DIR, exist_ok=True)
+
+# League scope
+def use_league(guild_id):
+    """Scope storage and caches to a server's league for the rest of the current task"""
+    db.current_league.set(str(guild_id))
+
+@contextmanager
+def league_scope(guild_id):
+    """Scope storage and caches to a server's league inside a with block"""
+    token = db.current_league.set(str(guild_id))
+    try:
+        yield
+    finally:
+        db.current_league.reset(token)
+
+def league_dir():
+    """Get the data directory of the league in scope"""
+    return os.path.join(LEAGUES_DIR, db.league_id())
+
+def league_path(filename):
+    """Get the path of a store in the league in scope"""
+    return os.path.join(league_dir(), filename)
 
 # Helper functions for data management
-def load_json(filepath, default=None):
-    """Load JSON data from file"""
+def load_json(filename, default=None):
+    """Load a store of the league in scope"""
     if default is None:
         default = {}
+    filepath = league_path(filename)
     if os.path.exists(filepath):
         with open(filepath, 'r') as f:
             return json.load(f)
     return default
 
-def save_json(filepath, data):
-    """Save JSON data to file"""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=4)
+def save_json(filename, data, compact=False):
+    """Save a store of the league in scope"""
+    with open(league_path(filename), 'w') as f:
+        if compact:
+            json.dump(data, f, separators=(',', ':'))
+        else:
+            json.dump(data, f, indent=4)
 
 # Hybrid helper functions (use database if available, otherwise JSON)
 async def get_teams_data():
@@ -100,37 +235,151 @@ async def get_head_to_head_data():
         return await db.get_all_head_to_head()
     return load_json(HEAD_TO_HEAD_FILE)
 
+async def get_league_snapshot_data(include_head_to_head=True):
+    """Get (teams, standings, head_to_head, config) together.
+
+    The database returns all four in a single query; the JSON files are
+    loaded concurrently.
+    """
+    if db.pool:
+        snapshot = await db.get_league_snapshot(include_head_to_head)
+        return snapshot['teams'], snapshot['standings'], snapshot['head_to_head'], snapshot['config']
+    
+    loads = [
+        asyncio.to_thread(load_json, TEAMS_FILE),
+        asyncio.to_thread(load_json, STANDINGS_FILE),
+        asyncio.to_thread(load_json, CONFIG_FILE)
+    ]
+    if include_head_to_head:
+        loads.append(asyncio.to_thread(load_json, HEAD_TO_HEAD_FILE))
+    results = await asyncio.gather(*loads)
+    teams, standings, config = results[:3]
+    head_to_head = results[3] if include_head_to_head else {}
+    return teams, standings, head_to_head, config
+
+def bump_league_version():
+    """Mark the league in scope as changed, invalidating its rendered views"""
+    league_cache().version += 1
+    announce_league_change()
+
 # Initialize data files
 def init_data_files():
-    """Initialize data files if they don't exist"""
-    if not os.path.exists(TEAMS_FILE):
+    """Initialize the league in scope's data files if they don't exist"""
+    os.makedirs(league_dir(), exist_ok=True)
+    if not os.path.exists(league_path(TEAMS_FILE)):
         save_json(TEAMS_FILE, {})
-    if not os.path.exists(SCHEDULE_FILE):
+    if not os.path.exists(league_path(SCHEDULE_FILE)):
         save_json(SCHEDULE_FILE, {"games": []})
-    if not os.path.exists(STANDINGS_FILE):
+    if not os.path.exists(league_path(STANDINGS_FILE)):
         save_json(STANDINGS_FILE, {})
-    if not os.path.exists(CONFIG_FILE):
+    if not os.path.exists(league_path(CONFIG_FILE)):
         save_json(CONFIG_FILE, {
             "league_name": "Madden Franchise League",
             "season": 1,
             "week": 1,
             "admin_role": "League Admin"
         })
-    if not os.path.exists(GAMES_FILE):
+    if not os.path.exists(league_path(GAMES_FILE)):
         save_json(GAMES_FILE, [])
-    if not os.path.exists(HEAD_TO_HEAD_FILE):
+    if not os.path.exists(league_path(HEAD_TO_HEAD_FILE)):
         save_json(HEAD_TO_HEAD_FILE, {})
 
+def adopt_legacy_json_league(guild_id):
+    """Move a single-league deployment's stores into a server's league directory.
+
+    Only done while that server has no directory of its own. Returns True if
+    anything was moved.
+    """
+    target = os.path.join(LEAGUES_DIR, str(guild_id))
+    legacy = [name for name in LEGACY_LEAGUE_FILES if os.path.exists(os.path.join(DATA_DIR, name))]
+    legacy += [
+        name for name in os.listdir(DATA_DIR)
+        if name.startswith('rankings_season_') and name.endswith('.json')
+    ]
+    if not legacy or os.path.exists(target):
+        return False
+    os.makedirs(target)
+    for name in legacy:
+        os.replace(os.path.join(DATA_DIR, name), os.path.join(target, name))
+    return True
+
+def legacy_league_owner():
+    """Get the server that inherits single-league data, if one can be chosen"""
+    if LEGACY_GUILD_ID:
+        return LEGACY_GUILD_ID
+    # Shards come up one at a time, so only an unsharded bot knows it has one server
+    if not SHARDED and len(bot.guilds) == 1:
+        return str(bot.guilds[0].id)
+    return None
+
+async def init_league(guild):
+    """Make sure a server's league has its config (database) or data files (JSON)"""
+    with league_scope(guild.id):
+        if db.pool:
+            await db.init_league(db.league_id())
+        else:
+            init_data_files()
+
+async def warm_league(guild):
+    """Build a league's in-memory indexes so its first commands don't pay for it"""
+    with league_scope(guild.id):
+        await get_head_to_head_index()
+        await get_team_index()
+        await get_team_game_index()
+        await get_league_stats()
+        await get_division_index()
+        await get_week_status_index()
+        await get_all_time_index()
+
+async def prepare_leagues(guilds):
+    """Set up the leagues of servers that just became available"""
+    try:
+        # Data from before leagues were kept per server goes to one server
+        owner = legacy_league_owner()
+        if owner and any(str(guild.id) == owner for guild in guilds):
+            adopted = await db.adopt_legacy_league(owner) if db.pool else adopt_legacy_json_league(owner)
+            if adopted:
+                print(f'📦 Moved the existing league data to server {owner}')
+        
+        for guild in guilds:
+            await init_league(guild)
+            await restore_outbox(guild)
+        
+        # Warm the in-memory indexes so the first commands don't pay for the build
+        for guild in guilds[:LEAGUE_CACHE_SIZE]:
+            await warm_league(guild)
+    except db.DatabaseUnavailable as e:
+        print(f'⚠️  Couldn\'t finish setting up the leagues; the database is unreachable ({e})')
+
 @bot.event
-async def on_ready():
-    """Bot startup event"""
-    # Initialize database
-    db_connected = await db.init_db()
-    if db_connected:
+async def setup_hook():
+    """Connect to storage once, before any shard connects"""
+    if await db.init_db():
         print('✅ Using Supabase database')
+        await db.listen_for_changes(forget_league)
+        replay_offline_writes.start()
     else:
         print('⚠️  Using JSON files (DATABASE_URL not set)')
-        init_data_files()
+
+@bot.event
+async def on_shard_ready(shard_id):
+    """Set up a shard's leagues as soon as that shard is ready (sharded mode)"""
+    get_shard_metrics(shard_id).mark_ready()
+    guilds = [guild for guild in bot.guilds if guild.shard_id == shard_id]
+    await prepare_leagues(guilds)
+    print(f'Shard {shard_id} ready with {len(guilds)} guild(s)')
+
+@bot.event
+async def on_ready():
+    """Bot startup event"""
+    if not SHARDED:
+        get_shard_metrics(0).mark_ready()
+        await prepare_leagues(bot.guilds)
+    
+    if not coordinate.is_running():
+        coordinate.start()
+    if not drain_outbox.is_running():
+        drain_outbox.start()
     
     print(f'{bot.user} has connected to Discord!')
     print(f'Bot is in {len(bot.guilds)} guild(s)')
@@ -149,9 +398,141 @@ async def on_ready():
     except Exception as e:
         print(f'Failed to sync commands: {e}')
 
+# ==================== SHARD METRICS ====================
+
+class ShardMetrics:
+    """Gateway and command counters for one shard"""
+
+    def __init__(self):
+        self.connects = 0
+        self.disconnects = 0
+        self.resumes = 0
+        self.commands = 0
+        self.ready_at = None
+        self.last_disconnect = None
+
+    def mark_ready(self):
+        self.ready_at = datetime.utcnow()
+
+    def mark_disconnected(self):
+        self.disconnects += 1
+        self.last_disconnect = datetime.utcnow()
+
+shard_metrics = {}
+
+def get_shard_metrics(shard_id):
+    """Get a shard's metrics, creating them on first use"""
+    metrics = shard_metrics.get(shard_id)
+    if metrics is None:
+        metrics = shard_metrics[shard_id] = ShardMetrics()
+    return metrics
+
+def shard_of(guild_id):
+    """Get the shard a server is served by (0 when not sharded)"""
+    return (int(guild_id) >> 22) % (bot.shard_count or 1)
+
+# Sharded bots report every gateway event per shard; an unsharded bot is shard 0
+@bot.event
+async def on_shard_connect(shard_id):
+    get_shard_metrics(shard_id).connects += 1
+
+@bot.event
+async def on_shard_disconnect(shard_id):
+    get_shard_metrics(shard_id).mark_disconnected()
+
+@bot.event
+async def on_shard_resumed(shard_id):
+    get_shard_metrics(shard_id).resumes += 1
+
+@bot.event
+async def on_connect():
+    if not SHARDED:
+        get_shard_metrics(0).connects += 1
+
+@bot.event
+async def on_disconnect():
+    if not SHARDED:
+        get_shard_metrics(0).mark_disconnected()
+
+@bot.event
+async def on_resumed():
+    if not SHARDED:
+        get_shard_metrics(0).resumes += 1
+
+# ==================== COORDINATION ====================
+
+# Change notices still being sent (kept so they aren't garbage collected)
+pending_notices = set()
+
+def announce_league_change():
+    """Tell the other instances the league in scope changed (database mode)"""
+    if db.pool:
+        task = asyncio.create_task(db.notify_league_changed(db.league_id()))
+        pending_notices.add(task)
+        task.add_done_callback(pending_notices.discard)
+
+@tasks.loop(seconds=LEADER_POLL_SECONDS)
+async def coordinate():
+    """Run the background jobs while holding the jobs lock, and keep listening for other instances' changes"""
+    if await db.hold_lock(JOBS_LOCK):
+        if not scheduled_backup.is_running():
+            print('👑 Running the background jobs on this instance')
+            scheduled_backup.start()
+    elif scheduled_backup.is_running():
+        print('Background jobs handed over to another instance')
+        scheduled_backup.stop()
+    
+    if db.pool and not db.is_listening():
+        # Changes made while the connection was down were missed, so nothing cached can be trusted
+        if await db.listen_for_changes(forget_league):
+            league_caches.clear()
+            print('🔄 Listening for league changes again; caches cleared')
+
+@tasks.loop(seconds=WRITE_REPLAY_SECONDS)
+async def replay_offline_writes():
+    """Send writes logged while the database was unreachable, once it is back"""
+    replayed, rejected = await db.replay_write_log()
+    for guild_id in set(rejected):
+        forget_league(guild_id)
+    if replayed:
+        print(f'💾 Replayed {replayed} logged write(s), {len(db.write_log)} still waiting')
+
+async def watch_gateway_lock():
+    """Disconnect once another instance has taken the gateway lock, so two instances never serve the same shards"""
+    while await db.hold_lock(GATEWAY_LOCK):
+        await asyncio.sleep(LEADER_POLL_SECONDS)
+    print('❌ Another instance took the gateway lock; disconnecting')
+    await bot.close()
+
+async def serve_as_standby(token):
+    """Wait for the gateway lock, then serve until it is lost"""
+    if not await db.init_db():
+        print("ERROR: STANDBY needs DATABASE_URL (JSON mode runs a single instance)")
+        return
+    
+    print(f'⏳ Standing by for the gateway lock ({GATEWAY_LOCK})')
+    while not await db.hold_lock(GATEWAY_LOCK):
+        await asyncio.sleep(LEADER_POLL_SECONDS)
+    print('👑 Took the gateway lock; connecting to Discord')
+    
+    async with bot:
+        watch = asyncio.create_task(watch_gateway_lock())
+        try:
+            await bot.start(token)
+        finally:
+            watch.cancel()
+            await db.close_db()
+
+@bot.event
+async def on_guild_join(guild):
+    """Start a new league when the bot is added to a server"""
+    await init_league(guild)
+
 @bot.event
 async def on_member_join(member):
     """Send welcome message when a new member joins"""
+    forget_member(member.guild.id, member.id)
+    
     # Find welcome-message channel
     welcome_channel = discord.utils.get(member.guild.text_channels, name="welcome-message")
     general_channel = discord.utils.get(member.guild.text_channels, name="general")
@@ -216,6 +597,96 @@ async def on_member_join(member):
     except discord.Forbidden:
         pass  # Bot doesn't have permission to post
 
+@bot.event
+async def on_member_remove(member):
+    """Forget a resolved member who left"""
+    forget_member(member.guild.id, member.id)
+
+# ==================== MEMBER RESOLUTION ====================
+
+# Resolved members kept outside discord.py's member cache. Members who
+# aren't in the server are remembered as None, so they aren't looked up again.
+MEMBER_CACHE_SIZE = 1024
+# Most user IDs Discord accepts in one member query
+MEMBER_QUERY_LIMIT = 100
+
+resolved_members = OrderedDict()
+
+def remember_member(guild_id, user_id, member):
+    """Store a resolved member (or None), evicting the least recently used"""
+    resolved_members[(guild_id, user_id)] = member
+    resolved_members.move_to_end((guild_id, user_id))
+    while len(resolved_members) > MEMBER_CACHE_SIZE:
+        resolved_members.popitem(last=False)
+
+def forget_member(guild_id, user_id):
+    """Drop a resolved member after they join or leave"""
+    resolved_members.pop((guild_id, user_id), None)
+
+def cached_member(guild, user_id):
+    """Look a member up without calling Discord. Returns (known, member)."""
+    member = guild.get_member(user_id)
+    if member is not None:
+        return True, member
+    key = (guild.id, user_id)
+    if key in resolved_members:
+        resolved_members.move_to_end(key)
+        return True, resolved_members[key]
+    return False, None
+
+async def resolve_member(guild, user_id):
+    """Get a server member, fetching them from Discord if they aren't cached (None if not in the server)"""
+    user_id = int(user_id)
+    known, member = cached_member(guild, user_id)
+    if known:
+        return member
+    try:
+        member = await guild.fetch_member(user_id)
+    except discord.NotFound:
+        member = None
+    except discord.HTTPException:
+        return None
+    remember_member(guild.id, user_id, member)
+    return member
+
+async def resolve_members(guild, user_ids):
+    """Get many server members at once: {user_id: member or None}.
+
+    Members that aren't cached are requested through the gateway in batches,
+    instead of one API call each; only IDs missing from a reply are fetched
+    one by one.
+    """
+    members = {}
+    missing = []
+    for user_id in user_ids:
+        known, member = cached_member(guild, int(user_id))
+        if known:
+            members[user_id] = member
+        else:
+            missing.append(user_id)
+
+    for i in range(0, len(missing), MEMBER_QUERY_LIMIT):
+        batch = missing[i:i + MEMBER_QUERY_LIMIT]
+        try:
+            found = await guild.query_members(
+                user_ids=[int(user_id) for user_id in batch], limit=len(batch), cache=False
+            )
+        except asyncio.TimeoutError:
+            for user_id in batch:
+                members[user_id] = None
+            continue
+        found = {member.id: member for member in found}
+        for user_id in batch:
+            member = found.get(int(user_id))
+            if member is None:
+                # A gateway reply doesn't say whether it was cut short, so only
+                # a fetch can confirm someone has left (and cache them as None)
+                member = await resolve_member(guild, user_id)
+            else:
+                remember_member(guild.id, int(user_id), member)
+            members[user_id] = member
+    return members
+
 # Admin check decorator
 def is_admin():
     """Check if user has admin role"""
@@ -245,23 +716,32 @@ async def update_teams_list(guild):
         # Sort teams by abbreviation
         sorted_teams = sorted(teams.items(), key=lambda x: x[1]['abbreviation'])
         
+        members = await resolve_members(guild, teams)
         teams_list = []
         for user_id, team in sorted_teams:
-            member = guild.get_member(int(user_id))
+            member = members[user_id]
             if member:
                 teams_list.append(f"**#{team['abbreviation'].lower()}** - {member.mention}")
             else:
-                teams_list.append(f"**#{team['abbreviation'].lower()}** - {team['owner']}")
+                teams_list.append(f"**#{team['abbreviation'].lower()}** - {team.get('owner', 'Unknown')}")
         
-        # Split into chunks if too long
-        chunk_size = 20
-        for i in range(0, len(teams_list), chunk_size):
-            chunk = teams_list[i:i+chunk_size]
+        # Split into chunks if too long, keeping the pin inside Discord's embed limits
+        chunk_size = ROSTER_ROWS_PER_FIELD
+        shown = teams_list[:chunk_size * ROSTER_MAX_FIELDS]
+        for i in range(0, len(shown), chunk_size):
+            chunk = shown[i:i+chunk_size]
             embed.add_field(
                 name=f"Teams ({i+1}-{min(i+chunk_size, len(teams_list))})" if len(teams_list) > chunk_size else "Teams",
                 value="\n".join(chunk),
                 inline=False
             )
+        
+        if len(teams_list) > len(shown):
+            embed.add_field(
+                name=f"... and {len(teams_list) - len(shown)} more",
+                value="Use `/teams` to browse the full roster.",
+                inline=False
+            )
     else:
         embed.description = "No teams registered yet. Use `/register_team` to join!"
     
@@ -286,8 +766,489 @@ async def update_teams_list(guild):
             await new_message.pin()
     except discord.Forbidden:
         pass  # Bot doesn't have permission
-    except Exception as e:
-        print(f"Error updating teams list: {e}")
+
+# ==================== RENDERING ====================
+
+# Columns of the fixed-width ranking tables: (header, width)
+STANDINGS_COLUMNS = [('Rank', 6), ('Team', 20), ('W-L', 8), ('PF', 6), ('PA', 6), ('Diff', 6)]
+RANKINGS_COLUMNS = [('#', 4), ('Team', 20), ('Record', 10), ('PF', 6), ('PA', 6), ('Diff', 6)]
+RANK_MOVEMENT_COLUMNS = [('#', 4), ('Team', 20), ('Record', 10), ('Move', 6)]
+TIEBREAKER_RULES = "1️⃣ Best Record\n2️⃣ Head-to-Head Result\n3️⃣ Point Differential"
+
+RENDER_CACHE_SIZE = 128
+
+# Page sizes keep each embed well inside Discord's limits (4096-char
+# description, 25 fields, 6000 chars total) however large the league gets
+TABLE_ROWS_PER_PAGE = 40
+TEAMS_PER_PAGE = 20
+ROSTER_ROWS_PER_FIELD = 20
+ROSTER_MAX_FIELDS = 5
+PAGINATION_TIMEOUT = 300
+
+def render_table(columns, rows):
+    """Render rows as a fixed-width table inside a code block"""
+    lines = ["```", "".join(f"{header:<{width}}" for header, width in columns)]
+    lines.append("-" * sum(width for _, width in columns))
+    for row in rows:
+        lines.append("".join(f"{value:<{width}}" for value, (_, width) in zip(row, columns)))
+    lines.append("```")
+    return "\n".join(lines)
+
+def ranking_table_rows(rankings):
+    """Convert ranked team dicts into table rows"""
+    return [
+        (
+            rank,
+            team['abbreviation'],
+            f"{team['wins']}-{team['losses']}",
+            team['points_for'],
+            team['points_against'],
+            f"{team['point_diff']:+d}"
+        )
+        for rank, team in enumerate(rankings, 1)
+    ]
+
+def sort_standings(teams, standings):
+    """Sort registered teams by wins, then point differential"""
+    rows = []
+    for user_id, record in standings.items():
+        if user_id not in teams:
+            continue
+        rows.append({
+            'user_id': user_id,
+            'abbreviation': teams[user_id]['abbreviation'],
+            'wins': record['wins'],
+            'losses': record['losses'],
+            'points_for': record['points_for'],
+            'points_against': record['points_against'],
+            'point_diff': record['points_for'] - record['points_against']
+        })
+    rows.sort(key=lambda x: (x['wins'], x['point_diff']), reverse=True)
+    return rows
+
+class RenderCache:
+    """LRU cache of rendered views keyed by (guild, league state version, view)"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+class LeagueCache:
+    """In-memory state of one league (guild).
+
+    The indexes are built from storage on first use and then updated in
+    place as results come in. Each league evicts independently: dropping a
+    league's cache only means its indexes are rebuilt on next use.
+    """
+
+    def __init__(self):
+        # Bumped on every change to teams, standings, games or config.
+        # Rendered views are cached against it, so any mutation invalidates them.
+        self.version = 0
+        self.render_cache = RenderCache(RENDER_CACHE_SIZE)
+        # Maintained by the team management commands
+        self.team_index = None
+        # Game results update it in place; team changes drop it so the
+        # alignment is rebuilt on next use
+        self.division_index = None
+        # Updated in place by record_game_result
+        self.head_to_head_index = None
+        self.team_game_index = None
+        self.league_stats = None
+        self.week_status_index = None
+        self.all_time_index = None
+        # (version, seeds) - seeding only changes when the standings do
+        self.playoff_seeds = None
+
+# Shard ID -> {guild ID: LeagueCache} in least recently used order. Each shard
+# keeps up to LEAGUE_CACHE_SIZE leagues, so a busy shard never evicts another's.
+league_caches = {}
+
+def league_cache():
+    """Get the in-memory state of the league in scope, evicting its shard's least recently used league when full"""
+    guild_id = db.league_id()
+    shard_caches = league_caches.get(shard_of(guild_id))
+    if shard_caches is None:
+        shard_caches = league_caches[shard_of(guild_id)] = OrderedDict()
+    cache = shard_caches.get(guild_id)
+    if cache is None:
+        cache = shard_caches[guild_id] = LeagueCache()
+        while len(shard_caches) > LEAGUE_CACHE_SIZE:
+            shard_caches.popitem(last=False)
+    else:
+        shard_caches.move_to_end(guild_id)
+    return cache
+
+def drop_league_cache():
+    """Forget everything cached for the league in scope (after it is reset or restored)"""
+    forget_league(db.league_id())
+    announce_league_change()
+
+def forget_league(guild_id):
+    """Forget everything cached for a league, e.g. when another instance changed it"""
+    league_caches.get(shard_of(guild_id), {}).pop(str(guild_id), None)
+
+async def get_rendered_view(guild, view, builder, version=None):
+    """Get a rendered embed for a view, building it only when the league has changed.
+
+    ``builder`` is an async callable returning an embed, or an error message
+    string when there is nothing to show. Embeds are returned as copies so
+    callers can adjust them without touching the cached version. Views built
+    from data read earlier pass the ``version`` it was read at, so they are
+    never cached as current.
+    """
+    cache = league_cache()
+    key = (cache.version if version is None else version, view)
+    rendered = cache.render_cache.get(key)
+    if rendered is None:
+        rendered = await builder()
+        cache.render_cache.put(key, rendered)
+    if isinstance(rendered, discord.Embed):
+        return rendered.copy()
+    return rendered
+
+async def build_standings_source():
+    """Build the sorted standings rows shared by every standings page"""
+    teams, standings, _, config = await get_league_snapshot_data(include_head_to_head=False)
+    
+    if not teams:
+        return "❌ No teams registered yet!"
+    
+    return {
+        'rows': ranking_table_rows(sort_standings(teams, standings)),
+        'footer': f"Season {config.get('season', 1)} - Week {config.get('week', 1)}"
+    }
+
+async def build_standings_page(source, page, page_count):
+    """Build one page of the league standings embed"""
+    embed = discord.Embed(
+        title="🏆 League Standings",
+        description=render_table(STANDINGS_COLUMNS, page_slice(source['rows'], page, TABLE_ROWS_PER_PAGE)),
+        color=discord.Color.purple()
+    )
+    embed.set_footer(text=page_footer(source['footer'], page, page_count))
+    return embed
+
+async def build_power_rankings_source():
+    """Build the ranked rows shared by every power rankings page"""
+    teams, standings, head_to_head_data, config = await get_league_snapshot_data(
+        include_head_to_head=league_cache().head_to_head_index is None
+    )
+    head_to_head = await get_head_to_head_index(head_to_head_data)
+    
+    if not teams:
+        return "❌ No teams registered yet!"
+    
+    rankings = calculate_power_rankings(teams, standings, head_to_head)
+    
+    if not rankings:
+        return "❌ No teams in standings yet! Teams will appear here once registered."
+    
+    return {
+        'rows': ranking_table_rows(rankings),
+        'footer': f"Season {config.get('season', 1)} - Week {config.get('week', 1)} | {len(rankings)} teams"
+    }
+
+async def build_power_rankings_page(source, page, page_count, channel_post=False):
+    """Build one page of the power rankings embed for the command or the #power-rankings channel"""
+    embed = discord.Embed(
+        title="⚡ POWER RANKINGS" if channel_post else "⚡ Power Rankings",
+        description=render_table(RANKINGS_COLUMNS, page_slice(source['rows'], page, TABLE_ROWS_PER_PAGE)),
+        color=discord.Color.gold()
+    )
+    embed.add_field(name="📊 Tiebreaker Rules", value=TIEBREAKER_RULES, inline=False)
+    
+    footer = source['footer']
+    if channel_post:
+        footer += " | Auto-updates after each game"
+    embed.set_footer(text=page_footer(footer, page, page_count))
+    return embed
+
+async def build_teams_source(guild):
+    """Build the (team, owner) rows shared by every registered teams page"""
+    teams_data = await get_teams_data()
+    
+    if not teams_data:
+        return "❌ No teams registered yet!"
+    
+    members = await resolve_members(guild, teams_data)
+    rows = []
+    for user_id, team in teams_data.items():
+        member = members[user_id]
+        owner_mention = member.mention if member else team.get('owner', 'Unknown')
+        rows.append((f"{team['abbreviation']} - {team['name']}", f"Owner: {owner_mention}"))
+    
+    return {'rows': rows, 'footer': f"Total Teams: {len(teams_data)}"}
+
+async def build_teams_page(source, page, page_count):
+    """Build one page of the registered teams embed"""
+    embed = discord.Embed(
+        title="🏈 Registered Teams",
+        color=discord.Color.blue()
+    )
+    
+    for name, value in page_slice(source['rows'], page, TEAMS_PER_PAGE):
+        embed.add_field(name=name, value=value, inline=False)
+    
+    embed.set_footer(text=page_footer(source['footer'], page, page_count))
+    return embed
+
+# ==================== PAGINATION ====================
+
+def page_slice(rows, page, per_page):
+    """Get the rows on one page"""
+    return rows[page * per_page:(page + 1) * per_page]
+
+def page_footer(footer, page, page_count):
+    """Append the page position to a footer when there is more than one page"""
+    if page_count > 1:
+        return f"{footer} | Page {page + 1}/{page_count}"
+    return footer
+
+class PaginatedView(discord.ui.View):
+    """Prev/next buttons over a paginated embed.
+
+    Pages are only rendered when someone navigates to them, and each page is
+    cached per league state version like any other rendered view.
+    """
+
+    def __init__(self, guild, view_name, source, version, per_page, build_page, owner_id):
+        super().__init__(timeout=PAGINATION_TIMEOUT)
+        self.guild = guild
+        self.view_name = view_name
+        # Pages are cached under the league version the source was built at
+        self.source = source
+        self.version = version
+        self.per_page = per_page
+        self.build_page = build_page
+        self.owner_id = owner_id
+        self.page = 0
+        self.message = None
+        self.update_buttons()
+
+    @property
+    def page_count(self):
+        return max(1, math.ceil(len(self.source['rows']) / self.per_page))
+
+    def update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.page_count - 1
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message(
+                "❌ Only the person who ran this command can change pages. Run it yourself to browse!",
+                ephemeral=True
+            )
+            return False
+        use_league(interaction.guild_id)
+        return True
+
+    async def show_page(self, interaction: discord.Interaction, page):
+        self.page = max(0, min(page, self.page_count - 1))
+        self.update_buttons()
+        embed = await get_rendered_view(
+            self.guild,
+            (self.view_name, self.page),
+            lambda: self.build_page(self.source, self.page, self.page_count),
+            version=self.version
+        )
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, self.page - 1)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, self.page + 1)
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+async def send_paginated(interaction, view_name, build_source, build_page, per_page):
+    """Send the first page of a paginated view, with buttons when there is more than one page"""
+    guild = interaction.guild
+    version = league_cache().version
+    source = await get_rendered_view(guild, (view_name, 'source'), build_source, version)
+    
+    if isinstance(source, str):
+        await interaction.response.send_message(source, ephemeral=True)
+        return
+    
+    page_count = max(1, math.ceil(len(source['rows']) / per_page))
+    embed = await get_rendered_view(guild, (view_name, 0), lambda: build_page(source, 0, page_count), version)
+    
+    if page_count == 1:
+        await interaction.response.send_message(embed=embed)
+        return
+    
+    view = PaginatedView(guild, view_name, source, version, per_page, build_page, interaction.user.id)
+    await interaction.response.send_message(embed=embed, view=view)
+    view.message = await interaction.original_response()
+
+# ==================== TEAM INDEX ====================
+
+# Every NFL team gets a fixed bit, in NFL_TEAMS division order
+NFL_TEAM_ORDER = [team for division_teams in NFL_TEAMS.values() for team in division_teams]
+NFL_TEAM_BITS = {team: 1 << i for i, team in enumerate(NFL_TEAM_ORDER)}
+
+def normalize_team_name(name):
+    """Normalize a team name for lookups"""
+    return " ".join(name.lower().split())
+
+def nfl_claim_mask(team_name, abbreviation):
+    """Get the bitmask of NFL teams a registered team occupies.
+
+    A team takes an NFL team when the abbreviations match or either name
+    contains the other (e.g. "chargers" takes "Los Angeles Chargers").
+    """
+    name = normalize_team_name(team_name)
+    abbr = abbreviation.upper()
+    mask = 0
+    for nfl_team in NFL_TEAM_ORDER:
+        nfl_lower = nfl_team.lower()
+        if abbr == TEAM_ABBREVIATIONS[nfl_team] or (name and (name in nfl_lower or nfl_lower in name)):
+            mask |= NFL_TEAM_BITS[nfl_team]
+    return mask
+
+class TeamIndex:
+    """Reverse index from abbreviation and team name to owner ID.
+
+    Also keeps the NFL availability bitmap, so checking whether an NFL team
+    is taken is a single bit test instead of a scan over every registration.
+    """
+
+    def __init__(self):
+        self.by_abbr = {}
+        self.by_name = {}
+        self.teams = {}
+        self.claims = {}
+        self.taken_mask = 0
+        self.sorted_abbrs = []
+
+    def add(self, user_id, team):
+        """Index a registered team"""
+        if user_id in self.teams:
+            self.remove(user_id)
+
+        abbr = team['abbreviation'].upper()
+        self.teams[user_id] = team
+        self.by_abbr[abbr] = user_id
+        self.by_name[normalize_team_name(team['name'])] = user_id
+        bisect.insort(self.sorted_abbrs, abbr)
+
+        mask = nfl_claim_mask(team['name'], abbr)
+        self.claims[user_id] = mask
+        self.taken_mask |= mask
+
+    def remove(self, user_id):
+        """Drop a team from the index"""
+        team = self.teams.pop(user_id, None)
+        if team is None:
+            return
+
+        abbr = team['abbreviation'].upper()
+        if self.by_abbr.get(abbr) == user_id:
+            del self.by_abbr[abbr]
+            self.sorted_abbrs.remove(abbr)
+        name = normalize_team_name(team['name'])
+        if self.by_name.get(name) == user_id:
+            del self.by_name[name]
+
+        del self.claims[user_id]
+        self.taken_mask = 0
+        for mask in self.claims.values():
+            self.taken_mask |= mask
+
+    def owner_by_abbr(self, abbreviation):
+        """Get the owner ID for an abbreviation, or None"""
+        return self.by_abbr.get(abbreviation.upper())
+
+    def owner_by_name(self, team_name):
+        """Get the owner ID for a team name, or None"""
+        return self.by_name.get(normalize_team_name(team_name))
+
+    def is_nfl_team_taken(self, nfl_team):
+        """Check whether an NFL team is already claimed"""
+        return bool(self.taken_mask & NFL_TEAM_BITS[nfl_team])
+
+    def abbreviations_starting_with(self, prefix, limit=25):
+        """Get registered abbreviations with a prefix, in sorted order"""
+        prefix = prefix.upper()
+        start = bisect.bisect_left(self.sorted_abbrs, prefix)
+        matches = []
+        for abbr in self.sorted_abbrs[start:]:
+            if not abbr.startswith(prefix) or len(matches) >= limit:
+                break
+            matches.append(abbr)
+        return matches
+
+    @classmethod
+    def build(cls, teams):
+        """Build the index from the teams store"""
+        index = cls()
+        for user_id, team in teams.items():
+            index.add(user_id, team)
+        return index
+
+async def get_team_index():
+    """Get the team index, building it from storage on first use"""
+    cache = league_cache()
+    if cache.team_index is None:
+        cache.team_index = TeamIndex.build(await get_teams_data())
+    return cache.team_index
+
+def index_team_added(user_id, team):
+    """Add a newly registered team to the index (if it has been built)"""
+    cache = league_cache()
+    if cache.team_index is not None:
+        cache.team_index.add(user_id, team)
+    invalidate_division_index()
+
+def index_team_removed(user_id):
+    """Remove a team from the index (if it has been built)"""
+    cache = league_cache()
+    if cache.team_index is not None:
+        cache.team_index.remove(user_id)
+    invalidate_division_index()
+
+async def team_abbreviation_autocomplete(interaction: discord.Interaction, current: str):
+    """Autocomplete registered team abbreviations"""
+    index = await get_team_index()
+    return [
+        app_commands.Choice(name=f"{abbr} - {index.teams[index.by_abbr[abbr]]['name']}"[:100], value=abbr)
+        for abbr in index.abbreviations_starting_with(current)
+    ]
+
+async def available_abbreviation_autocomplete(interaction: discord.Interaction, current: str):
+    """Autocomplete abbreviations of NFL teams that are still available"""
+    index = await get_team_index()
+    current = current.upper()
+    choices = []
+    for nfl_team in NFL_TEAM_ORDER:
+        abbr = TEAM_ABBREVIATIONS[nfl_team]
+        if abbr.startswith(current) and not index.is_nfl_team_taken(nfl_team):
+            choices.append(app_commands.Choice(name=f"{abbr} - {nfl_team}", value=abbr))
+    return choices[:25]
 
 # ==================== TEAM MANAGEMENT ====================
 
@@ -296,6 +1257,7 @@ async def update_teams_list(guild):
     team_name="Your team name",
     abbreviation="3-letter team abbreviation (e.g., KC, SF, DAL)"
 )
+@app_commands.autocomplete(abbreviation=available_abbreviation_autocomplete)
 async def register_team(interaction: discord.Interaction, team_name: str, abbreviation: str):
     """Register a team for the league"""
     teams = await get_teams_data()
@@ -310,7 +1272,8 @@ async def register_team(interaction: discord.Interaction, team_name: str, abbrev
         return
     
     # Check if abbreviation is already taken
-    if any(team['abbreviation'].upper() == abbreviation.upper() for team in teams.values()):
+    index = await get_team_index()
+    if index.owner_by_abbr(abbreviation):
         await interaction.response.send_message(
             f"❌ The abbreviation **{abbreviation.upper()}** is already taken!",
             ephemeral=True
@@ -347,6 +1310,14 @@ async def register_team(interaction: discord.Interaction, team_name: str, abbrev
         }
         save_json(STANDINGS_FILE, standings)
     
+    index_team_added(user_id, {
+        "name": team_name,
+        "abbreviation": abbreviation.upper(),
+        "owner": interaction.user.name,
+        "owner_id": user_id
+    })
+    bump_league_version()
+    
     embed = discord.Embed(
         title="🏈 Team Registered!",
         description=f"**{team_name}** ({abbreviation.upper()}) has joined the league!",
@@ -358,7 +1329,7 @@ async def register_team(interaction: discord.Interaction, team_name: str, abbrev
     await interaction.response.send_message(embed=embed)
     
     # Update the teams roster in #team-owners channel
-    await update_teams_list(interaction.guild)
+    await queue_side_effect('teams_list')
 
 @bot.tree.command(name="reassign_team", description="Reassign a team to a different user (Admin only)")
 @is_admin()
@@ -431,6 +1402,15 @@ async def reassign_team(interaction: discord.Interaction, current_owner: discord
         save_json(TEAMS_FILE, teams)
         save_json(STANDINGS_FILE, standings)
     
+    index_team_removed(current_user_id)
+    index_team_added(new_user_id, {
+        "name": team_name,
+        "abbreviation": team_abbr,
+        "owner": new_owner.name,
+        "owner_id": new_user_id
+    })
+    bump_league_version()
+    
     # Send confirmation
     embed = discord.Embed(
         title="🔄 Team Reassigned!",
@@ -443,23 +1423,20 @@ async def reassign_team(interaction: discord.Interaction, current_owner: discord
     await interaction.response.send_message(embed=embed)
     
     # Update the teams roster
-    await update_teams_list(interaction.guild)
+    await queue_side_effect('teams_list')
 
 @bot.tree.command(name="remove_team_by_abbr", description="Remove a team by abbreviation (Admin only)")
 @is_admin()
 @app_commands.describe(abbreviation="Team abbreviation (e.g., KC, BUF)")
+@app_commands.autocomplete(abbreviation=team_abbreviation_autocomplete)
 async def remove_team_by_abbr(interaction: discord.Interaction, abbreviation: str):
     """Remove a team from the league by abbreviation"""
     teams = await get_teams_data()
     
     # Find team by abbreviation
-    team_user_id = None
     abbr_upper = abbreviation.upper()
-    
-    for user_id, team in teams.items():
-        if team['abbreviation'].upper() == abbr_upper:
-            team_user_id = user_id
-            break
+    index = await get_team_index()
+    team_user_id = index.owner_by_abbr(abbr_upper)
     
     if not team_user_id:
         await interaction.response.send_message(
@@ -484,8 +1461,11 @@ async def remove_team_by_abbr(interaction: discord.Interaction, abbreviation: st
         save_json(TEAMS_FILE, teams)
         save_json(STANDINGS_FILE, standings)
     
+    index_team_removed(team_user_id)
+    bump_league_version()
+    
     # Send confirmation
-    member = interaction.guild.get_member(int(team_user_id))
+    member = await resolve_member(interaction.guild, team_user_id)
     owner_display = member.mention if member else f"User ID: {team_user_id}"
     
     embed = discord.Embed(
@@ -499,7 +1479,7 @@ async def remove_team_by_abbr(interaction: discord.Interaction, abbreviation: st
     await interaction.response.send_message(embed=embed)
     
     # Update the teams roster
-    await update_teams_list(interaction.guild)
+    await queue_side_effect('teams_list')
 
 @bot.tree.command(name="remove_team", description="Remove a team from the league (Admin only)")
 @is_admin()
@@ -540,6 +1520,9 @@ async def remove_team(interaction: discord.Interaction, user: discord.Member):
         save_json(TEAMS_FILE, teams)
         save_json(STANDINGS_FILE, standings)
     
+    index_team_removed(user_id)
+    bump_league_version()
+    
     # Send confirmation
     embed = discord.Embed(
         title="🗑️ Team Removed!",
@@ -552,7 +1535,7 @@ async def remove_team(interaction: discord.Interaction, user: discord.Member):
     await interaction.response.send_message(embed=embed)
     
     # Update the teams roster
-    await update_teams_list(interaction.guild)
+    await queue_side_effect('teams_list')
 
 @bot.tree.command(name="assign_team", description="Assign a team to a user (Admin only)")
 @is_admin()
@@ -561,6 +1544,7 @@ async def remove_team(interaction: discord.Interaction, user: discord.Member):
     team_name="Team name (e.g., Kansas City Chiefs)",
     abbreviation="3-letter team abbreviation (e.g., KC)"
 )
+@app_commands.autocomplete(abbreviation=available_abbreviation_autocomplete)
 async def assign_team(interaction: discord.Interaction, user: discord.Member, team_name: str, abbreviation: str):
     """Admin command to assign a team to any user"""
     teams = await get_teams_data()
@@ -586,13 +1570,13 @@ async def assign_team(interaction: discord.Interaction, user: discord.Member, te
         )
         return
     
-    for team in teams.values():
-        if team['abbreviation'].upper() == abbreviation.upper():
-            await interaction.response.send_message(
-                f"❌ Abbreviation **{abbreviation.upper()}** is already taken!",
-                ephemeral=True
-            )
-            return
+    index = await get_team_index()
+    if index.owner_by_abbr(abbreviation):
+        await interaction.response.send_message(
+            f"❌ Abbreviation **{abbreviation.upper()}** is already taken!",
+            ephemeral=True
+        )
+        return
     
     # Register the team
     if db.pool:
@@ -623,6 +1607,14 @@ async def assign_team(interaction: discord.Interaction, user: discord.Member, te
         }
         save_json(STANDINGS_FILE, standings)
     
+    index_team_added(user_id, {
+        "name": team_name,
+        "abbreviation": abbreviation.upper(),
+        "owner": user.name,
+        "owner_id": user_id
+    })
+    bump_league_version()
+    
     embed = discord.Embed(
         title="🏈 Team Assigned!",
         description=f"**{team_name}** ({abbreviation.upper()}) has been assigned!",
@@ -635,34 +1627,19 @@ async def assign_team(interaction: discord.Interaction, user: discord.Member, te
     await interaction.response.send_message(embed=embed)
     
     # Update the teams roster in #team-owners channel
-    await update_teams_list(interaction.guild)
+    await queue_side_effect('teams_list')
 
 @bot.tree.command(name="teams", description="View all registered teams")
 async def teams_command(interaction: discord.Interaction):
     """Display all registered teams"""
     try:
-        teams_data = await get_teams_data()
-        
-        if not teams_data:
-            await interaction.response.send_message("❌ No teams registered yet!", ephemeral=True)
-            return
-        
-        embed = discord.Embed(
-            title="🏈 Registered Teams",
-            color=discord.Color.blue()
+        await send_paginated(
+            interaction,
+            'teams',
+            lambda: build_teams_source(interaction.guild),
+            build_teams_page,
+            TEAMS_PER_PAGE
         )
-        
-        for user_id, team in teams_data.items():
-            member = interaction.guild.get_member(int(user_id))
-            owner_mention = member.mention if member else team.get('owner', 'Unknown')
-            embed.add_field(
-                name=f"{team['abbreviation']} - {team['name']}",
-                value=f"Owner: {owner_mention}",
-                inline=False
-            )
-        
-        embed.set_footer(text=f"Total Teams: {len(teams_data)}")
-        await interaction.response.send_message(embed=embed)
     except Exception as e:
         print(f"Error in teams command: {e}")
         import traceback
@@ -705,65 +1682,510 @@ async def my_team(interaction: discord.Interaction):
 @bot.tree.command(name="standings", description="View league standings")
 async def standings(interaction: discord.Interaction):
     """Display league standings"""
-    teams = await get_teams_data()
-    standings = await get_standings_data()
-    
-    if not teams:
-        await interaction.response.send_message("❌ No teams registered yet!", ephemeral=True)
-        return
-    
-    # Sort teams by wins, then point differential
-    sorted_teams = sorted(
-        standings.items(),
-        key=lambda x: (x[1]['wins'], x[1]['points_for'] - x[1]['points_against']),
-        reverse=True
+    await send_paginated(
+        interaction, 'standings', build_standings_source, build_standings_page, TABLE_ROWS_PER_PAGE
     )
-    
-    embed = discord.Embed(
-        title="🏆 League Standings",
-        color=discord.Color.purple()
+
+# ==================== DIVISION STANDINGS ====================
+
+NFL_TEAM_DIVISIONS = {team: division for division, division_teams in NFL_TEAMS.items() for team in division_teams}
+NFL_TEAMS_BY_ABBR = {abbr: team for team, abbr in TEAM_ABBREVIATIONS.items()}
+CONFERENCES = ["AFC", "NFC"]
+
+DIVISION_COLUMNS = [('Team', 7), ('W-L', 7), ('Div', 6), ('Conf', 7), ('Diff', 6)]
+# Table rows per embed field (each row is 34 characters of the 1024 a field holds)
+DIVISION_ROWS_PER_FIELD = 20
+DIVISION_TIEBREAKER_RULES = (
+    "1️⃣ Best Record\n2️⃣ Head-to-Head Result\n3️⃣ Division Record\n"
+    "4️⃣ Conference Record\n5️⃣ Point Differential"
+)
+
+def nfl_team_for(team):
+    """Get the NFL team a registered team plays as, by abbreviation first and then by name"""
+    nfl_team = NFL_TEAMS_BY_ABBR.get(team['abbreviation'].upper())
+    if nfl_team:
+        return nfl_team
+    mask = nfl_claim_mask(team['name'], team['abbreviation'])
+    for candidate in NFL_TEAM_ORDER:
+        if mask & NFL_TEAM_BITS[candidate]:
+            return candidate
+    return None
+
+def conference_of(division):
+    """Get the conference of a division ("AFC East" -> "AFC")"""
+    return division.split()[0]
+
+class DivisionIndex:
+    """Team alignment and division/conference records.
+
+    Each registered team is mapped to its division once, and ``members``
+    keeps the teams grouped by division so rendering never has to regroup.
+    Division and conference win-loss splits are updated per recorded game.
+    """
+
+    def __init__(self):
+        self.division_of = {}
+        self.members = {division: [] for division in NFL_TEAMS}
+        self.splits = {}
+
+    def add_team(self, user_id, team):
+        """Align a registered team to its division"""
+        nfl_team = nfl_team_for(team)
+        if nfl_team is None:
+            return
+        division = NFL_TEAM_DIVISIONS[nfl_team]
+        self.division_of[user_id] = division
+        self.members[division].append(user_id)
+
+    def split(self, team_id):
+        """Get a team's {'division': [w, l], 'conference': [w, l]} record"""
+        return self.splits.get(team_id) or {'division': [0, 0], 'conference': [0, 0]}
+
+    def add_game(self, game):
+        """Apply one game to the division and conference records"""
+        winner_division = self.division_of.get(game['winner_id'])
+        loser_division = self.division_of.get(game['loser_id'])
+        if winner_division is None or loser_division is None:
+            return
+
+        if winner_division == loser_division:
+            groups = ('division', 'conference')
+        elif conference_of(winner_division) == conference_of(loser_division):
+            groups = ('conference',)
+        else:
+            return
+
+        for team_id, column in ((game['winner_id'], 0), (game['loser_id'], 1)):
+            record = self.splits.setdefault(team_id, {'division': [0, 0], 'conference': [0, 0]})
+            for group in groups:
+                record[group][column] += 1
+
+    def conference_members(self, conference):
+        """Get the aligned teams of a conference"""
+        return [
+            user_id
+            for division, members in self.members.items() if conference_of(division) == conference
+            for user_id in members
+        ]
+
+    @classmethod
+    def build(cls, teams, games):
+        """Build the index from the registered teams and the game log"""
+        index = cls()
+        for user_id, team in teams.items():
+            index.add_team(user_id, team)
+        for game in games:
+            if game.get('winner_id') and game.get('loser_id'):
+                index.add_game(game)
+        return index
+
+async def get_division_index():
+    """Get the division index, building it from storage on first use"""
+    cache = league_cache()
+    if cache.division_index is None:
+        teams, games = await asyncio.gather(get_teams_data(), get_games_data())
+        cache.division_index = DivisionIndex.build(teams, games)
+    return cache.division_index
+
+def invalidate_division_index():
+    """Drop the division alignment after the registered teams change"""
+    league_cache().division_index = None
+
+def sort_group(team_ids, teams, standings, divisions, head_to_head):
+    """Sort a division or conference with the division tiebreakers"""
+    rows = []
+    for user_id in team_ids:
+        record = standings.get(user_id) or {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0}
+        rows.append({
+            'user_id': user_id,
+            'abbreviation': teams[user_id]['abbreviation'],
+            'wins': record['wins'],
+            'losses': record['losses'],
+            'point_diff': record['points_for'] - record['points_against'],
+            **divisions.split(user_id)
+        })
+
+    def compare_teams(team1, team2):
+        if team1['wins'] != team2['wins']:
+            return team2['wins'] - team1['wins']
+
+        team1_h2h_wins = head_to_head.wins(team1['user_id'], team2['user_id'])
+        team2_h2h_wins = head_to_head.wins(team2['user_id'], team1['user_id'])
+        if team1_h2h_wins != team2_h2h_wins:
+            return team2_h2h_wins - team1_h2h_wins
+
+        if team1['division'][0] != team2['division'][0]:
+            return team2['division'][0] - team1['division'][0]
+
+        if team1['conference'][0] != team2['conference'][0]:
+            return team2['conference'][0] - team1['conference'][0]
+
+        return team2['point_diff'] - team1['point_diff']
+
+    from functools import cmp_to_key
+    rows.sort(key=cmp_to_key(compare_teams))
+    return rows
+
+def division_table_rows(rows):
+    """Convert sorted division rows into table rows"""
+    return [
+        (
+            row['abbreviation'],
+            f"{row['wins']}-{row['losses']}",
+            f"{row['division'][0]}-{row['division'][1]}",
+            f"{row['conference'][0]}-{row['conference'][1]}",
+            f"{row['point_diff']:+d}"
+        )
+        for row in rows
+    ]
+
+async def build_division_standings(grouping):
+    """Build the division or conference standings embed"""
+    teams, standings, head_to_head_data, config = await get_league_snapshot_data(
+        include_head_to_head=league_cache().head_to_head_index is None
     )
-    
-    description = "```\n"
-    description += f"{'Rank':<6}{'Team':<20}{'W-L':<8}{'PF':<6}{'PA':<6}{'Diff':<6}\n"
-    description += "-" * 52 + "\n"
-    
-    for rank, (user_id, record) in enumerate(sorted_teams, 1):
-        if user_id not in teams:
+    head_to_head = await get_head_to_head_index(head_to_head_data)
+    divisions = await get_division_index()
+
+    if not teams:
+        return "❌ No teams registered yet!"
+
+    if grouping == "conference":
+        groups = {conference: divisions.conference_members(conference) for conference in CONFERENCES}
+    else:
+        groups = divisions.members
+
+    embed = discord.Embed(
+        title="🏆 Conference Standings" if grouping == "conference" else "🏆 Division Standings",
+        color=discord.Color.purple()
+    )
+    for name, team_ids in groups.items():
+        team_ids = [user_id for user_id in team_ids if user_id in teams]
+        if not team_ids:
             continue
-        team = teams[user_id]
-        team_name = f"{team['abbreviation']}"
-        w_l = f"{record['wins']}-{record['losses']}"
-        pf = record['points_for']
-        pa = record['points_against']
-        diff = pf - pa
-        
-        description += f"{rank:<6}{team_name:<20}{w_l:<8}{pf:<6}{pa:<6}{diff:+<6}\n"
-    
-    description += "```"
-    embed.description = description
-    
-    config = load_json(CONFIG_FILE)
-    embed.set_footer(text=f"Season {config.get('season', 1)} - Week {config.get('week', 1)}")
-    
+        rows = division_table_rows(sort_group(team_ids, teams, standings, divisions, head_to_head))
+        # A large conference is split over several fields to stay under Discord's 1024-character field limit
+        for i in range(0, len(rows), DIVISION_ROWS_PER_FIELD):
+            chunk = rows[i:i + DIVISION_ROWS_PER_FIELD]
+            label = f"{name} ({i + 1}-{i + len(chunk)})" if len(rows) > DIVISION_ROWS_PER_FIELD else name
+            embed.add_field(name=label, value=render_table(DIVISION_COLUMNS, chunk), inline=False)
+
+    if not embed.fields:
+        return "❌ No registered teams are aligned to an NFL division yet!"
+
+    embed.add_field(name="📊 Tiebreaker Rules", value=DIVISION_TIEBREAKER_RULES, inline=False)
+
+    footer = f"Season {config.get('season', 1)} - Week {config.get('week', 1)}"
+    unaligned = len(teams) - len([user_id for user_id in divisions.division_of if user_id in teams])
+    if unaligned:
+        footer += f" | {unaligned} team(s) not aligned to a division"
+    embed.set_footer(text=footer)
+    return embed
+
+@bot.tree.command(name="division_standings", description="View standings grouped by division or conference")
+@app_commands.describe(grouping="Group by division or conference (default: division)")
+@app_commands.choices(grouping=[
+    app_commands.Choice(name="Division", value="division"),
+    app_commands.Choice(name="Conference", value="conference")
+])
+async def division_standings(interaction: discord.Interaction, grouping: Optional[str] = "division"):
+    """Display division or conference standings"""
+    embed = await get_rendered_view(
+        interaction.guild, ('division_standings', grouping), lambda: build_division_standings(grouping)
+    )
+
+    if isinstance(embed, str):
+        await interaction.response.send_message(embed, ephemeral=True)
+        return
+
+    await interaction.response.send_message(embed=embed)
+
+# ==================== HEAD-TO-HEAD INDEX ====================
+
+class HeadToHeadIndex:
+    """Head-to-head records between every pair of teams.
+
+    Teams are mapped to a small integer index once, and ``records[i][j]`` holds
+    ``[wins, losses, points_for, points_against]`` for team i against team j.
+    Both directions are updated in place for every recorded game.
+    """
+
+    def __init__(self):
+        self.team_index = {}
+        self.records = []
+
+    def _index_of(self, user_id):
+        i = self.team_index.get(user_id)
+        if i is None:
+            i = len(self.records)
+            self.team_index[user_id] = i
+            self.records.append({})
+        return i
+
+    def record_game(self, winner_id, loser_id, winner_score, loser_score):
+        """Apply one game result to both directions of the pair"""
+        w = self._index_of(winner_id)
+        l = self._index_of(loser_id)
+
+        winner_record = self.records[w].setdefault(l, [0, 0, 0, 0])
+        winner_record[0] += 1
+        winner_record[2] += winner_score
+        winner_record[3] += loser_score
+
+        loser_record = self.records[l].setdefault(w, [0, 0, 0, 0])
+        loser_record[1] += 1
+        loser_record[2] += loser_score
+        loser_record[3] += winner_score
+
+    def get(self, team_id, opponent_id):
+        """Get (wins, losses, points_for, points_against) of a team against an opponent"""
+        i = self.team_index.get(team_id)
+        j = self.team_index.get(opponent_id)
+        if i is None or j is None:
+            return (0, 0, 0, 0)
+        return tuple(self.records[i].get(j, (0, 0, 0, 0)))
+
+    def wins(self, team_id, opponent_id):
+        """Get how many times a team has beaten an opponent"""
+        i = self.team_index.get(team_id)
+        j = self.team_index.get(opponent_id)
+        if i is None or j is None:
+            return 0
+        record = self.records[i].get(j)
+        return record[0] if record else 0
+
+    @classmethod
+    def build(cls, games, head_to_head_data):
+        """Build the index from the game log and the legacy head-to-head store"""
+        index = cls()
+        for game in games:
+            if game.get('winner_id') and game.get('loser_id'):
+                index.record_game(
+                    game['winner_id'],
+                    game['loser_id'],
+                    game.get('winner_score') or 0,
+                    game.get('loser_score') or 0
+                )
+
+        # Head-to-head rows recorded before the game log existed carry wins only
+        for key, data in head_to_head_data.items():
+            parts = key.split('_')
+            if len(parts) != 2:
+                continue
+            winner_id, loser_id = parts
+            for _ in range(data.get('wins', 0) - index.wins(winner_id, loser_id)):
+                index.record_game(winner_id, loser_id, 0, 0)
+
+        return index
+
+async def get_head_to_head_index(head_to_head_data=None):
+    """Get the head-to-head index, building it from storage on first use.
+
+    Callers that already fetched the head-to-head rows can pass them in to
+    skip loading them again.
+    """
+    cache = league_cache()
+    if cache.head_to_head_index is None:
+        if head_to_head_data is None:
+            games, head_to_head_data = await asyncio.gather(get_games_data(), get_head_to_head_data())
+        else:
+            games = await get_games_data()
+        cache.head_to_head_index = HeadToHeadIndex.build(games, head_to_head_data)
+    return cache.head_to_head_index
+
+@bot.tree.command(name="head_to_head", description="View the head-to-head rivalry between two teams")
+@app_commands.describe(
+    team1="First team's owner",
+    team2="Second team's owner"
+)
+async def head_to_head(interaction: discord.Interaction, team1: discord.Member, team2: discord.Member):
+    """Display the head-to-head record between two teams"""
+    if team1.id == team2.id:
+        await interaction.response.send_message("❌ Pick two different teams!", ephemeral=True)
+        return
+
+    index = await get_head_to_head_index()
+    wins, losses, points_for, points_against = index.get(str(team1.id), str(team2.id))
+    games_played = wins + losses
+
+    if not games_played:
+        await interaction.response.send_message(
+            f"❌ {team1.mention} and {team2.mention} haven't played each other yet!",
+            ephemeral=True
+        )
+        return
+
+    embed = discord.Embed(
+        title="🆚 Head-to-Head",
+        description=f"{team1.mention} vs {team2.mention}",
+        color=discord.Color.orange()
+    )
+    embed.add_field(name="Series", value=f"{wins}-{losses}", inline=True)
+    embed.add_field(name="Points", value=f"{points_for} - {points_against}", inline=True)
+    embed.add_field(
+        name="Avg Margin",
+        value=f"{(points_for - points_against) / games_played:+.1f}",
+        inline=True
+    )
+    embed.set_footer(text=f"{games_played} game(s) played")
+
     await interaction.response.send_message(embed=embed)
 
 # ==================== GAME RESULTS ====================
 
+class DuplicateReportError(Exception):
+    """Raised when a matchup has already been reported for the week.
+
+    ``pending`` is the report as queued for commissioner confirmation.
+    """
+
+    def __init__(self, pending):
+        super().__init__(f"Week {pending['week']} matchup already reported")
+        self.pending = pending
+
+class GameNotSavedError(Exception):
+    """Raised when storage fails to record a game for a reason other than a duplicate"""
+
+class SeasonClosedError(Exception):
+    """Raised when a season was rolled over while one of its games was being reported"""
+
+# Guild ID -> lock held by writers that change several parts of a league at
+# once (game reports, take-backs, season rollover), so neither overwrites the
+# other's changes
+league_write_locks = {}
+
+def league_write_lock():
+    """Get the write lock of the league in scope"""
+    return league_write_locks.setdefault(db.league_id(), asyncio.Lock())
+
+def build_game_record(season, week, winner_id, loser_id, winner_score, loser_score, teams, home_id=None):
+    """Build the game log entry for a result"""
+    return {
+        "season": season,
+        "week": week,
+        "winner_id": winner_id,
+        "loser_id": loser_id,
+        "winner_team": teams[winner_id]['name'],
+        "winner_abbr": teams[winner_id]['abbreviation'],
+        "loser_team": teams[loser_id]['name'],
+        "loser_abbr": teams[loser_id]['abbreviation'],
+        "winner_score": winner_score,
+        "loser_score": loser_score,
+        "home_id": home_id,
+        "date": datetime.utcnow().isoformat()
+    }
+
+def apply_game_to_standings(game, standings):
+    """Add a game to both teams' records in the standings dict"""
+    winner_record = standings[game['winner_id']]
+    loser_record = standings[game['loser_id']]
+
+    winner_record['wins'] += 1
+    winner_record['points_for'] += game['winner_score']
+    winner_record['points_against'] += game['loser_score']
+
+    loser_record['losses'] += 1
+    loser_record['points_for'] += game['loser_score']
+    loser_record['points_against'] += game['winner_score']
+
+async def record_game_result(season, week, winner_id, loser_id, winner_score, loser_score, teams, standings,
+                             home_id=None, reported_by=None):
+    """Record a game in storage and apply it to the in-memory indexes.
+
+    ``standings`` is updated in place so callers can show the new records.
+    A matchup can only be recorded once per week: a second report is queued
+    for confirmation and raises DuplicateReportError without touching the
+    standings. Raises GameNotSavedError if the database fails to store it.
+    """
+    game_record = build_game_record(season, week, winner_id, loser_id, winner_score, loser_score, teams, home_id)
+
+    # Claiming the matchup before any await keeps two concurrent reports from both getting through
+    week_index = await get_week_status_index()
+    if not week_index.claim(season, week, winner_id, loser_id):
+        raise DuplicateReportError(await queue_pending_report(game_record, reported_by, "already reported"))
+
+    async with league_write_lock():
+        # A rollover that ran while this report waited has archived its season and reset the standings it was given
+        config = await get_config_data()
+        if config.get('season', 1) != season:
+            week_index.release(season, week, winner_id, loser_id)
+            raise SeasonClosedError(f"Season {season} was closed before this game could be recorded")
+
+        if db.pool:
+            # The game, both standings and the head-to-head win are written together;
+            # the matchup unique index rejects duplicates from other instances
+            new_standings = {team_id: dict(standings[team_id]) for team_id in (winner_id, loser_id)}
+            apply_game_to_standings(game_record, new_standings)
+            try:
+                created = await db.record_game(game_record, new_standings[winner_id], new_standings[loser_id])
+            except db.DuplicateGame:
+                # Another instance recorded the matchup first, so the claim stands
+                raise DuplicateReportError(await queue_pending_report(game_record, reported_by, "already reported"))
+            if not created:
+                week_index.release(season, week, winner_id, loser_id)
+                raise GameNotSavedError("The game couldn't be saved to the database")
+            standings.update(new_standings)
+        else:
+            # Use JSON files
+            apply_game_to_standings(game_record, standings)
+            save_json(STANDINGS_FILE, standings)
+
+            # Record game
+            games = load_json(GAMES_FILE, [])
+            game_record["id"] = next_game_id(games)
+            games.append(game_record)
+            save_json(GAMES_FILE, games)
+
+            # Update head-to-head record
+            head_to_head_data = load_json(HEAD_TO_HEAD_FILE)
+            h2h_key = f"{winner_id}_{loser_id}"
+            if h2h_key not in head_to_head_data:
+                head_to_head_data[h2h_key] = {"wins": 0}
+            head_to_head_data[h2h_key]["wins"] += 1
+            save_json(HEAD_TO_HEAD_FILE, head_to_head_data)
+
+    apply_game_to_indexes(game_record)
+    bump_league_version()
+    return game_record
+
+def apply_game_to_indexes(game):
+    """Keep the league's in-memory indexes current (they are built lazily if not loaded yet)"""
+    cache = league_cache()
+    if cache.head_to_head_index is not None:
+        cache.head_to_head_index.record_game(
+            game['winner_id'], game['loser_id'], game['winner_score'], game['loser_score']
+        )
+    if cache.team_game_index is not None:
+        cache.team_game_index.add_game(game)
+    if cache.league_stats is not None:
+        cache.league_stats.add_game(game)
+    if cache.division_index is not None:
+        cache.division_index.add_game(game)
+    if cache.week_status_index is not None:
+        cache.week_status_index.add_game(game)
+    if cache.all_time_index is not None:
+        cache.all_time_index.add_game(game)
+
 @bot.tree.command(name="report_game", description="Report a game result (Admin only)")
 @is_admin()
 @app_commands.describe(
     winner="The winning team's owner",
     loser="The losing team's owner",
     winner_score="Winner's score",
-    loser_score="Loser's score"
+    loser_score="Loser's score",
+    home_team="Which team was at home (optional)"
 )
+@app_commands.choices(home_team=[
+    app_commands.Choice(name="Winner", value="winner"),
+    app_commands.Choice(name="Loser", value="loser")
+])
 async def report_game(
     interaction: discord.Interaction,
     winner: discord.Member,
     loser: discord.Member,
     winner_score: int,
-    loser_score: int
+    loser_score: int,
+    home_team: Optional[str] = None
 ):
     """Report a game result"""
     # Defer response to prevent timeout
@@ -781,67 +2203,11 @@ async def report_game(
             await interaction.followup.send("❌ One or both users don't have registered teams!", ephemeral=True)
             return
         
-        # Update standings
-        if db.pool:
-            # Use database
-            winner_record = standings[winner_id]
-            loser_record = standings[loser_id]
-            
-            await db.update_standing(
-                winner_id,
-                winner_record['wins'] + 1,
-                winner_record['losses'],
-                winner_record['points_for'] + winner_score,
-                winner_record['points_against'] + loser_score
-            )
-            
-            await db.update_standing(
-                loser_id,
-                loser_record['wins'],
-                loser_record['losses'] + 1,
-                loser_record['points_for'] + loser_score,
-                loser_record['points_against'] + winner_score
-            )
-            
-            # Record game
-            await db.create_game(
-                config.get('week', 1),
-                winner_id,
-                loser_id,
-                teams[winner_id]['name'],
-                teams[winner_id]['abbreviation'],
-                teams[loser_id]['name'],
-                teams[loser_id]['abbreviation'],
-                winner_score,
-                loser_score
-            )
-            
-            # Update head-to-head
-            await db.update_head_to_head(winner_id, loser_id)
-        else:
-            # Use JSON files
-            standings[winner_id]['wins'] += 1
-            standings[winner_id]['points_for'] += winner_score
-            standings[winner_id]['points_against'] += loser_score
-            
-            standings[loser_id]['losses'] += 1
-            standings[loser_id]['points_for'] += loser_score
-            standings[loser_id]['points_against'] += winner_score
-            
-            save_json(STANDINGS_FILE, standings)
-            
-            # Add to schedule/results
-            schedule = load_json(SCHEDULE_FILE)
-            game_result = {
-                "week": config.get('week', 1),
-                "winner": teams[winner_id]['name'],
-                "loser": teams[loser_id]['name'],
-                "winner_score": winner_score,
-                "loser_score": loser_score,
-                "date": datetime.now().isoformat()
-            }
-            schedule['games'].append(game_result)
-            save_json(SCHEDULE_FILE, schedule)
+        home_id = {'winner': winner_id, 'loser': loser_id}.get(home_team)
+        await record_game_result(
+            config.get('season', 1), config.get('week', 1), winner_id, loser_id,
+            winner_score, loser_score, teams, standings, home_id, str(interaction.user.id)
+        )
         
         embed = discord.Embed(
             title="🏈 Game Result",
@@ -852,6 +2218,8 @@ async def report_game(
         embed.add_field(name="Week", value=str(config.get('week', 1)), inline=True)
         
         await interaction.followup.send(embed=embed)
+    except DuplicateReportError as e:
+        await interaction.followup.send(embed=await build_pending_report_embed(e.pending))
     except Exception as e:
         print(f"Error in report_game: {e}")
         import traceback
@@ -859,14 +2227,16 @@ async def report_game(
         await interaction.followup.send(f"❌ Error reporting game: {str(e)}", ephemeral=True)
 
 @bot.tree.command(name="recent_games", description="View recent game results")
-@app_commands.describe(count="Number of recent games to show (default: 5)")
+@app_commands.describe(count="Number of recent games to show (default: 5, max: 25)")
 async def recent_games(interaction: discord.Interaction, count: Optional[int] = 5):
     """Display recent game results"""
+    # One embed holds at most 25 fields
+    count = max(1, min(count, 25))
+    
     if db.pool:
         games = await db.get_recent_games(count)
     else:
-        schedule = load_json(SCHEDULE_FILE)
-        games = schedule.get('games', [])[-count:]
+        games = load_json(GAMES_FILE, [])[-count:]
         games.reverse()
     
     if not games:
@@ -879,26 +2249,216 @@ async def recent_games(interaction: discord.Interaction, count: Optional[int] =
     )
     
     for game in games:
-        # Handle both database and JSON formats
-        winner_name = game.get('winner_team') or game.get('winner')
-        loser_name = game.get('loser_team') or game.get('loser')
-        result = f"**{winner_name}** {game['winner_score']} - {game['loser_score']} **{loser_name}**"
         embed.add_field(
             name=f"Week {game['week']}",
-            value=result,
+            value=format_game_result(game),
             inline=False
         )
     
     await interaction.response.send_message(embed=embed)
 
+# ==================== GAME LOG ====================
+
+GAME_LOG_PAGE_SIZE = 10
+
+def next_game_id(games):
+    """Get the next id for a JSON game record (older records use their position)"""
+    return max((game.get('id', i + 1) for i, game in enumerate(games)), default=0) + 1
+
+def game_cursor(game):
+    """Get the (date, id) keyset position of a game"""
+    return (game['date'], game['id'])
+
+def page_json_games(games, limit, cursor=None, newer=False, week=None, team_id=None, season=None):
+    """Keyset-paginate the JSON game log over (date, id), newest first"""
+    matching = []
+    for i, game in enumerate(games):
+        game.setdefault('id', i + 1)
+        if week is not None and game.get('week') != week:
+            continue
+        if team_id is not None and team_id not in (game.get('winner_id'), game.get('loser_id')):
+            continue
+        if season is not None and game.get('season') != season:
+            continue
+        matching.append(game)
+    
+    matching.sort(key=game_cursor)
+    keys = [game_cursor(game) for game in matching]
+    
+    if newer:
+        start = bisect.bisect_right(keys, cursor) if cursor else 0
+        page = matching[start:start + limit]
+    else:
+        end = bisect.bisect_left(keys, cursor) if cursor else len(matching)
+        page = matching[max(0, end - limit):end]
+    page.reverse()
+    return page
+
+async def get_games_page(limit, cursor=None, newer=False, week=None, team_id=None, season=None):
+    """Get one page of games (newest first) from database or JSON"""
+    if db.pool:
+        return await db.get_games_page(limit, cursor, newer, week, team_id, season)
+    games = await asyncio.to_thread(load_json, GAMES_FILE, [])
+    return page_json_games(games, limit, cursor, newer, week, team_id, season)
+
+def format_game_result(game):
+    """Format a game as '**Winner** 24 - 17 **Loser**'"""
+    # Handle both database and JSON formats
+    winner_name = game.get('winner_team') or game.get('winner')
+    loser_name = game.get('loser_team') or game.get('loser')
+    return f"**{winner_name}** {game['winner_score']} - {game['loser_score']} **{loser_name}**"
+
+class GameLogView(discord.ui.View):
+    """Newer/older buttons over the game log, fetching one page per click"""
+
+    def __init__(self, filters, games, owner_id):
+        super().__init__(timeout=PAGINATION_TIMEOUT)
+        self.filters = filters
+        self.games = games
+        self.owner_id = owner_id
+        self.page = 0
+        self.has_older = len(games) == GAME_LOG_PAGE_SIZE
+        self.message = None
+        self.update_buttons()
+
+    def update_buttons(self):
+        self.newer_page.disabled = self.page == 0
+        self.older_page.disabled = not self.has_older
+
+    def build_embed(self):
+        embed = discord.Embed(
+            title="📜 Game Log",
+            color=discord.Color.blue()
+        )
+        for game in self.games:
+            season = f"Season {game['season']} · " if game.get('season') else ""
+            embed.add_field(
+                name=f"{season}Week {game['week']}",
+                value=format_game_result(game),
+                inline=False
+            )
+        
+        filters = [f"{name.replace('_', ' ').title()}: {value}" for name, value in self.filters['labels'].items()]
+        footer = " | ".join(filters + [f"Page {self.page + 1}"])
+        embed.set_footer(text=footer)
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message(
+                "❌ Only the person who ran this command can change pages. Run it yourself to browse!",
+                ephemeral=True
+            )
+            return False
+        use_league(interaction.guild_id)
+        return True
+
+    async def fetch(self, cursor, newer):
+        return await get_games_page(GAME_LOG_PAGE_SIZE, cursor, newer, **self.filters['query'])
+
+    @discord.ui.button(label="◀ Newer", style=discord.ButtonStyle.secondary)
+    async def newer_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        games = await self.fetch(game_cursor(self.games[0]), newer=True)
+        if games:
+            self.games = games
+            self.page -= 1
+            self.has_older = True
+        if len(games) < GAME_LOG_PAGE_SIZE:
+            # Reached the newest games; reload the first page so it is full
+            self.games = await self.fetch(None, newer=False)
+            self.page = 0
+            self.has_older = len(self.games) == GAME_LOG_PAGE_SIZE
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="Older ▶", style=discord.ButtonStyle.secondary)
+    async def older_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        games = await self.fetch(game_cursor(self.games[-1]), newer=False)
+        if games:
+            self.games = games
+            self.page += 1
+        self.has_older = len(games) == GAME_LOG_PAGE_SIZE
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+@bot.tree.command(name="game_log", description="Browse the full game history")
+@app_commands.describe(
+    week="Only show games from this week",
+    team="Only show games involving this team (abbreviation)",
+    season="Only show games from this season"
+)
+@app_commands.autocomplete(team=team_abbreviation_autocomplete)
+async def game_log(
+    interaction: discord.Interaction,
+    week: Optional[int] = None,
+    team: Optional[str] = None,
+    season: Optional[int] = None
+):
+    """Browse game history one page at a time"""
+    team_id = None
+    labels = {}
+    if week is not None:
+        labels['week'] = week
+    if team:
+        team_id = (await get_team_index()).owner_by_abbr(team)
+        if not team_id:
+            await interaction.response.send_message(
+                f"❌ No team found with abbreviation **{team.upper()}**!",
+                ephemeral=True
+            )
+            return
+        labels['team'] = team.upper()
+    if season is not None:
+        labels['season'] = season
+    
+    filters = {
+        'query': {'week': week, 'team_id': team_id, 'season': season},
+        'labels': labels
+    }
+    games = await get_games_page(GAME_LOG_PAGE_SIZE, **filters['query'])
+    
+    if not games:
+        await interaction.response.send_message("❌ No games found!", ephemeral=True)
+        return
+    
+    view = GameLogView(filters, games, interaction.user.id)
+    if not view.has_older:
+        await interaction.response.send_message(embed=view.build_embed())
+        return
+    
+    await interaction.response.send_message(embed=view.build_embed(), view=view)
+    view.message = await interaction.original_response()
+
 @bot.tree.command(name="report_my_game", description="Report your game result")
 @app_commands.describe(
     week="Week number",
     my_score="Your score",
     opponent_abbr="Opponent's team abbreviation (e.g., KC, BUF)",
-    opponent_score="Opponent's score"
+    opponent_score="Opponent's score",
+    location="Were you home or away? (optional)"
 )
-async def report_my_game(interaction: discord.Interaction, week: int, my_score: int, opponent_abbr: str, opponent_score: int):
+@app_commands.choices(location=[
+    app_commands.Choice(name="Home", value="home"),
+    app_commands.Choice(name="Away", value="away")
+])
+@app_commands.autocomplete(opponent_abbr=team_abbreviation_autocomplete)
+async def report_my_game(
+    interaction: discord.Interaction,
+    week: int,
+    my_score: int,
+    opponent_abbr: str,
+    opponent_score: int,
+    location: Optional[str] = None
+):
     """User reports their own game result"""
     # Defer response to prevent timeout
     await interaction.response.defer()
@@ -906,6 +2466,7 @@ async def report_my_game(interaction: discord.Interaction, week: int, my_score:
     try:
         teams = await get_teams_data()
         standings = await get_standings_data()
+        config = await get_config_data()
         
         user_id = str(interaction.user.id)
         
@@ -918,12 +2479,8 @@ async def report_my_game(interaction: discord.Interaction, week: int, my_score:
             return
         
         # Find opponent by abbreviation
-        opponent_id = None
         opponent_abbr_upper = opponent_abbr.upper()
-        for uid, team in teams.items():
-            if team['abbreviation'].upper() == opponent_abbr_upper:
-                opponent_id = uid
-                break
+        opponent_id = (await get_team_index()).owner_by_abbr(opponent_abbr_upper)
         
         if not opponent_id:
             await interaction.followup.send(
@@ -964,79 +2521,11 @@ async def report_my_game(interaction: discord.Interaction, week: int, my_score:
             )
             return
         
-        # Update standings
-        if db.pool:
-            # Use database
-            winner_record = standings[winner_id]
-            loser_record = standings[loser_id]
-            
-            await db.update_standing(
-                winner_id,
-                winner_record['wins'] + 1,
-                winner_record['losses'],
-                winner_record['points_for'] + winner_score,
-                winner_record['points_against'] + loser_score
-            )
-            
-            await db.update_standing(
-                loser_id,
-                loser_record['wins'],
-                loser_record['losses'] + 1,
-                loser_record['points_for'] + loser_score,
-                loser_record['points_against'] + winner_score
-            )
-            
-            # Record game
-            await db.create_game(
-                week,
-                winner_id,
-                loser_id,
-                teams[winner_id]['name'],
-                teams[winner_id]['abbreviation'],
-                teams[loser_id]['name'],
-                teams[loser_id]['abbreviation'],
-                winner_score,
-                loser_score
-            )
-            
-            # Update head-to-head
-            await db.update_head_to_head(winner_id, loser_id)
-        else:
-            # Use JSON files
-            standings[winner_id]['wins'] += 1
-            standings[winner_id]['points_for'] += winner_score
-            standings[winner_id]['points_against'] += loser_score
-            
-            standings[loser_id]['losses'] += 1
-            standings[loser_id]['points_for'] += loser_score
-            standings[loser_id]['points_against'] += winner_score
-            
-            save_json(STANDINGS_FILE, standings)
-            
-            # Record game
-            games = load_json(GAMES_FILE)
-            game_record = {
-                "week": week,
-                "winner_id": winner_id,
-                "loser_id": loser_id,
-                "winner_team": teams[winner_id]['name'],
-                "winner_abbr": teams[winner_id]['abbreviation'],
-                "loser_team": teams[loser_id]['name'],
-                "loser_abbr": teams[loser_id]['abbreviation'],
-                "winner_score": winner_score,
-                "loser_score": loser_score,
-                "date": datetime.utcnow().isoformat()
-            }
-            games.append(game_record)
-            save_json(GAMES_FILE, games)
-            
-            # Update head-to-head record
-            head_to_head = load_json(HEAD_TO_HEAD_FILE)
-            h2h_key = f"{winner_id}_{loser_id}"
-            if h2h_key not in head_to_head:
-                head_to_head[h2h_key] = {"wins": 0}
-            head_to_head[h2h_key]["wins"] += 1
-            save_json(HEAD_TO_HEAD_FILE, head_to_head)
+        home_id = {'home': user_id, 'away': opponent_id}.get(location)
+        await record_game_result(
+            config.get('season', 1), week, winner_id, loser_id, winner_score, loser_score, teams, standings,
+            home_id, user_id
+        )
         
         # Send confirmation
         embed = discord.Embed(
@@ -1051,33 +2540,724 @@ async def report_my_game(interaction: discord.Interaction, week: int, my_score:
         await interaction.followup.send(embed=embed)
         
         # Auto-update power rankings channel
-        await update_power_rankings_channel(interaction.guild)
+        await queue_side_effect('power_rankings')
+    except DuplicateReportError as e:
+        await interaction.followup.send(embed=await build_pending_report_embed(e.pending))
     except Exception as e:
         print(f"Error in report_my_game: {e}")
         import traceback
         traceback.print_exc()
         await interaction.followup.send(f"❌ Error reporting game: {str(e)}", ephemeral=True)
 
-# ==================== POWER RANKINGS ====================
+# ==================== REPORT CONFIRMATION ====================
 
-def calculate_power_rankings(teams_data, standings_data, head_to_head_data):
-    """Calculate power rankings with tiebreakers"""
-    rankings = []
-    
-    for user_id, team in teams_data.items():
-        if user_id not in standings_data:
-            continue
-        
-        record = standings_data[user_id]
-        
-        # Skip teams that have never played (0-0 with no points)
-        if (record['wins'] == 0 and record['losses'] == 0 and 
-            record['points_for'] == 0 and record['points_against'] == 0):
-            continue
-        
-        rankings.append({
-            'user_id': user_id,
-            'team_name': team['name'],
+def invalidate_game_indexes():
+    """Drop every index built from the game log so it is rebuilt on next use.
+
+    The indexes only support appending games, so anything that rewrites
+    history (taking a result back, a reset) rebuilds them instead.
+    """
+    cache = league_cache()
+    cache.head_to_head_index = None
+    cache.all_time_index = None
+    cache.team_game_index = None
+    cache.league_stats = None
+    cache.division_index = None
+    cache.week_status_index = None
+
+async def queue_pending_report(game, reported_by, reason):
+    """Hold a report for commissioner confirmation and return it with its id"""
+    report = {
+        "season": game['season'],
+        "week": game['week'],
+        "winner_id": game['winner_id'],
+        "loser_id": game['loser_id'],
+        "winner_score": game['winner_score'],
+        "loser_score": game['loser_score'],
+        "home_id": game.get('home_id'),
+        "reported_by": reported_by,
+        "reason": reason
+    }
+    if db.pool:
+        report['id'] = await db.create_pending_report(report)
+    else:
+        pending = load_json(PENDING_REPORTS_FILE, [])
+        report['id'] = max((entry['id'] for entry in pending), default=0) + 1
+        pending.append(report)
+        save_json(PENDING_REPORTS_FILE, pending)
+    return report
+
+async def get_pending_reports():
+    """Get queued reports from database or JSON, oldest first"""
+    if db.pool:
+        return await db.get_pending_reports()
+    return load_json(PENDING_REPORTS_FILE, [])
+
+async def delete_pending_report(report_id):
+    """Remove a queued report from database or JSON"""
+    if db.pool:
+        await db.delete_pending_report(report_id)
+    else:
+        pending = load_json(PENDING_REPORTS_FILE, [])
+        save_json(PENDING_REPORTS_FILE, [entry for entry in pending if entry['id'] != report_id])
+
+async def get_matchup_game(season, week, team1_id, team2_id):
+    """Get the recorded game between two teams in a week from database or JSON"""
+    if db.pool:
+        return await db.get_matchup_game(season, week, team1_id, team2_id)
+    pair = {team1_id, team2_id}
+    for i, game in enumerate(load_json(GAMES_FILE, [])):
+        if game.get('season') == season and game['week'] == week and {game['winner_id'], game['loser_id']} == pair:
+            return {**game, 'id': game.get('id', i + 1)}
+    return None
+
+async def reverse_game_result(game):
+    """Take a recorded game back out of the standings, game log and head-to-head records"""
+    standings = await get_standings_data()
+    winner_record = standings.get(game['winner_id'])
+    loser_record = standings.get(game['loser_id'])
+
+    if winner_record:
+        winner_record['wins'] = max(0, winner_record['wins'] - 1)
+        winner_record['points_for'] -= game['winner_score']
+        winner_record['points_against'] -= game['loser_score']
+    if loser_record:
+        loser_record['losses'] = max(0, loser_record['losses'] - 1)
+        loser_record['points_for'] -= game['loser_score']
+        loser_record['points_against'] -= game['winner_score']
+
+    if db.pool:
+        for user_id, record in ((game['winner_id'], winner_record), (game['loser_id'], loser_record)):
+            if record:
+                await db.update_standing(
+                    user_id, record['wins'], record['losses'], record['points_for'], record['points_against']
+                )
+        await db.delete_game(game['id'])
+        await db.undo_head_to_head(game['winner_id'], game['loser_id'])
+    else:
+        async with league_write_lock():
+            save_json(STANDINGS_FILE, standings)
+
+            games = load_json(GAMES_FILE, [])
+            save_json(GAMES_FILE, [g for i, g in enumerate(games) if g.get('id', i + 1) != game['id']])
+
+            head_to_head_data = load_json(HEAD_TO_HEAD_FILE)
+            h2h_key = f"{game['winner_id']}_{game['loser_id']}"
+            if h2h_key in head_to_head_data:
+                head_to_head_data[h2h_key]["wins"] = max(0, head_to_head_data[h2h_key]["wins"] - 1)
+            save_json(HEAD_TO_HEAD_FILE, head_to_head_data)
+
+    invalidate_game_indexes()
+    bump_league_version()
+
+def format_pending_report(report, teams_index):
+    """Format a queued report line"""
+    def abbr(user_id):
+        team = teams_index.teams.get(user_id)
+        return team['abbreviation'] if team else "???"
+
+    return (
+        f"**#{report['id']}** Week {report['week']}: {abbr(report['winner_id'])} {report['winner_score']} - "
+        f"{report['loser_score']} {abbr(report['loser_id'])} ({report['reason']})"
+    )
+
+async def build_pending_report_embed(report):
+    """Build the reply for a report that was held for confirmation"""
+    embed = discord.Embed(
+        title="⚠️ Report Held for Confirmation",
+        description=(
+            "This matchup already has a result for the week, so the standings were not changed.\n"
+            "A commissioner will review it with `/resolve_report`."
+        ),
+        color=discord.Color.orange()
+    )
+    embed.add_field(name="Report", value=format_pending_report(report, await get_team_index()), inline=False)
+    return embed
+
+@bot.tree.command(name="pending_reports", description="View reports waiting for confirmation (Admin only)")
+@is_admin()
+async def pending_reports(interaction: discord.Interaction):
+    """List duplicate or conflicting reports held for confirmation"""
+    pending = await get_pending_reports()
+
+    if not pending:
+        await interaction.response.send_message("✅ No reports waiting for confirmation!", ephemeral=True)
+        return
+
+    teams_index = await get_team_index()
+    lines = [format_pending_report(report, teams_index) for report in pending[:WEEK_STATUS_MAX_LINES]]
+    if len(pending) > WEEK_STATUS_MAX_LINES:
+        lines.append(f"... and {len(pending) - WEEK_STATUS_MAX_LINES} more")
+
+    embed = discord.Embed(
+        title="⚠️ Pending Reports",
+        description="\n".join(lines),
+        color=discord.Color.orange()
+    )
+    embed.set_footer(text="Use /resolve_report to keep the recorded result or replace it")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@bot.tree.command(name="resolve_report", description="Resolve a report waiting for confirmation (Admin only)")
+@is_admin()
+@app_commands.describe(
+    report_id="Pending report number",
+    action="Keep the recorded result or replace it with this report"
+)
+@app_commands.choices(action=[
+    app_commands.Choice(name="Keep recorded result (discard report)", value="dismiss"),
+    app_commands.Choice(name="Replace recorded result with report", value="replace")
+])
+async def resolve_report(interaction: discord.Interaction, report_id: int, action: str):
+    """Discard a held report, or swap it in for the recorded result"""
+    report = next((entry for entry in await get_pending_reports() if entry['id'] == report_id), None)
+
+    if report is None:
+        await interaction.response.send_message(f"❌ No pending report **#{report_id}**!", ephemeral=True)
+        return
+
+    if action == "dismiss":
+        await delete_pending_report(report_id)
+        await interaction.response.send_message(f"🗑️ Discarded report **#{report_id}**.", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    teams = await get_teams_data()
+    if report['winner_id'] not in teams or report['loser_id'] not in teams:
+        await interaction.followup.send("❌ One or both teams are no longer registered!", ephemeral=True)
+        return
+
+    existing = await get_matchup_game(report['season'], report['week'], report['winner_id'], report['loser_id'])
+    if existing:
+        await reverse_game_result(existing)
+
+    try:
+        await record_game_result(
+            report['season'], report['week'], report['winner_id'], report['loser_id'],
+            report['winner_score'], report['loser_score'], teams, await get_standings_data(),
+            report['home_id'], report['reported_by']
+        )
+    except DuplicateReportError as e:
+        await delete_pending_report(report_id)
+        await interaction.followup.send(
+            f"❌ The recorded result couldn't be replaced; the report was queued again as **#{e.pending['id']}**.",
+            ephemeral=True
+        )
+        return
+    except (GameNotSavedError, SeasonClosedError) as e:
+        await interaction.followup.send(f"❌ {e}; the report was kept.", ephemeral=True)
+        return
+
+    await delete_pending_report(report_id)
+    await interaction.followup.send(f"✅ Report **#{report_id}** is now the recorded result.", ephemeral=True)
+    await queue_side_effect('power_rankings')
+
+# ==================== BULK IMPORT ====================
+
+IMPORT_MAX_ROWS = 1000
+IMPORT_MAX_ERRORS = 10
+IMPORT_COLUMNS = ['week', 'winner', 'loser', 'winner_score', 'loser_score']
+
+def parse_results_file(filename, text):
+    """Parse a CSV or JSON results file into a list of row dicts with lowercase keys"""
+    if filename.lower().endswith('.json'):
+        rows = json.loads(text)
+        if isinstance(rows, dict):
+            rows = rows.get('games', [])
+    else:
+        rows = list(csv.DictReader(io.StringIO(text)))
+    return [
+        {str(key).strip().lower(): value.strip() if isinstance(value, str) else value for key, value in row.items()}
+        for row in rows
+    ]
+
+def validate_results(rows, teams_index, week_index, season):
+    """Validate a whole batch against the team index and already-reported matchups.
+
+    Returns (results, errors); each result is (week, winner_id, loser_id,
+    winner_score, loser_score, home_id). Row numbers in errors are 1-based.
+    """
+    results = []
+    errors = []
+    batch_pairs = set()
+
+    for number, row in enumerate(rows, 1):
+        missing = [column for column in IMPORT_COLUMNS if row.get(column) in (None, "")]
+        if missing:
+            errors.append(f"Row {number}: missing {', '.join(missing)}")
+            continue
+
+        try:
+            week = int(row['week'])
+            winner_score = int(row['winner_score'])
+            loser_score = int(row['loser_score'])
+        except (TypeError, ValueError):
+            errors.append(f"Row {number}: week and scores must be whole numbers")
+            continue
+
+        winner_id = teams_index.owner_by_abbr(str(row['winner']))
+        loser_id = teams_index.owner_by_abbr(str(row['loser']))
+        home = row.get('home')
+        home_id = teams_index.owner_by_abbr(str(home)) if home else None
+
+        if not winner_id or not loser_id:
+            errors.append(f"Row {number}: unknown team {row['winner'] if not winner_id else row['loser']}")
+        elif winner_id == loser_id:
+            errors.append(f"Row {number}: a team can't play itself")
+        elif winner_score <= loser_score:
+            errors.append(f"Row {number}: winner's score must be higher than loser's score")
+        elif week < 1:
+            errors.append(f"Row {number}: week must be 1 or later")
+        elif home and home_id not in (winner_id, loser_id):
+            errors.append(f"Row {number}: home team {home} didn't play in this game")
+        else:
+            key = (week, frozenset((winner_id, loser_id)))
+            if key in batch_pairs:
+                errors.append(f"Row {number}: matchup appears twice for week {week}")
+            elif key[1] in week_index.reported.get((season, week), ()):
+                errors.append(f"Row {number}: week {week} {row['winner']} vs {row['loser']} is already reported")
+            else:
+                batch_pairs.add(key)
+                results.append((week, winner_id, loser_id, winner_score, loser_score, home_id))
+
+    return results, errors
+
+async def import_game_results(season, results, teams, standings):
+    """Record a validated batch with one storage write per table.
+
+    Returns the game records, or None if the database rejected the batch
+    (nothing is applied in that case).
+    """
+    week_index = await get_week_status_index()
+    claimed = []
+    for week, winner_id, loser_id, *_ in results:
+        if not week_index.claim(season, week, winner_id, loser_id):
+            for pair in claimed:
+                week_index.release(season, *pair)
+            return None
+        claimed.append((week, winner_id, loser_id))
+
+    games = [
+        build_game_record(season, week, winner_id, loser_id, winner_score, loser_score, teams, home_id)
+        for week, winner_id, loser_id, winner_score, loser_score, home_id in results
+    ]
+
+    head_to_head_wins = {}
+    changed = {}
+    for game in games:
+        apply_game_to_standings(game, standings)
+        key = (game['winner_id'], game['loser_id'])
+        head_to_head_wins[key] = head_to_head_wins.get(key, 0) + 1
+        changed[game['winner_id']] = standings[game['winner_id']]
+        changed[game['loser_id']] = standings[game['loser_id']]
+
+    if db.pool:
+        if not await db.import_game_results(games, changed, head_to_head_wins):
+            for pair in claimed:
+                week_index.release(season, *pair)
+            return None
+    else:
+        save_json(STANDINGS_FILE, standings)
+
+        game_log = load_json(GAMES_FILE, [])
+        next_id = next_game_id(game_log)
+        for offset, game in enumerate(games):
+            game['id'] = next_id + offset
+        game_log.extend(games)
+        save_json(GAMES_FILE, game_log)
+
+        head_to_head_data = load_json(HEAD_TO_HEAD_FILE)
+        for (winner_id, loser_id), wins in head_to_head_wins.items():
+            record = head_to_head_data.setdefault(f"{winner_id}_{loser_id}", {"wins": 0})
+            record["wins"] += wins
+        save_json(HEAD_TO_HEAD_FILE, head_to_head_data)
+
+    for game in games:
+        apply_game_to_indexes(game)
+    bump_league_version()
+    return games
+
+@bot.tree.command(name="import_results", description="Import game results from a CSV or JSON file (Admin only)")
+@is_admin()
+@app_commands.describe(file="CSV or JSON with week, winner, loser, winner_score, loser_score (and optional home)")
+async def import_results(interaction: discord.Interaction, file: discord.Attachment):
+    """Validate and record a whole batch of game results at once"""
+    await interaction.response.defer()
+
+    try:
+        rows = parse_results_file(file.filename, (await file.read()).decode('utf-8-sig'))
+    except (UnicodeDecodeError, ValueError, csv.Error, AttributeError) as e:
+        await interaction.followup.send(f"❌ Couldn't read **{file.filename}**: {e}", ephemeral=True)
+        return
+
+    if not rows:
+        await interaction.followup.send("❌ The file has no results in it!", ephemeral=True)
+        return
+
+    if len(rows) > IMPORT_MAX_ROWS:
+        await interaction.followup.send(
+            f"❌ Too many results ({len(rows)}); import at most {IMPORT_MAX_ROWS} at a time.",
+            ephemeral=True
+        )
+        return
+
+    config = await get_config_data()
+    season = config.get('season', 1)
+    results, errors = validate_results(rows, await get_team_index(), await get_week_status_index(), season)
+
+    if errors:
+        shown = errors[:IMPORT_MAX_ERRORS]
+        if len(errors) > IMPORT_MAX_ERRORS:
+            shown.append(f"... and {len(errors) - IMPORT_MAX_ERRORS} more")
+        embed = discord.Embed(
+            title="❌ Import Rejected",
+            description="Nothing was recorded. Fix these rows and upload the file again:\n" + "\n".join(shown),
+            color=discord.Color.red()
+        )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+        return
+
+    teams, standings, _, _ = await get_league_snapshot_data(include_head_to_head=False)
+    games = await import_game_results(season, results, teams, standings)
+
+    if games is None:
+        await interaction.followup.send(
+            "❌ The batch couldn't be recorded (a matchup may have been reported meanwhile). Nothing was changed.",
+            ephemeral=True
+        )
+        return
+
+    weeks = sorted({game['week'] for game in games})
+    embed = discord.Embed(
+        title="✅ Results Imported",
+        description=f"Recorded **{len(games)}** game(s) for Season {season}.",
+        color=discord.Color.green()
+    )
+    embed.add_field(name="Weeks", value=", ".join(str(week) for week in weeks), inline=False)
+    await interaction.followup.send(embed=embed)
+
+    # Refresh the rankings channel once for the whole batch
+    await queue_side_effect('power_rankings')
+
+# ==================== TEAM HISTORY INDEX ====================
+
+RECENT_FORM_SIZE = 5
+
+def chronological(games):
+    """Sort games oldest first by (date, id), giving JSON records without an id their position"""
+    for i, game in enumerate(games):
+        if game.get('id') is None:
+            game['id'] = i + 1
+    return sorted(games, key=game_cursor)
+
+def new_team_profile():
+    """Create the rolling aggregates kept for one team"""
+    return {
+        'wins': 0,
+        'losses': 0,
+        'margin_total': 0,
+        'streak': 0,
+        'longest_win_streak': 0,
+        'recent': deque(maxlen=RECENT_FORM_SIZE),
+        'home': [0, 0],
+        'away': [0, 0]
+    }
+
+class TeamGameIndex:
+    """Per-team game history and rolling aggregates.
+
+    ``by_team`` maps each team to the offsets of its games in ``games`` (the
+    in-memory game log). Profiles hold the streak, last-N games, home/away
+    split and margin totals, all updated as each game is added.
+    """
+
+    def __init__(self):
+        self.games = []
+        self.by_team = {}
+        self.profiles = {}
+
+    def add_game(self, game):
+        """Append a game to the log and update both teams' aggregates"""
+        offset = len(self.games)
+        self.games.append(game)
+
+        home_id = game.get('home_id')
+        sides = (
+            (game['winner_id'], True, game['winner_score'], game['loser_score']),
+            (game['loser_id'], False, game['loser_score'], game['winner_score'])
+        )
+        for team_id, won, scored, allowed in sides:
+            self.by_team.setdefault(team_id, []).append(offset)
+            profile = self.profiles.setdefault(team_id, new_team_profile())
+
+            profile['margin_total'] += scored - allowed
+            profile['recent'].append(offset)
+            if won:
+                profile['wins'] += 1
+                profile['streak'] = profile['streak'] + 1 if profile['streak'] > 0 else 1
+                profile['longest_win_streak'] = max(profile['longest_win_streak'], profile['streak'])
+            else:
+                profile['losses'] += 1
+                profile['streak'] = profile['streak'] - 1 if profile['streak'] < 0 else -1
+
+            if home_id:
+                split = profile['home'] if home_id == team_id else profile['away']
+                split[0 if won else 1] += 1
+
+    def profile(self, team_id):
+        """Get a team's aggregates (empty if it hasn't played)"""
+        return self.profiles.get(team_id) or new_team_profile()
+
+    def recent_games(self, team_id):
+        """Get a team's last games, newest first"""
+        return [self.games[offset] for offset in reversed(self.profile(team_id)['recent'])]
+
+    @classmethod
+    def build(cls, games):
+        """Build the index by replaying the game log"""
+        index = cls()
+        for game in chronological(games):
+            if game.get('winner_id') and game.get('loser_id'):
+                index.add_game(game)
+        return index
+
+async def get_team_game_index():
+    """Get the per-team game index, building it from storage on first use"""
+    cache = league_cache()
+    if cache.team_game_index is None:
+        cache.team_game_index = TeamGameIndex.build(await get_games_data())
+    return cache.team_game_index
+
+def format_streak(streak):
+    """Format a signed streak as W3 / L2"""
+    if streak > 0:
+        return f"W{streak}"
+    if streak < 0:
+        return f"L{-streak}"
+    return "-"
+
+@bot.tree.command(name="team_profile", description="View a team's form, streak and splits")
+@app_commands.describe(team="Team abbreviation (default: your team)")
+@app_commands.autocomplete(team=team_abbreviation_autocomplete)
+async def team_profile(interaction: discord.Interaction, team: Optional[str] = None):
+    """Display a team's recent form and rolling aggregates"""
+    teams_index = await get_team_index()
+
+    if team:
+        team_id = teams_index.owner_by_abbr(team)
+        if not team_id:
+            await interaction.response.send_message(
+                f"❌ No team found with abbreviation **{team.upper()}**!",
+                ephemeral=True
+            )
+            return
+    else:
+        team_id = str(interaction.user.id)
+        if team_id not in teams_index.teams:
+            await interaction.response.send_message(
+                "❌ You don't have a team registered! Use `/register_team` to register.",
+                ephemeral=True
+            )
+            return
+
+    team_info = teams_index.teams[team_id]
+    games_index = await get_team_game_index()
+    profile = games_index.profile(team_id)
+    games_played = profile['wins'] + profile['losses']
+
+    embed = discord.Embed(
+        title=f"🏈 {team_info['name']} ({team_info['abbreviation']})",
+        color=discord.Color.gold()
+    )
+    embed.add_field(name="Record", value=f"{profile['wins']}-{profile['losses']}", inline=True)
+    embed.add_field(name="Streak", value=format_streak(profile['streak']), inline=True)
+    embed.add_field(
+        name="Avg Margin",
+        value=f"{profile['margin_total'] / games_played:+.1f}" if games_played else "-",
+        inline=True
+    )
+    embed.add_field(name="Home", value=f"{profile['home'][0]}-{profile['home'][1]}", inline=True)
+    embed.add_field(name="Away", value=f"{profile['away'][0]}-{profile['away'][1]}", inline=True)
+    embed.add_field(name="Longest Win Streak", value=str(profile['longest_win_streak']), inline=True)
+
+    recent = games_index.recent_games(team_id)
+    if recent:
+        lines = []
+        for game in recent:
+            result = "W" if game['winner_id'] == team_id else "L"
+            lines.append(f"`{result}` Week {game['week']}: {format_game_result(game)}")
+        embed.add_field(name=f"Last {len(recent)} Games", value="\n".join(lines), inline=False)
+    else:
+        embed.add_field(name="Recent Games", value="No games played yet.", inline=False)
+
+    await interaction.response.send_message(embed=embed)
+
+# ==================== LEAGUE STATS ====================
+
+LEADERBOARD_SIZE = 5
+
+class LeagueStats:
+    """Incrementally maintained league aggregates and leaderboards.
+
+    Team totals are updated per game; game-level leaderboards (blowouts,
+    closest games) are bounded top-K heaps, so nothing ever rescans history.
+    """
+
+    def __init__(self, size=LEADERBOARD_SIZE):
+        self.size = size
+        self.teams = {}
+        self.games_recorded = 0
+        # Min-heap on margin keeps the largest margins
+        self.blowouts = []
+        # Min-heap on negated margin keeps the smallest margins
+        self.closest = []
+
+    def _push(self, heap, key, game):
+        entry = (key, self.games_recorded, game)
+        if len(heap) < self.size:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    def add_game(self, game):
+        """Apply one game to the aggregates and leaderboards"""
+        self.games_recorded += 1
+        sides = (
+            (game['winner_id'], game['winner_score'], game['loser_score']),
+            (game['loser_id'], game['loser_score'], game['winner_score'])
+        )
+        for team_id, scored, allowed in sides:
+            totals = self.teams.setdefault(team_id, {'games': 0, 'points_for': 0, 'points_against': 0})
+            totals['games'] += 1
+            totals['points_for'] += scored
+            totals['points_against'] += allowed
+
+        margin = game['winner_score'] - game['loser_score']
+        self._push(self.blowouts, margin, game)
+        self._push(self.closest, -margin, game)
+
+    def most_points(self):
+        """Teams with the most points scored: [(team_id, points)]"""
+        top = heapq.nlargest(self.size, self.teams.items(), key=lambda x: x[1]['points_for'])
+        return [(team_id, totals['points_for']) for team_id, totals in top]
+
+    def best_defense(self):
+        """Teams allowing the fewest points per game: [(team_id, points allowed per game)]"""
+        top = heapq.nsmallest(
+            self.size,
+            self.teams.items(),
+            key=lambda x: x[1]['points_against'] / x[1]['games']
+        )
+        return [(team_id, totals['points_against'] / totals['games']) for team_id, totals in top]
+
+    def biggest_blowouts(self):
+        """Games with the largest margins, largest first"""
+        return [game for _, _, game in sorted(self.blowouts, reverse=True)]
+
+    def closest_games(self):
+        """Games with the smallest margins, closest first"""
+        return [game for _, _, game in sorted(self.closest, reverse=True)]
+
+    @classmethod
+    def build(cls, games):
+        """Full rebuild from the game log"""
+        stats = cls()
+        for game in chronological(games):
+            if game.get('winner_id') and game.get('loser_id'):
+                stats.add_game(game)
+        return stats
+
+async def get_league_stats():
+    """Get the league stats engine, building it from storage on first use"""
+    cache = league_cache()
+    if cache.league_stats is None:
+        cache.league_stats = LeagueStats.build(await get_games_data())
+    return cache.league_stats
+
+def longest_win_streaks(games_index, size=LEADERBOARD_SIZE):
+    """Teams with the longest win streaks this season: [(team_id, streak)]"""
+    top = heapq.nlargest(size, games_index.profiles.items(), key=lambda x: x[1]['longest_win_streak'])
+    return [(team_id, profile['longest_win_streak']) for team_id, profile in top if profile['longest_win_streak']]
+
+LEADER_CATEGORIES = {
+    "points": "🔥 Most Points Scored",
+    "defense": "🛡️ Best Defense",
+    "blowouts": "💥 Biggest Blowouts",
+    "streaks": "📈 Longest Win Streaks",
+    "closest": "😬 Closest Games"
+}
+
+def format_team_leaders(leaders, teams_index, value_format):
+    """Format [(team_id, value)] leaderboard lines"""
+    lines = []
+    for place, (team_id, value) in enumerate(leaders, 1):
+        team = teams_index.teams.get(team_id)
+        abbr = team['abbreviation'] if team else "???"
+        lines.append(f"{place}. **{abbr}** - {value_format(value)}")
+    return "\n".join(lines)
+
+def format_game_leaders(games):
+    """Format leaderboard lines for individual games"""
+    return "\n".join(
+        f"{place}. Week {game['week']}: {game['winner_abbr']} {game['winner_score']}-"
+        f"{game['loser_score']} {game['loser_abbr']} ({game['winner_score'] - game['loser_score']:+d})"
+        for place, game in enumerate(games, 1)
+    )
+
+@bot.tree.command(name="leaders", description="View league leaderboards")
+@app_commands.describe(category="Leaderboard to show (default: all)")
+@app_commands.choices(category=[
+    app_commands.Choice(name=name, value=value) for value, name in LEADER_CATEGORIES.items()
+])
+async def leaders(interaction: discord.Interaction, category: Optional[str] = None):
+    """Display league leaderboards from the stats engine"""
+    stats = await get_league_stats()
+
+    if not stats.games_recorded:
+        await interaction.response.send_message("❌ No games have been played yet!", ephemeral=True)
+        return
+
+    teams_index = await get_team_index()
+    games_index = await get_team_game_index()
+
+    boards = {
+        "points": lambda: format_team_leaders(stats.most_points(), teams_index, lambda v: f"{v} pts"),
+        "defense": lambda: format_team_leaders(stats.best_defense(), teams_index, lambda v: f"{v:.1f} allowed/game"),
+        "blowouts": lambda: format_game_leaders(stats.biggest_blowouts()),
+        "streaks": lambda: format_team_leaders(longest_win_streaks(games_index), teams_index, lambda v: f"{v} straight"),
+        "closest": lambda: format_game_leaders(stats.closest_games())
+    }
+
+    embed = discord.Embed(
+        title="🏅 League Leaders",
+        color=discord.Color.gold()
+    )
+    for key in ([category] if category else LEADER_CATEGORIES):
+        embed.add_field(name=LEADER_CATEGORIES[key], value=boards[key]() or "No data yet.", inline=False)
+    embed.set_footer(text=f"{stats.games_recorded} game(s) recorded")
+
+    await interaction.response.send_message(embed=embed)
+
+# ==================== POWER RANKINGS ====================
+
+def calculate_power_rankings(teams_data, standings_data, head_to_head):
+    """Calculate power rankings with tiebreakers"""
+    rankings = []
+    
+    for user_id, team in teams_data.items():
+        if user_id not in standings_data:
+            continue
+        
+        record = standings_data[user_id]
+        
+        # Skip teams that have never played (0-0 with no points)
+        if (record['wins'] == 0 and record['losses'] == 0 and 
+            record['points_for'] == 0 and record['points_against'] == 0):
+            continue
+        
+        rankings.append({
+            'user_id': user_id,
+            'team_name': team['name'],
             'abbreviation': team['abbreviation'],
             'wins': record['wins'],
             'losses': record['losses'],
@@ -1093,13 +3273,11 @@ def calculate_power_rankings(teams_data, standings_data, head_to_head_data):
             return team2['wins'] - team1['wins']
         
         # Tied in wins, check head-to-head
-        h2h_key1 = f"{team1['user_id']}_{team2['user_id']}"
-        h2h_key2 = f"{team2['user_id']}_{team1['user_id']}"
+        team1_h2h_wins = head_to_head.wins(team1['user_id'], team2['user_id'])
+        team2_h2h_wins = head_to_head.wins(team2['user_id'], team1['user_id'])
         
-        if h2h_key1 in head_to_head_data:
-            return -1  # team1 beat team2
-        elif h2h_key2 in head_to_head_data:
-            return 1   # team2 beat team1
+        if team1_h2h_wins != team2_h2h_wins:
+            return team2_h2h_wins - team1_h2h_wins
         
         # No head-to-head, use point differential
         return team2['point_diff'] - team1['point_diff']
@@ -1112,49 +3290,9 @@ def calculate_power_rankings(teams_data, standings_data, head_to_head_data):
 @bot.tree.command(name="power_rankings", description="View power rankings with tiebreakers")
 async def power_rankings(interaction: discord.Interaction):
     """Display power rankings"""
-    teams = await get_teams_data()
-    standings = await get_standings_data()
-    head_to_head = await get_head_to_head_data()
-    
-    if not teams:
-        await interaction.response.send_message("❌ No teams registered yet!", ephemeral=True)
-        return
-    
-    rankings = calculate_power_rankings(teams, standings, head_to_head)
-    
-    if not rankings:
-        await interaction.response.send_message(
-            "❌ No teams in standings yet! Teams will appear here once registered.",
-            ephemeral=True
-        )
-        return
-    
-    embed = discord.Embed(
-        title="⚡ Power Rankings",
-        color=discord.Color.gold()
-    )
-    
-    rank_text = "```\n"
-    rank_text += f"{'#':<4}{'Team':<20}{'Record':<10}{'PF':<6}{'PA':<6}{'Diff':<6}\n"
-    rank_text += "-" * 52 + "\n"
-    
-    for rank, team in enumerate(rankings, 1):
-        record = f"{team['wins']}-{team['losses']}"
-        rank_text += f"{rank:<4}{team['abbreviation']:<20}{record:<10}{team['points_for']:<6}{team['points_against']:<6}{team['point_diff']:+<6}\n"
-    
-    rank_text += "```"
-    embed.description = rank_text
-    
-    embed.add_field(
-        name="📊 Tiebreaker Rules",
-        value="1️⃣ Best Record\n2️⃣ Head-to-Head Result\n3️⃣ Point Differential",
-        inline=False
+    await send_paginated(
+        interaction, 'power_rankings', build_power_rankings_source, build_power_rankings_page, TABLE_ROWS_PER_PAGE
     )
-    
-    config = load_json(CONFIG_FILE)
-    embed.set_footer(text=f"Season {config.get('season', 1)} - Week {config.get('week', 1)} | {len(rankings)} teams")
-    
-    await interaction.response.send_message(embed=embed)
 
 async def update_power_rankings_channel(guild):
     """Update the power rankings in the #power-rankings channel"""
@@ -1162,16 +3300,10 @@ async def update_power_rankings_channel(guild):
     if not channel:
         return
     
-    teams = await get_teams_data()
-    standings = await get_standings_data()
-    head_to_head = await get_head_to_head_data()
-    
-    if not teams:
-        return
-    
-    rankings = calculate_power_rankings(teams, standings, head_to_head)
+    version = league_cache().version
+    source = await get_rendered_view(guild, ('power_rankings', 'source'), build_power_rankings_source, version)
     
-    if not rankings:
+    if isinstance(source, str):
         return
     
     # Delete old messages in the channel
@@ -1182,58 +3314,1104 @@ async def update_power_rankings_channel(guild):
     except discord.Forbidden:
         pass
     
-    # Create new power rankings embed
-    embed = discord.Embed(
-        title="⚡ POWER RANKINGS",
-        color=discord.Color.gold()
-    )
-    
-    rank_text = "```\n"
-    rank_text += f"{'#':<4}{'Team':<20}{'Record':<10}{'PF':<6}{'PA':<6}{'Diff':<6}\n"
-    rank_text += "-" * 52 + "\n"
-    
-    for rank, team in enumerate(rankings, 1):
-        record = f"{team['wins']}-{team['losses']}"
-        rank_text += f"{rank:<4}{team['abbreviation']:<20}{record:<10}{team['points_for']:<6}{team['points_against']:<6}{team['point_diff']:+<6}\n"
-    
-    rank_text += "```"
-    embed.description = rank_text
-    
-    embed.add_field(
-        name="📊 Tiebreaker Rules",
-        value="1️⃣ Best Record\n2️⃣ Head-to-Head Result\n3️⃣ Point Differential",
-        inline=False
-    )
+    # Channel posts can't be paged with buttons forever, so post every page
+    page_count = max(1, math.ceil(len(source['rows']) / TABLE_ROWS_PER_PAGE))
+    for page in range(page_count):
+        embed = await get_rendered_view(
+            guild,
+            ('power_rankings_channel', page),
+            lambda: build_power_rankings_page(source, page, page_count, channel_post=True),
+            version
+        )
+        embed.timestamp = datetime.utcnow()
+        
+        try:
+            await channel.send(embed=embed)
+        except discord.Forbidden:
+            pass
+
+@bot.tree.command(name="post_power_rankings", description="Post power rankings to #power-rankings channel (Admin only)")
+@is_admin()
+async def post_power_rankings(interaction: discord.Interaction):
+    """Post power rankings to the power-rankings channel"""
+    channel = discord.utils.get(interaction.guild.text_channels, name="power-rankings")
+    if not channel:
+        await interaction.response.send_message(
+            "❌ #power-rankings channel not found! Create it first with `/setup_league`",
+            ephemeral=True
+        )
+        return
     
-    config = load_json(CONFIG_FILE)
-    embed.set_footer(text=f"Season {config.get('season', 1)} - Week {config.get('week', 1)} | {len(rankings)} teams | Auto-updates after each game")
-    embed.timestamp = datetime.utcnow()
+    await interaction.response.defer()
+    await update_power_rankings_channel(interaction.guild)
     
-    try:
-        await channel.send(embed=embed)
-    except discord.Forbidden:
-        pass
+    await interaction.followup.send(
+        f"✅ Power rankings posted to {channel.mention}!",
+        ephemeral=True
+    )
+
+# ==================== RANKING HISTORY ====================
+
+# Per-week columns stored in a season snapshot. Each week holds one array per
+# column, aligned with the season's "teams" list (0 = not ranked that week).
+SNAPSHOT_COLUMNS = ('rank', 'wins', 'losses', 'points_for', 'points_against')
+
+def empty_snapshot_season():
+    """Create an empty columnar snapshot store for one season"""
+    store = {"teams": [], "abbrs": [], "weeks": []}
+    for column in SNAPSHOT_COLUMNS:
+        store[column] = []
+    return store
+
+def add_snapshot_week(season_data, week, rows):
+    """Insert or replace one week of ranking rows in a columnar season store"""
+    teams = season_data['teams']
+    abbrs = season_data['abbrs']
+    column_of = {user_id: i for i, user_id in enumerate(teams)}
+
+    for row in rows:
+        user_id = row['user_id']
+        if user_id not in column_of:
+            column_of[user_id] = len(teams)
+            teams.append(user_id)
+            abbrs.append(row['abbreviation'])
+        else:
+            abbrs[column_of[user_id]] = row['abbreviation']
+
+    week_columns = {column: [0] * len(teams) for column in SNAPSHOT_COLUMNS}
+    for row in rows:
+        i = column_of[row['user_id']]
+        for column in SNAPSHOT_COLUMNS:
+            week_columns[column][i] = row[column]
+
+    weeks = season_data['weeks']
+    if week in weeks:
+        pos = weeks.index(week)
+        for column in SNAPSHOT_COLUMNS:
+            season_data[column][pos] = week_columns[column]
+    else:
+        pos = bisect.bisect(weeks, week)
+        weeks.insert(pos, week)
+        for column in SNAPSHOT_COLUMNS:
+            season_data[column].insert(pos, week_columns[column])
+
+def snapshot_ranks(season_data, week):
+    """Get {user_id: rank} for a snapshot week (ranked teams only)"""
+    if week not in season_data['weeks']:
+        return {}
+    ranks = season_data['rank'][season_data['weeks'].index(week)]
+    return {user_id: rank for user_id, rank in zip(season_data['teams'], ranks) if rank}
+
+def team_trajectory(season_data, abbreviation):
+    """Get [(week, rank, wins, losses)] for a team across a season's snapshots"""
+    abbr_upper = abbreviation.upper()
+    if abbr_upper not in season_data['abbrs']:
+        return []
+
+    i = season_data['abbrs'].index(abbr_upper)
+    trajectory = []
+    for pos, week in enumerate(season_data['weeks']):
+        ranks = season_data['rank'][pos]
+        rank = ranks[i] if i < len(ranks) else 0
+        if rank:
+            trajectory.append((week, rank, season_data['wins'][pos][i], season_data['losses'][pos][i]))
+    return trajectory
+
+def movement_arrow(previous_rank, rank):
+    """Format rank movement between two snapshots"""
+    if not previous_rank:
+        return "NEW"
+    if rank < previous_rank:
+        return f"▲{previous_rank - rank}"
+    if rank > previous_rank:
+        return f"▼{rank - previous_rank}"
+    return "–"
+
+async def get_season_snapshots(season):
+    """Get the columnar ranking snapshots for a season from database or JSON"""
+    if db.pool:
+        season_data = empty_snapshot_season()
+        rows = await db.get_ranking_snapshots(season)
+        by_week = {}
+        for row in rows:
+            by_week.setdefault(row['week'], []).append(row)
+        for week, week_rows in by_week.items():
+            add_snapshot_week(season_data, week, week_rows)
+        return season_data
+    return load_json(RANKING_SNAPSHOTS_FILE.format(season=season), empty_snapshot_season())
+
+async def snapshot_week_rankings(season, week):
+    """Store the current power rankings and standings as the snapshot for a week"""
+    teams, standings, head_to_head_data, _ = await get_league_snapshot_data(
+        include_head_to_head=league_cache().head_to_head_index is None
+    )
+    head_to_head = await get_head_to_head_index(head_to_head_data)
+
+    rankings = calculate_power_rankings(teams, standings, head_to_head)
+    rows = [
+        {
+            'user_id': team['user_id'],
+            'abbreviation': team['abbreviation'].upper(),
+            'rank': rank,
+            'wins': team['wins'],
+            'losses': team['losses'],
+            'points_for': team['points_for'],
+            'points_against': team['points_against']
+        }
+        for rank, team in enumerate(rankings, 1)
+    ]
+
+    if db.pool:
+        await db.save_ranking_snapshot(season, week, rows)
+    else:
+        snapshot_file = RANKING_SNAPSHOTS_FILE.format(season=season)
+        season_data = load_json(snapshot_file, empty_snapshot_season())
+        add_snapshot_week(season_data, week, rows)
+        save_json(snapshot_file, season_data, compact=True)
+
+async def build_rank_movement_source(week):
+    """Build the rank movement rows between a snapshot week (default: latest) and the one before"""
+    config = await get_config_data()
+    season = config.get('season', 1)
+    season_data = await get_season_snapshots(season)
+    weeks = season_data['weeks']
+
+    if not weeks:
+        return "❌ No weekly snapshots yet! Snapshots are saved each time the week advances."
+
+    if week is None:
+        week = weeks[-1]
+    if week not in weeks:
+        return f"❌ No snapshot found for Week {week}!"
+
+    pos = weeks.index(week)
+    ranks = snapshot_ranks(season_data, week)
+    previous_ranks = snapshot_ranks(season_data, weeks[pos - 1]) if pos > 0 else {}
+    abbr_of = dict(zip(season_data['teams'], season_data['abbrs']))
+    records = dict(zip(season_data['teams'], zip(season_data['wins'][pos], season_data['losses'][pos])))
+
+    rows = []
+    for user_id, rank in sorted(ranks.items(), key=lambda x: x[1]):
+        wins, losses = records[user_id]
+        rows.append((rank, abbr_of[user_id], f"{wins}-{losses}", movement_arrow(previous_ranks.get(user_id), rank)))
+
+    compared = f"vs Week {weeks[pos - 1]}" if pos > 0 else "First snapshot of the season"
+    return {'rows': rows, 'week': week, 'footer': f"Season {season} | {compared}"}
+
+async def build_rank_movement_page(source, page, page_count):
+    """Build one page of the rank movement embed"""
+    embed = discord.Embed(
+        title=f"📈 Power Rankings Movement - Week {source['week']}",
+        description=render_table(RANK_MOVEMENT_COLUMNS, page_slice(source['rows'], page, TABLE_ROWS_PER_PAGE)),
+        color=discord.Color.gold()
+    )
+    embed.set_footer(text=page_footer(source['footer'], page, page_count))
+    return embed
+
+@bot.tree.command(name="rank_movement", description="View weekly power ranking movement")
+@app_commands.describe(week="Snapshot week to compare against the week before (default: latest)")
+async def rank_movement(interaction: discord.Interaction, week: Optional[int] = None):
+    """Display rank movement arrows between two weekly snapshots"""
+    await send_paginated(
+        interaction, ('rank_movement', week), lambda: build_rank_movement_source(week),
+        build_rank_movement_page, TABLE_ROWS_PER_PAGE
+    )
+
+@bot.tree.command(name="rank_history", description="View a team's power ranking trajectory")
+@app_commands.describe(
+    abbreviation="Team abbreviation (e.g., KC, BUF)",
+    season="Season number (default: current season)"
+)
+@app_commands.autocomplete(abbreviation=team_abbreviation_autocomplete)
+async def rank_history(interaction: discord.Interaction, abbreviation: str, season: Optional[int] = None):
+    """Display a team's weekly rank trajectory from the snapshots"""
+    if season is None:
+        config = await get_config_data()
+        season = config.get('season', 1)
+
+    season_data = await get_season_snapshots(season)
+    trajectory = team_trajectory(season_data, abbreviation)
+
+    if not trajectory:
+        await interaction.response.send_message(
+            f"❌ No ranking history for **{abbreviation.upper()}** in Season {season}!",
+            ephemeral=True
+        )
+        return
+
+    history_text = "```\n"
+    history_text += f"{'Week':<6}{'Rank':<6}{'Record':<10}{'Move':<6}\n"
+    history_text += "-" * 28 + "\n"
+
+    previous_rank = None
+    for week, rank, wins, losses in trajectory:
+        arrow = movement_arrow(previous_rank, rank) if previous_rank else "–"
+        history_text += f"{week:<6}{rank:<6}{f'{wins}-{losses}':<10}{arrow:<6}\n"
+        previous_rank = rank
+
+    history_text += "```"
+
+    ranks = [rank for _, rank, _, _ in trajectory]
+    embed = discord.Embed(
+        title=f"📈 {abbreviation.upper()} Ranking History",
+        description=history_text,
+        color=discord.Color.gold()
+    )
+    embed.add_field(name="Best", value=f"#{min(ranks)}", inline=True)
+    embed.add_field(name="Worst", value=f"#{max(ranks)}", inline=True)
+    embed.add_field(name="Current", value=f"#{ranks[-1]}", inline=True)
+    embed.set_footer(text=f"Season {season} | {len(trajectory)} week(s)")
+
+    await interaction.response.send_message(embed=embed)
+
+# ==================== SCHEDULE ====================
+
+SEASON_WEEKS = 18
+UNALIGNED_GROUP_SIZE = 4
+SCHEDULE_GAMES_PER_PAGE = 25
+
+def max_schedule_weeks(team_count):
+    """Most weeks a league can fill with one bye per team and no pair meeting more than twice.
+
+    With an odd team count someone sits every week, so one bye each allows at
+    most one week per team; otherwise two passes of the round robin.
+    """
+    if team_count % 2:
+        return team_count
+    return 2 * (team_count - 1)
+
+def schedule_position(slot, q):
+    """Rotation position of a layout slot: 1, 0, 2, -1, 3, -2, ... (mod q).
+
+    Slots 2i and 2i+1 sit at i+1 and -i, so the left and right members of a
+    group laid out in consecutive slots meet in rounds 0-2 (see generate_schedule).
+    """
+    return (slot // 2 + 1) % q if slot % 2 == 0 else -(slot // 2) % q
+
+def bye_pairs(lo, hi, half, span, q):
+    """Pair the positions lo .. lo+half-1 with hi-half+1 .. hi (mod q) to share bye weeks.
+
+    The left positions are taken in blocks of odd size up to ``span``, each
+    reversed against its mirror on the right, so within a block every pair has
+    a different sum: (lo + hi) - (span-1) .. (lo + hi) + (span-1) in steps of 2.
+    The byes are thereby spread evenly over ``span`` rounds.
+    """
+    pairs = []
+    start = 0
+    while start < half:
+        size = min(span, half - start)
+        if size % 2 == 0:
+            size -= 1
+        for i in range(size):
+            pairs.append(((lo + start + i) % q, (hi - start - (size - 1 - i)) % q))
+        start += size
+    return pairs
+
+def generate_schedule(groups, weeks=SEASON_WEEKS):
+    """Generate a season as a list of weekly rounds of (home, away) pairs.
+
+    Uses the circle method on rotation positions 0..q-1 plus a fixed slot: in
+    round x positions k and x-k meet, and the position with 2k = x meets the
+    fixed slot, so every pair meets exactly once in q rounds. Groups (divisions)
+    are laid out next to each other so most division rivals meet. Past q weeks
+    the rounds are replayed with home and away swapped, so no pair meets more
+    than twice.
+
+    Every team plays the same number of games and gets exactly one bye: with
+    an odd team count the fixed slot is empty and its opponent sits, and the
+    teams that never draw it sit out one game from a perfect matching
+    (bye_pairs) placed in the middle of the season. Returns fewer rounds than
+    ``weeks`` when the teams can't fill them (see max_schedule_weeks; an odd
+    team count also needs an odd number of weeks). Runs in O(teams * weeks).
+    """
+    # Even-sized groups first, so every group starts on a left slot
+    order = [team for group in sorted(groups, key=lambda group: len(group) % 2) for team in group]
+    n = len(order)
+    weeks = min(weeks, max_schedule_weeks(n))
+    if n % 2 and weeks % 2 == 0:
+        weeks -= 1
+    if n < 2 or weeks < 1:
+        return []
+
+    q = n if n % 2 else n - 1
+    fixed = None if n % 2 else order[-1]
+    at = {schedule_position(slot, q): team for slot, team in enumerate(order[:q])}
+    half_q = (q + 1) // 2  # inverse of 2 mod q
+
+    first = min(weeks, q)
+    middle = (first - 1) // 2
+    # Largest odd span of bye rounds that fits around the middle round
+    span = middle + 1 if middle % 2 == 0 else middle
+    if fixed is None:
+        # Positions with 2k in 0..first-1 meet the empty slot; pair up the rest
+        left = (first + 1) // 2
+        pairs = bye_pairs(left, q - 1, (q - first) // 2, span, q)
+    else:
+        partner = middle * half_q % q
+        pairs = [(None, partner)] + bye_pairs(partner + 1, partner + q - 1, (q - 1) // 2, span, q)
+    byes = {frozenset((fixed if a is None else at[a], at[b])) for a, b in pairs}
+    bye_rounds = {(2 * b if a is None else a + b) % q for a, b in pairs}
+
+    rounds = []
+    for x in range(first):
+        games = []
+        for k in range(q):
+            other = (x - k) % q
+            if k < other:
+                # The gap's parity flips from week to week, which balances home games
+                games.append((at[k], at[other]) if (k - other) % q % 2 else (at[other], at[k]))
+            elif k == other and fixed is not None:
+                games.append((fixed, at[k]) if x % 2 == 0 else (at[k], fixed))
+        rounds.append(games)
+
+    # Bye rounds in the middle of the first pass, return games after it
+    open_rounds = [x for x in range(first) if x not in bye_rounds]
+    split = len(open_rounds) // 2
+    week_order = open_rounds[:split] + sorted(bye_rounds) + open_rounds[split:]
+    schedule = [[game for game in rounds[x] if frozenset(game) not in byes] for x in week_order]
+    schedule += [[(away, home) for home, away in rounds[x]] for x in week_order[:weeks - first]]
+    return schedule
+
+def schedule_groups(teams, divisions):
+    """Group teams for scheduling: NFL divisions, with unaligned teams in groups of four"""
+    groups = [[user_id for user_id in members if user_id in teams] for members in divisions.members.values()]
+    unaligned = [user_id for user_id in teams if user_id not in divisions.division_of]
+    groups.extend(
+        unaligned[i:i + UNALIGNED_GROUP_SIZE] for i in range(0, len(unaligned), UNALIGNED_GROUP_SIZE)
+    )
+    return groups
+
+async def save_schedule(season, games):
+    """Save a season's schedule to database or JSON"""
+    if db.pool:
+        await db.save_schedule(season, games)
+    else:
+        weeks = {}
+        for game in games:
+            weeks.setdefault(str(game['week']), []).append(game)
+        save_json(SCHEDULE_FILE, {"season": season, "weeks": weeks, "games": []})
+
+async def get_schedule_week(season, week):
+    """Get the scheduled games for one week from database or JSON"""
+    if db.pool:
+        return await db.get_schedule_week(season, week)
+    schedule = load_json(SCHEDULE_FILE, {"games": []})
+    if schedule.get('season') != season:
+        return []
+    return schedule.get('weeks', {}).get(str(week), [])
+
+async def get_team_schedule(season, team_id):
+    """Get one team's scheduled games for a season from database or JSON"""
+    if db.pool:
+        return await db.get_team_schedule(season, team_id)
+    schedule = load_json(SCHEDULE_FILE, {"games": []})
+    if schedule.get('season') != season:
+        return []
+    return [
+        game
+        for week in sorted(schedule.get('weeks', {}), key=int)
+        for game in schedule['weeks'][week]
+        if team_id in (game['home_id'], game['away_id'])
+    ]
+
+async def get_schedule_weeks(season):
+    """Get how many weeks a season's schedule has (0 if none)"""
+    if db.pool:
+        return await db.get_schedule_weeks(season)
+    schedule = load_json(SCHEDULE_FILE, {"games": []})
+    if schedule.get('season') != season:
+        return 0
+    return max((int(week) for week in schedule.get('weeks', {})), default=0)
+
+@bot.tree.command(name="generate_schedule", description="Generate the season schedule (Admin only)")
+@is_admin()
+@app_commands.describe(
+    weeks="Number of regular season weeks (default: 18)",
+    replace="Replace this season's existing schedule"
+)
+async def generate_schedule_command(
+    interaction: discord.Interaction,
+    weeks: app_commands.Range[int, 1, 30] = SEASON_WEEKS,
+    replace: bool = False
+):
+    """Generate a full season schedule from the registered teams and NFL divisions"""
+    config = await get_config_data()
+    season = config.get('season', 1)
+
+    if not replace and await get_schedule_weeks(season):
+        await interaction.response.send_message(
+            f"❌ Season {season} already has a schedule! Use `replace: True` to regenerate it.",
+            ephemeral=True
+        )
+        return
+
+    teams = await get_teams_data()
+    if len(teams) < 2:
+        await interaction.response.send_message("❌ At least two teams are needed for a schedule!", ephemeral=True)
+        return
+
+    await interaction.response.defer()
+
+    divisions = await get_division_index()
+    rounds = generate_schedule(schedule_groups(teams, divisions), weeks)
+    games = [
+        {
+            'week': week,
+            'home_id': home_id,
+            'away_id': away_id,
+            'home_abbr': teams[home_id]['abbreviation'],
+            'away_abbr': teams[away_id]['abbreviation']
+        }
+        for week, pairs in enumerate(rounds, 1)
+        for home_id, away_id in pairs
+    ]
+    await save_schedule(season, games)
+    week_status_index = league_cache().week_status_index
+    if week_status_index is not None:
+        week_status_index.scheduled.clear()
+    bump_league_version()
+
+    embed = discord.Embed(
+        title=f"✅ Season {season} Schedule Generated",
+        description="Use `/schedule` to view each week's games.",
+        color=discord.Color.green()
+    )
+    embed.add_field(name="Weeks", value=str(len(rounds)), inline=True)
+    embed.add_field(name="Games", value=str(len(games)), inline=True)
+    embed.add_field(name="Teams", value=str(len(teams)), inline=True)
+    if len(rounds) < weeks:
+        embed.add_field(
+            name="⚠️ Shorter Season",
+            value=(
+                f"{len(teams)} teams can only fill {len(rounds)} of the {weeks} weeks requested "
+                f"with one bye each and no opponent met more than twice."
+            ),
+            inline=False
+        )
+
+    await interaction.followup.send(embed=embed)
+
+@bot.tree.command(name="schedule", description="View the schedule for a week or a team")
+@app_commands.describe(
+    week="Week to view (default: current week)",
+    team="Team abbreviation to view a full season schedule"
+)
+@app_commands.autocomplete(team=team_abbreviation_autocomplete)
+async def schedule_command(interaction: discord.Interaction, week: Optional[int] = None, team: Optional[str] = None):
+    """Display one week's games, or one team's season"""
+    config = await get_config_data()
+    season = config.get('season', 1)
+
+    if team:
+        index = await get_team_index()
+        team_id = index.owner_by_abbr(team)
+        if not team_id:
+            await interaction.response.send_message(
+                f"❌ No team found with abbreviation **{team.upper()}**!",
+                ephemeral=True
+            )
+            return
+
+        games = await get_team_schedule(season, team_id)
+        if not games:
+            await interaction.response.send_message(
+                f"❌ No schedule found for Season {season}!",
+                ephemeral=True
+            )
+            return
+
+        by_week = {game['week']: game for game in games}
+        lines = []
+        for game_week in range(1, max(by_week) + 1):
+            game = by_week.get(game_week)
+            if game is None:
+                lines.append(f"Week {game_week}: BYE")
+            elif game['home_id'] == team_id:
+                lines.append(f"Week {game_week}: vs {game['away_abbr']}")
+            else:
+                lines.append(f"Week {game_week}: @ {game['home_abbr']}")
+
+        embed = discord.Embed(
+            title=f"📅 {index.teams[team_id]['abbreviation']} - Season {season} Schedule",
+            description="\n".join(lines),
+            color=discord.Color.blue()
+        )
+        await interaction.response.send_message(embed=embed)
+        return
+
+    week = week or config.get('week', 1)
+
+    async def build_source():
+        games = await get_schedule_week(season, week)
+        if not games:
+            return f"❌ No games scheduled for Week {week} of Season {season}!"
+        return {
+            'rows': [f"{game['away_abbr']} @ {game['home_abbr']}" for game in games],
+            'footer': f"Season {season} - Week {week} | {len(games)} games"
+        }
+
+    async def build_page(source, page, page_count):
+        embed = discord.Embed(
+            title=f"📅 Week {week} Schedule",
+            description="\n".join(page_slice(source['rows'], page, SCHEDULE_GAMES_PER_PAGE)),
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text=page_footer(source['footer'], page, page_count))
+        return embed
+
+    await send_paginated(interaction, ('schedule', season, week), build_source, build_page, SCHEDULE_GAMES_PER_PAGE)
+
+# ==================== WEEK STATUS ====================
+
+REMINDER_BATCH_SIZE = 5
+REMINDER_BATCH_DELAY = 2.0
+WEEK_STATUS_MAX_LINES = 20
+
+class WeekStatusIndex:
+    """Scheduled versus reported games per (season, week).
+
+    Reported matchups are collected once from the game log and then added
+    as each game is recorded; a week's schedule is loaded the first time
+    that week is asked about.
+    """
+
+    def __init__(self):
+        self.reported = {}
+        self.scheduled = {}
+
+    def add_game(self, game):
+        """Mark a game's matchup as reported for its week"""
+        key = (game.get('season'), game['week'])
+        self.reported.setdefault(key, set()).add(frozenset((game['winner_id'], game['loser_id'])))
+
+    def claim(self, season, week, team1_id, team2_id):
+        """Mark a matchup as reported, returning False if it already was"""
+        reported_pairs = self.reported.setdefault((season, week), set())
+        pair = frozenset((team1_id, team2_id))
+        if pair in reported_pairs:
+            return False
+        reported_pairs.add(pair)
+        return True
+
+    def release(self, season, week, team1_id, team2_id):
+        """Forget a matchup's report (after it failed or was taken back)"""
+        self.reported.get((season, week), set()).discard(frozenset((team1_id, team2_id)))
+
+    def set_schedule(self, season, week, games):
+        """Cache the scheduled games of a week"""
+        self.scheduled[(season, week)] = games
+
+    def status(self, season, week):
+        """Get (reported, unreported) scheduled games and how many games were reported in total"""
+        reported_pairs = self.reported.get((season, week), set())
+        reported = []
+        unreported = []
+        for game in self.scheduled.get((season, week), []):
+            pair = frozenset((game['home_id'], game['away_id']))
+            (reported if pair in reported_pairs else unreported).append(game)
+        return reported, unreported, len(reported_pairs)
+
+    @classmethod
+    def build(cls, games):
+        """Build the reported side from the game log"""
+        index = cls()
+        for game in games:
+            if game.get('winner_id') and game.get('loser_id'):
+                index.add_game(game)
+        return index
+
+async def get_week_status_index():
+    """Get the week status index, building it from storage on first use"""
+    cache = league_cache()
+    if cache.week_status_index is None:
+        index = WeekStatusIndex.build(await get_games_data())
+        # A concurrent first call may have built one while this waited, and claims may already be on it
+        if cache.week_status_index is None:
+            cache.week_status_index = index
+    return cache.week_status_index
+
+async def get_week_status(season, week):
+    """Get (reported, unreported, total reported) for a week, loading its schedule once"""
+    index = await get_week_status_index()
+    if (season, week) not in index.scheduled:
+        index.set_schedule(season, week, await get_schedule_week(season, week))
+    return index.status(season, week)
+
+async def send_result_reminders(guild, season, week, unreported):
+    """DM every owner who still owes a result, in small paced batches.
+
+    Returns (sent, failed) counts.
+    """
+    owner_games = {}
+    for game in unreported:
+        for owner_id, opponent in ((game['home_id'], game['away_abbr']), (game['away_id'], game['home_abbr'])):
+            owner_games.setdefault(owner_id, opponent)
+
+    members = await resolve_members(guild, owner_games)
+
+    async def remind(owner_id, opponent):
+        member = members[owner_id]
+        if member is None:
+            return False
+        try:
+            await member.send(
+                f"🏈 **Reminder:** your Week {week} game against **{opponent}** hasn't been reported yet "
+                f"in **{guild.name}**. Once it's played, the winner reports it with `/report_my_game`."
+            )
+            return True
+        except discord.HTTPException:
+            return False
+
+    owners = list(owner_games.items())
+    sent = 0
+    for i in range(0, len(owners), REMINDER_BATCH_SIZE):
+        if i:
+            # Pace the batches so a big league doesn't run into the DM rate limits
+            await asyncio.sleep(REMINDER_BATCH_DELAY)
+        batch = owners[i:i + REMINDER_BATCH_SIZE]
+        results = await asyncio.gather(*(remind(owner_id, opponent) for owner_id, opponent in batch))
+        sent += sum(results)
+
+    return sent, len(owners) - sent
+
+def format_scheduled_games(games):
+    """Format scheduled games, capped to keep the embed field short"""
+    lines = [f"{game['away_abbr']} @ {game['home_abbr']}" for game in games[:WEEK_STATUS_MAX_LINES]]
+    if len(games) > WEEK_STATUS_MAX_LINES:
+        lines.append(f"... and {len(games) - WEEK_STATUS_MAX_LINES} more")
+    return "\n".join(lines)
+
+@bot.tree.command(name="week_status", description="View which of this week's games are still unreported")
+@app_commands.describe(week="Week to check (default: current week)")
+async def week_status(interaction: discord.Interaction, week: Optional[int] = None):
+    """Display scheduled versus reported games for a week"""
+    config = await get_config_data()
+    season = config.get('season', 1)
+    week = week or config.get('week', 1)
+
+    reported, unreported, reported_total = await get_week_status(season, week)
+    scheduled_total = len(reported) + len(unreported)
+
+    embed = discord.Embed(
+        title=f"📋 Week {week} Status",
+        color=discord.Color.green() if scheduled_total and not unreported else discord.Color.orange()
+    )
+
+    if scheduled_total:
+        embed.description = f"**{len(reported)}/{scheduled_total}** scheduled games reported"
+        embed.add_field(
+            name=f"⏳ Unreported ({len(unreported)})",
+            value=format_scheduled_games(unreported) or "All games are in! ✅",
+            inline=False
+        )
+        if reported:
+            embed.add_field(name=f"✅ Reported ({len(reported)})", value=format_scheduled_games(reported), inline=False)
+    else:
+        embed.description = (
+            f"No schedule for Week {week}. {reported_total} game(s) reported.\n"
+            "Use `/generate_schedule` to create one."
+        )
+
+    embed.set_footer(text=f"Season {season}")
+    await interaction.response.send_message(embed=embed)
+
+@bot.tree.command(name="remind_unreported", description="DM owners whose games are still unreported (Admin only)")
+@is_admin()
+@app_commands.describe(week="Week to send reminders for (default: current week)")
+async def remind_unreported(interaction: discord.Interaction, week: Optional[int] = None):
+    """Remind the owners of every unreported scheduled game"""
+    config = await get_config_data()
+    season = config.get('season', 1)
+    week = week or config.get('week', 1)
+
+    _, unreported, _ = await get_week_status(season, week)
+    if not unreported:
+        await interaction.response.send_message(
+            f"✅ Nothing to remind - every scheduled Week {week} game has been reported (or none are scheduled).",
+            ephemeral=True
+        )
+        return
+
+    await interaction.response.defer(ephemeral=True)
+    sent, failed = await send_result_reminders(interaction.guild, season, week, unreported)
+
+    message = f"📨 Sent {sent} reminder(s) for {len(unreported)} unreported Week {week} game(s)."
+    if failed:
+        message += f"\n⚠️ {failed} owner(s) couldn't be reached (left the server or DMs closed)."
+    await interaction.followup.send(message, ephemeral=True)
+
+# ==================== PLAYOFFS ====================
+
+PLAYOFF_SEEDS = 7
+PLAYOFF_MATCHUPS_CATEGORY = "🏆 Playoff Matchups"
+
+def compute_playoff_seeds(teams, standings, divisions, head_to_head):
+    """Seed each conference: division winners first, then the best remaining teams as wild cards"""
+    seeds = {}
+    for conference in CONFERENCES:
+        winners = []
+        others = []
+        for division, members in divisions.members.items():
+            if conference_of(division) != conference:
+                continue
+            members = [user_id for user_id in members if user_id in teams]
+            if not members:
+                continue
+            ranked = sort_group(members, teams, standings, divisions, head_to_head)
+            winners.append(ranked[0]['user_id'])
+            others.extend(row['user_id'] for row in ranked[1:])
+
+        ranked_winners = sort_group(winners, teams, standings, divisions, head_to_head)
+        wild_cards = sort_group(others, teams, standings, divisions, head_to_head)[:max(0, PLAYOFF_SEEDS - len(winners))]
+        seeds[conference] = [
+            {'seed': seed, 'user_id': row['user_id'], 'abbreviation': row['abbreviation']}
+            for seed, row in enumerate(ranked_winners + wild_cards, 1)
+        ]
+    return seeds
+
+async def get_playoff_seeds():
+    """Get the current conference seeds, recomputing them only after the league changes"""
+    cache = league_cache()
+    if cache.playoff_seeds is not None and cache.playoff_seeds[0] == cache.version:
+        return cache.playoff_seeds[1]
+
+    version = cache.version
+    teams, standings, head_to_head_data, _ = await get_league_snapshot_data(
+        include_head_to_head=league_cache().head_to_head_index is None
+    )
+    head_to_head = await get_head_to_head_index(head_to_head_data)
+    divisions = await get_division_index()
+
+    seeds = compute_playoff_seeds(teams, standings, divisions, head_to_head)
+    cache.playoff_seeds = (version, seeds)
+    return seeds
+
+async def get_playoff_bracket(season):
+    """Get the playoff bracket for a season from database or JSON"""
+    if db.pool:
+        return await db.get_playoff_bracket(season)
+    return load_json(PLAYOFFS_FILE).get(str(season))
+
+async def save_playoff_bracket(bracket):
+    """Save a playoff bracket to database or JSON"""
+    if db.pool:
+        await db.save_playoff_bracket(bracket['season'], bracket)
+    else:
+        brackets = load_json(PLAYOFFS_FILE)
+        brackets[str(bracket['season'])] = bracket
+        save_json(PLAYOFFS_FILE, brackets)
+
+def playoff_round_name(alive_counts):
+    """Name a round from how many teams are still alive in each conference"""
+    if len(alive_counts) == 2 and max(alive_counts) == 1:
+        return "Championship"
+    most = max(alive_counts)
+    if most & (most - 1):
+        return "Wild Card"
+    if most == 2:
+        return "Conference Championship"
+    return "Divisional"
+
+def playoff_game(conference, high, low):
+    """Create a bracket game, with the higher seed at home"""
+    return {
+        'conference': conference,
+        'home_id': high['user_id'],
+        'home_abbr': high['abbreviation'],
+        'home_seed': high['seed'],
+        'away_id': low['user_id'],
+        'away_abbr': low['abbreviation'],
+        'away_seed': low['seed'],
+        'winner_id': None,
+        'home_score': None,
+        'away_score': None
+    }
+
+def advance_bracket(bracket):
+    """Add the next round to the bracket, or crown the champion when only one team is left.
+
+    Teams are reseeded every round: the best remaining seed plays the worst.
+    When a conference isn't down to a power of two, only its lowest seeds
+    play and the rest get a bye.
+    """
+    eliminated = set()
+    for playoff_round in bracket['rounds']:
+        for game in playoff_round['games']:
+            eliminated.add(game['away_id'] if game['winner_id'] == game['home_id'] else game['home_id'])
+
+    alive = {
+        conference: [team for team in seeds if team['user_id'] not in eliminated]
+        for conference, seeds in bracket['seeds'].items()
+    }
+    alive = {conference: teams for conference, teams in alive.items() if teams}
+    counts = [len(teams) for teams in alive.values()]
+
+    if not counts:
+        return
+    if len(counts) == 1 and counts[0] == 1:
+        bracket['champion'] = next(iter(alive.values()))[0]
+        return
+
+    games = []
+    if max(counts) == 1:
+        # One champion per conference left: they meet in the final
+        (first, second) = (teams[0] for teams in alive.values())
+        high, low = (first, second) if first['seed'] <= second['seed'] else (second, first)
+        games.append(playoff_game(None, high, low))
+    else:
+        for conference, teams in alive.items():
+            n = len(teams)
+            if n == 1:
+                continue
+            playing = teams[2 * (1 << (n.bit_length() - 1)) - n:] if n & (n - 1) else teams
+            for i in range(len(playing) // 2):
+                games.append(playoff_game(conference, playing[i], playing[-1 - i]))
+
+    bracket['rounds'].append({'name': playoff_round_name(counts), 'games': games})
+
+def new_bracket(season, seeds):
+    """Create a bracket from the conference seeds, with its first round drawn"""
+    bracket = {'season': season, 'seeds': seeds, 'rounds': [], 'champion': None}
+    advance_bracket(bracket)
+    return bracket
+
+def format_playoff_game(game):
+    """Format a bracket game line"""
+    home = f"({game['home_seed']}) {game['home_abbr']}"
+    away = f"({game['away_seed']}) {game['away_abbr']}"
+    if game['winner_id'] is None:
+        return f"{away} @ {home}"
+    return f"{away} {game['away_score']} @ {home} {game['home_score']}"
+
+def build_bracket_embed(bracket):
+    """Build the bracket embed, one field per round"""
+    embed = discord.Embed(
+        title=f"🏆 Season {bracket['season']} Playoff Bracket",
+        color=discord.Color.gold()
+    )
+    for playoff_round in bracket['rounds']:
+        lines = []
+        for game in playoff_round['games']:
+            prefix = f"{game['conference']}: " if game['conference'] else ""
+            lines.append(f"{prefix}{format_playoff_game(game)}")
+        embed.add_field(name=playoff_round['name'], value="\n".join(lines) or "-", inline=False)
+
+    if bracket['champion']:
+        embed.add_field(name="👑 Champion", value=f"**{bracket['champion']['abbreviation']}**", inline=False)
+    return embed
+
+@bot.tree.command(name="playoff_seeds", description="View the current playoff seeding")
+async def playoff_seeds(interaction: discord.Interaction):
+    """Display the playoff seeds if the season ended today"""
+    seeds = await get_playoff_seeds()
+
+    if not any(seeds.values()):
+        await interaction.response.send_message(
+            "❌ No registered teams are aligned to an NFL division yet!",
+            ephemeral=True
+        )
+        return
+
+    embed = discord.Embed(
+        title="🎯 Playoff Picture",
+        description="Seeds if the season ended today",
+        color=discord.Color.gold()
+    )
+    for conference, conference_seeds in seeds.items():
+        if not conference_seeds:
+            continue
+        embed.add_field(
+            name=conference,
+            value="\n".join(f"{team['seed']}. **{team['abbreviation']}**" for team in conference_seeds),
+            inline=True
+        )
+    embed.add_field(name="📊 Tiebreaker Rules", value=DIVISION_TIEBREAKER_RULES, inline=False)
+    embed.set_footer(text="Division winners are seeded 1-4")
+
+    await interaction.response.send_message(embed=embed)
+
+@bot.tree.command(name="generate_playoffs", description="Seed the playoffs and draw the bracket (Admin only)")
+@is_admin()
+@app_commands.describe(replace="Replace this season's existing bracket")
+async def generate_playoffs(interaction: discord.Interaction, replace: bool = False):
+    """Lock in the current seeds and create the playoff bracket"""
+    config = await get_config_data()
+    season = config.get('season', 1)
+
+    if not replace and await get_playoff_bracket(season):
+        await interaction.response.send_message(
+            f"❌ Season {season} already has a playoff bracket! Use `replace: True` to redraw it.",
+            ephemeral=True
+        )
+        return
+
+    seeds = await get_playoff_seeds()
+    if sum(len(conference_seeds) for conference_seeds in seeds.values()) < 2:
+        await interaction.response.send_message(
+            "❌ At least two teams aligned to an NFL division are needed for the playoffs!",
+            ephemeral=True
+        )
+        return
+
+    bracket = new_bracket(season, seeds)
+    await save_playoff_bracket(bracket)
+
+    embed = build_bracket_embed(bracket)
+    embed.title = f"✅ Season {season} Playoffs Seeded!"
+    await interaction.response.send_message(embed=embed)
+
+@bot.tree.command(name="playoff_bracket", description="View the playoff bracket")
+async def playoff_bracket(interaction: discord.Interaction):
+    """Display this season's playoff bracket"""
+    config = await get_config_data()
+    bracket = await get_playoff_bracket(config.get('season', 1))
+
+    if not bracket:
+        await interaction.response.send_message(
+            "❌ The playoffs haven't been seeded yet! Use `/playoff_seeds` to see the current picture.",
+            ephemeral=True
+        )
+        return
+
+    await interaction.response.send_message(embed=build_bracket_embed(bracket))
+
+@bot.tree.command(name="report_playoff_game", description="Report a playoff game result (Admin only)")
+@is_admin()
+@app_commands.describe(
+    winner="The winning team's owner",
+    loser="The losing team's owner",
+    winner_score="Winner's score",
+    loser_score="Loser's score"
+)
+async def report_playoff_game(
+    interaction: discord.Interaction,
+    winner: discord.Member,
+    loser: discord.Member,
+    winner_score: int,
+    loser_score: int
+):
+    """Record a playoff result and draw the next round once the current one is complete"""
+    config = await get_config_data()
+    bracket = await get_playoff_bracket(config.get('season', 1))
+
+    if not bracket or bracket['champion']:
+        await interaction.response.send_message("❌ There are no playoff games left to report!", ephemeral=True)
+        return
+
+    if winner_score <= loser_score:
+        await interaction.response.send_message("❌ Winner's score must be higher than loser's score!", ephemeral=True)
+        return
+
+    winner_id = str(winner.id)
+    loser_id = str(loser.id)
+    current_round = bracket['rounds'][-1]
+    game = next(
+        (
+            game for game in current_round['games']
+            if game['winner_id'] is None and {game['home_id'], game['away_id']} == {winner_id, loser_id}
+        ),
+        None
+    )
+    if game is None:
+        await interaction.response.send_message(
+            f"❌ {winner.mention} and {loser.mention} don't have an open {current_round['name']} game!",
+            ephemeral=True
+        )
+        return
+
+    game['winner_id'] = winner_id
+    game['home_score'], game['away_score'] = (
+        (winner_score, loser_score) if game['home_id'] == winner_id else (loser_score, winner_score)
+    )
+
+    round_complete = all(game['winner_id'] for game in current_round['games'])
+    if round_complete:
+        advance_bracket(bracket)
+    await save_playoff_bracket(bracket)
+    all_time_index = league_cache().all_time_index
+    if bracket['champion'] and all_time_index is not None:
+        all_time_index.live_champion = bracket['champion']['user_id']
+
+    embed = discord.Embed(
+        title=f"✅ {current_round['name']} Result Recorded",
+        description=format_playoff_game(game),
+        color=discord.Color.green()
+    )
+    if bracket['champion']:
+        embed.add_field(name="👑 Champion", value=f"**{bracket['champion']['abbreviation']}**", inline=False)
+    elif round_complete:
+        next_round = bracket['rounds'][-1]
+        embed.add_field(
+            name=f"Next: {next_round['name']}",
+            value="\n".join(format_playoff_game(game) for game in next_round['games']),
+            inline=False
+        )
+
+    await interaction.response.send_message(embed=embed)
 
-@bot.tree.command(name="post_power_rankings", description="Post power rankings to #power-rankings channel (Admin only)")
+@bot.tree.command(name="create_playoff_matchups", description="Create matchup channels for the current playoff round (Admin only)")
 @is_admin()
-async def post_power_rankings(interaction: discord.Interaction):
-    """Post power rankings to the power-rankings channel"""
-    channel = discord.utils.get(interaction.guild.text_channels, name="power-rankings")
-    if not channel:
-        await interaction.response.send_message(
-            "❌ #power-rankings channel not found! Create it first with `/setup_league`",
-            ephemeral=True
-        )
+async def create_playoff_matchups(interaction: discord.Interaction):
+    """Create a private channel for every open game in the current playoff round"""
+    config = await get_config_data()
+    bracket = await get_playoff_bracket(config.get('season', 1))
+
+    if not bracket or bracket['champion']:
+        await interaction.response.send_message("❌ There are no playoff games to set up!", ephemeral=True)
         return
-    
+
     await interaction.response.defer()
-    await update_power_rankings_channel(interaction.guild)
-    
-    await interaction.followup.send(
-        f"✅ Power rankings posted to {channel.mention}!",
-        ephemeral=True
+
+    guild = interaction.guild
+    teams = await get_teams_data()
+    current_round = bracket['rounds'][-1]
+    channel_prefix = current_round['name'].lower().replace(" ", "-")
+
+    category = discord.utils.get(guild.categories, name=PLAYOFF_MATCHUPS_CATEGORY)
+    if not category:
+        try:
+            category = await guild.create_category(PLAYOFF_MATCHUPS_CATEGORY)
+        except discord.Forbidden:
+            await interaction.followup.send("❌ I don't have permission to create channels!", ephemeral=True)
+            return
+
+    open_games = [game for game in current_round['games'] if not game['winner_id']]
+    members = await resolve_members(
+        guild, [owner_id for game in open_games for owner_id in (game['home_id'], game['away_id'])]
     )
 
+    skipped = []
+    pending = []
+    for game in open_games:
+        home = teams.get(game['home_id'])
+        away = teams.get(game['away_id'])
+        home_member = members[game['home_id']]
+        away_member = members[game['away_id']]
+        if not (home and away and home_member and away_member):
+            skipped.append(f"{game['away_abbr']} @ {game['home_abbr']}")
+            continue
+        pending.append(open_matchup_channel(
+            guild, category, current_round['name'], channel_prefix, away, away_member, home, home_member,
+            report_hint="Report the result to commissioners"
+        ))
+
+    # Channels are created concurrently; discord.py paces the requests against rate limits
+    results = await asyncio.gather(*pending, return_exceptions=True)
+    created = [result for result in results if isinstance(result, discord.abc.GuildChannel)]
+    failed = len(results) - len(created)
+
+    embed = discord.Embed(
+        title=f"✅ {current_round['name']} Channels Created",
+        description="\n".join(channel.mention for channel in created) or "No channels created.",
+        color=discord.Color.green()
+    )
+    if skipped:
+        embed.add_field(name="⚠️ Owner or team missing", value="\n".join(skipped), inline=False)
+    if failed:
+        embed.add_field(name="❌ Failed", value=f"{failed} channel(s) could not be created", inline=False)
+
+    await interaction.followup.send(embed=embed)
+
 # ==================== LEAGUE MANAGEMENT ====================
 
 @bot.tree.command(name="advance_week", description="Advance to the next week (Admin only)")
@@ -1242,13 +4420,18 @@ async def advance_week(interaction: discord.Interaction):
     """Advance the league to the next week"""
     config = await get_config_data()
     new_week = config.get('week', 1) + 1
-    
+
+    # Snapshot the closing week's rankings before moving on
+    await snapshot_week_rankings(config.get('season', 1), config.get('week', 1))
+
     if db.pool:
         await db.set_config('week', str(new_week))
     else:
         config['week'] = new_week
         save_json(CONFIG_FILE, config)
     
+    bump_league_version()
+    
     embed = discord.Embed(
         title="📅 Week Advanced",
         description=f"The league has advanced to **Week {config['week']}**",
@@ -1269,8 +4452,127 @@ async def set_season(interaction: discord.Interaction, season: int):
         config['season'] = season
         save_json(CONFIG_FILE, config)
     
+    bump_league_version()
+    
     await interaction.response.send_message(f"✅ Season set to **{season}**", ephemeral=True)
 
+def rollover_json_season(season, champion_id=None):
+    """Close a season in the JSON stores.
+
+    The season's games, standings and head-to-head are written to a gzip
+    archive first, then added to the all-time totals, and only then are the
+    hot files trimmed to the new season. Returns row counts of what was archived.
+    """
+    games = load_json(GAMES_FILE, [])
+    for i, game in enumerate(games):
+        if game.get('season') is None:
+            game['season'] = season
+        if game.get('id') is None:
+            game['id'] = i + 1
+    closing = [game for game in games if game['season'] <= season]
+    remaining = [game for game in games if game['season'] > season]
+
+    teams = load_json(TEAMS_FILE)
+    standings = load_json(STANDINGS_FILE)
+    head_to_head_data = load_json(HEAD_TO_HEAD_FILE)
+
+    season_head_to_head = {}
+    for game in closing:
+        if game['season'] == season:
+            key = f"{game['winner_id']}_{game['loser_id']}"
+            season_head_to_head[key] = season_head_to_head.get(key, 0) + 1
+
+    os.makedirs(league_path(ARCHIVE_DIR), exist_ok=True)
+    with gzip.open(league_path(SEASON_ARCHIVE_FILE.format(season=season)), 'wt', encoding='utf-8') as f:
+        json.dump({
+            "season": season,
+            "games": closing,
+            "standings": {
+                user_id: {**record, "abbreviation": teams.get(user_id, {}).get('abbreviation')}
+                for user_id, record in standings.items()
+            },
+            "head_to_head": {key: {"wins": wins} for key, wins in season_head_to_head.items()}
+        }, f, separators=(',', ':'))
+
+    all_time = load_json(ALL_TIME_FILE, {"teams": {}, "head_to_head": {}})
+    for user_id, record in standings.items():
+        if record['wins'] + record['losses'] == 0:
+            continue
+        totals = all_time['teams'].setdefault(
+            user_id, {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0, 'seasons': 0}
+        )
+        for key in ('wins', 'losses', 'points_for', 'points_against'):
+            totals[key] += record[key]
+        totals['seasons'] += 1
+    if champion_id:
+        totals = all_time['teams'].setdefault(
+            champion_id, {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0, 'seasons': 0}
+        )
+        totals['championships'] = totals.get('championships', 0) + 1
+    for key, data in head_to_head_data.items():
+        all_time['head_to_head'][key] = all_time['head_to_head'].get(key, 0) + data.get('wins', 0)
+    save_json(ALL_TIME_FILE, all_time)
+
+    save_json(GAMES_FILE, remaining)
+    save_json(HEAD_TO_HEAD_FILE, {})
+    save_json(STANDINGS_FILE, {
+        user_id: {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0} for user_id in standings
+    })
+    config = load_json(CONFIG_FILE)
+    config['season'] = season + 1
+    config['week'] = 1
+    save_json(CONFIG_FILE, config)
+
+    return {'games': len(closing), 'teams': len(standings)}
+
+@bot.tree.command(name="rollover_season", description="Close the season and start the next one (Admin only)")
+@is_admin()
+@app_commands.describe(force="Close the season even though its playoffs haven't crowned a champion")
+async def rollover_season(interaction: discord.Interaction, force: bool = False):
+    """Archive the finished season, fold it into the all-time records and reset the standings"""
+    await interaction.response.defer()
+
+    # Game reports wait until the season is closed, so none lands in the old standings after they are read
+    async with league_write_lock():
+        config = await get_config_data()
+        season = config.get('season', 1)
+
+        bracket = await get_playoff_bracket(season)
+        if bracket and not bracket.get('champion') and not force:
+            await interaction.followup.send(
+                f"❌ Season {season}'s playoffs are still being played, so rolling over now would "
+                f"record no champion. Finish the bracket, or use `force: True` to close the season anyway.",
+                ephemeral=True
+            )
+            return
+        champion_id = bracket['champion']['user_id'] if bracket and bracket.get('champion') else None
+
+        # Snapshot the final week's rankings before the standings are reset
+        await snapshot_week_rankings(season, config.get('week', 1))
+
+        try:
+            if db.pool:
+                counts = await db.rollover_season(season, champion_id)
+            else:
+                counts = await asyncio.to_thread(rollover_json_season, season, champion_id)
+        except Exception as e:
+            await interaction.followup.send(f"❌ Season rollover failed: {str(e)}", ephemeral=True)
+            return
+
+        invalidate_game_indexes()
+        bump_league_version()
+    await queue_side_effect('power_rankings')
+
+    embed = discord.Embed(
+        title=f"🏁 Season {season} Closed",
+        description=f"Welcome to **Season {season + 1}**! Standings have been reset for Week 1.",
+        color=discord.Color.gold()
+    )
+    embed.add_field(name="Games Archived", value=str(counts.get('games', 0)), inline=True)
+    embed.add_field(name="Teams Reset", value=str(counts.get('teams', 0)), inline=True)
+    embed.set_footer(text="All-time records have been updated")
+    await interaction.followup.send(embed=embed)
+
 @bot.tree.command(name="announce_sim", description="Announce sim advance to members (Admin only)")
 @is_admin()
 @app_commands.describe(
@@ -1305,10 +4607,16 @@ async def announce_sim(interaction: discord.Interaction, sim_type: str, week: Op
             )
             return
         
+        # Snapshot the closing week's rankings before moving on
+        if week > config.get('week', 1):
+            await snapshot_week_rankings(config.get('season', 1), config.get('week', 1))
+        
         # Update config
         config['week'] = week
         save_json(CONFIG_FILE, config)
         
+        bump_league_version()
+        
         embed = discord.Embed(
             title="🏈 SIM ADVANCE - REGULAR SEASON",
             description=f"@everyone\n\n**The league has simmed to Week {week}!**",
@@ -1348,7 +4656,7 @@ async def announce_sim(interaction: discord.Interaction, sim_type: str, week: Op
         embed.add_field(
             name="⏰ What You Need to Do:",
             value=(
-                "1️⃣ Check your playoff bracket\n"
+                "1️⃣ Check your playoff bracket with `/playoff_bracket`\n"
                 "2️⃣ Play your playoff game\n"
                 "3️⃣ Report results to commissioners"
             ),
@@ -1429,7 +4737,7 @@ async def league_info(interaction: discord.Interaction):
     """Display league information"""
     config = await get_config_data()
     teams = await get_teams_data()
-    schedule = load_json(SCHEDULE_FILE)
+    games = await get_games_data()
     
     embed = discord.Embed(
         title=f"🏈 {config.get('league_name', 'Madden Franchise League')}",
@@ -1438,7 +4746,7 @@ async def league_info(interaction: discord.Interaction):
     embed.add_field(name="Season", value=str(config.get('season', 1)), inline=True)
     embed.add_field(name="Week", value=str(config.get('week', 1)), inline=True)
     embed.add_field(name="Teams", value=str(len(teams)), inline=True)
-    embed.add_field(name="Games Played", value=str(len(schedule.get('games', []))), inline=True)
+    embed.add_field(name="Games Played", value=str(len(games)), inline=True)
     
     await interaction.response.send_message(embed=embed)
 
@@ -1449,6 +4757,12 @@ async def reset_league(interaction: discord.Interaction):
     save_json(TEAMS_FILE, {})
     save_json(SCHEDULE_FILE, {"games": []})
     save_json(STANDINGS_FILE, {})
+    save_json(GAMES_FILE, [])
+    save_json(HEAD_TO_HEAD_FILE, {})
+    save_json(PLAYOFFS_FILE, {})
+    save_json(PENDING_REPORTS_FILE, [])
+    save_json(ALL_TIME_FILE, {"teams": {}, "head_to_head": {}})
+    drop_league_cache()
     
     embed = discord.Embed(
         title="⚠️ League Reset",
@@ -1458,6 +4772,460 @@ async def reset_league(interaction: discord.Interaction):
     
     await interaction.response.send_message(embed=embed)
 
+# ==================== ALL-TIME RECORDS ====================
+
+ALL_TIME_LEADERS = 10
+
+def new_all_time_record():
+    """Create an empty all-time record"""
+    return {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0, 'seasons': 0, 'championships': 0}
+
+class AllTimeIndex:
+    """All-time records and head-to-head series across every season.
+
+    Closed seasons come from the aggregate store (written at each rollover);
+    the live season is added from the current standings when the index is
+    built and then per recorded game, so every lookup is a dict access.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.head_to_head = {}
+        self.live_played = set()
+        self.live_champion = None
+
+    def _record(self, user_id):
+        return self.records.setdefault(user_id, new_all_time_record())
+
+    def add_live_record(self, user_id, record):
+        """Add a team's live season record"""
+        if record['wins'] + record['losses'] == 0:
+            return
+        totals = self._record(user_id)
+        for key in ('wins', 'losses', 'points_for', 'points_against'):
+            totals[key] += record[key]
+        self.live_played.add(user_id)
+
+    def add_game(self, game):
+        """Apply one live game to both teams and the series"""
+        self.add_live_record(game['winner_id'], {
+            'wins': 1, 'losses': 0, 'points_for': game['winner_score'], 'points_against': game['loser_score']
+        })
+        self.add_live_record(game['loser_id'], {
+            'wins': 0, 'losses': 1, 'points_for': game['loser_score'], 'points_against': game['winner_score']
+        })
+        key = (game['winner_id'], game['loser_id'])
+        self.head_to_head[key] = self.head_to_head.get(key, 0) + 1
+
+    def record(self, user_id):
+        """Get a team's all-time record, counting the live season and title"""
+        totals = dict(self.records.get(user_id) or new_all_time_record())
+        if user_id in self.live_played:
+            totals['seasons'] += 1
+        if user_id == self.live_champion:
+            totals['championships'] += 1
+        return totals
+
+    def series(self, team1_id, team2_id):
+        """Get (team1 wins, team2 wins) across every season"""
+        return self.head_to_head.get((team1_id, team2_id), 0), self.head_to_head.get((team2_id, team1_id), 0)
+
+    @classmethod
+    def build(cls, closed_records, closed_head_to_head, standings, head_to_head_data, champion_id=None):
+        """Build from the closed-season aggregates plus the live standings and head-to-head"""
+        index = cls()
+        for user_id, record in closed_records.items():
+            totals = index._record(user_id)
+            for key in totals:
+                totals[key] += record.get(key) or 0
+        for key, wins in closed_head_to_head.items():
+            parts = key.split('_')
+            if len(parts) == 2:
+                index.head_to_head[tuple(parts)] = wins
+
+        for user_id, record in standings.items():
+            index.add_live_record(user_id, record)
+        for key, data in head_to_head_data.items():
+            parts = key.split('_')
+            if len(parts) == 2:
+                index.head_to_head[tuple(parts)] = index.head_to_head.get(tuple(parts), 0) + data.get('wins', 0)
+
+        index.live_champion = champion_id
+        return index
+
+async def get_all_time_aggregates():
+    """Get (records, head_to_head) over closed seasons from database or JSON"""
+    if db.pool:
+        return await asyncio.gather(db.get_all_time_records(), db.get_all_time_head_to_head())
+    all_time = load_json(ALL_TIME_FILE, {"teams": {}, "head_to_head": {}})
+    return all_time['teams'], all_time['head_to_head']
+
+async def get_all_time_index():
+    """Get the all-time index, building it from storage on first use"""
+    cache = league_cache()
+    if cache.all_time_index is None:
+        (closed_records, closed_head_to_head), (_, standings, head_to_head_data, config) = await asyncio.gather(
+            get_all_time_aggregates(), get_league_snapshot_data()
+        )
+        bracket = await get_playoff_bracket(config.get('season', 1))
+        champion = bracket['champion']['user_id'] if bracket and bracket.get('champion') else None
+        cache.all_time_index = AllTimeIndex.build(
+            closed_records, closed_head_to_head, standings, head_to_head_data, champion
+        )
+    return cache.all_time_index
+
+def format_win_pct(wins, losses):
+    """Format a winning percentage like .625"""
+    games = wins + losses
+    if not games:
+        return ".000"
+    return f"{wins / games:.3f}".lstrip('0')
+
+@bot.tree.command(name="all_time", description="View all-time records across every season")
+@app_commands.describe(team="Team abbreviation (default: all-time leaders)")
+@app_commands.autocomplete(team=team_abbreviation_autocomplete)
+async def all_time(interaction: discord.Interaction, team: Optional[str] = None):
+    """Display a team's all-time record, or the all-time wins leaders"""
+    teams_index = await get_team_index()
+    index = await get_all_time_index()
+
+    if team:
+        team_id = teams_index.owner_by_abbr(team)
+        if not team_id:
+            await interaction.response.send_message(
+                f"❌ No team found with abbreviation **{team.upper()}**!",
+                ephemeral=True
+            )
+            return
+
+        record = index.record(team_id)
+        team_info = teams_index.teams[team_id]
+        embed = discord.Embed(
+            title=f"📜 {team_info['name']} ({team_info['abbreviation']}) - All Time",
+            color=discord.Color.gold()
+        )
+        embed.add_field(name="Record", value=f"{record['wins']}-{record['losses']}", inline=True)
+        embed.add_field(name="Win %", value=format_win_pct(record['wins'], record['losses']), inline=True)
+        embed.add_field(name="Seasons", value=str(record['seasons']), inline=True)
+        embed.add_field(name="Points For", value=str(record['points_for']), inline=True)
+        embed.add_field(name="Points Against", value=str(record['points_against']), inline=True)
+        embed.add_field(name="🏆 Championships", value=str(record['championships']), inline=True)
+        await interaction.response.send_message(embed=embed)
+        return
+
+    leaders = heapq.nlargest(
+        ALL_TIME_LEADERS,
+        ((user_id, index.record(user_id)) for user_id in teams_index.teams),
+        key=lambda x: (x[1]['championships'], x[1]['wins'], -x[1]['losses'])
+    )
+    leaders = [(user_id, record) for user_id, record in leaders if record['wins'] + record['losses']]
+
+    if not leaders:
+        await interaction.response.send_message("❌ No games have been played yet!", ephemeral=True)
+        return
+
+    lines = []
+    for place, (user_id, record) in enumerate(leaders, 1):
+        titles = f" 🏆×{record['championships']}" if record['championships'] else ""
+        lines.append(
+            f"{place}. **{teams_index.teams[user_id]['abbreviation']}** {record['wins']}-{record['losses']} "
+            f"({format_win_pct(record['wins'], record['losses'])}){titles}"
+        )
+
+    embed = discord.Embed(
+        title="📜 All-Time Leaders",
+        description="\n".join(lines),
+        color=discord.Color.gold()
+    )
+    embed.set_footer(text="Championships, then wins | Includes the current season")
+    await interaction.response.send_message(embed=embed)
+
+@bot.tree.command(name="rivalry_history", description="View the all-time series between two teams")
+@app_commands.describe(team1="First team's abbreviation", team2="Second team's abbreviation")
+@app_commands.autocomplete(team1=team_abbreviation_autocomplete, team2=team_abbreviation_autocomplete)
+async def rivalry_history(interaction: discord.Interaction, team1: str, team2: str):
+    """Display the all-time head-to-head series between two teams"""
+    teams_index = await get_team_index()
+    team1_id = teams_index.owner_by_abbr(team1)
+    team2_id = teams_index.owner_by_abbr(team2)
+
+    for abbr, team_id in ((team1, team1_id), (team2, team2_id)):
+        if not team_id:
+            await interaction.response.send_message(
+                f"❌ No team found with abbreviation **{abbr.upper()}**!",
+                ephemeral=True
+            )
+            return
+
+    if team1_id == team2_id:
+        await interaction.response.send_message("❌ Pick two different teams!", ephemeral=True)
+        return
+
+    index = await get_all_time_index()
+    team1_wins, team2_wins = index.series(team1_id, team2_id)
+    abbr1 = teams_index.teams[team1_id]['abbreviation']
+    abbr2 = teams_index.teams[team2_id]['abbreviation']
+
+    if team1_wins == team2_wins:
+        summary = f"Series tied {team1_wins}-{team2_wins}" if team1_wins else "These teams have never met."
+    elif team1_wins > team2_wins:
+        summary = f"**{abbr1}** leads the series {team1_wins}-{team2_wins}"
+    else:
+        summary = f"**{abbr2}** leads the series {team2_wins}-{team1_wins}"
+
+    embed = discord.Embed(
+        title=f"⚔️ {abbr1} vs {abbr2} - All Time",
+        description=summary,
+        color=discord.Color.dark_red()
+    )
+    embed.add_field(name=f"{abbr1} Wins", value=str(team1_wins), inline=True)
+    embed.add_field(name=f"{abbr2} Wins", value=str(team2_wins), inline=True)
+    embed.set_footer(text="Includes the current season")
+    await interaction.response.send_message(embed=embed)
+
+# ==================== SHARDS ====================
+
+SHARD_STATUS_COLUMNS = [('Shard', 7), ('Ping', 8), ('Servers', 9), ('Cached', 8), ('Cmds', 8), ('Drops', 7), ('Up', 10)]
+
+def format_uptime(since):
+    """Format the time since a moment as 3d 4h / 5h 12m / 7m"""
+    if since is None:
+        return "-"
+    minutes = int((datetime.utcnow() - since).total_seconds() // 60)
+    days, minutes = divmod(minutes, 1440)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+@bot.tree.command(name="shard_status", description="View gateway shard health (Admin only)")
+@is_admin()
+async def shard_status(interaction: discord.Interaction):
+    """Display per-shard latency, servers, cached leagues, commands and disconnects"""
+    latencies = dict(bot.latencies) if SHARDED else {0: bot.latency}
+    servers = {}
+    for guild in bot.guilds:
+        shard_id = guild.shard_id or 0
+        servers[shard_id] = servers.get(shard_id, 0) + 1
+
+    rows = []
+    for shard_id in sorted(set(latencies) | set(shard_metrics)):
+        metrics = get_shard_metrics(shard_id)
+        latency = latencies.get(shard_id)
+        rows.append((
+            str(shard_id),
+            f"{latency * 1000:.0f}ms" if latency is not None and math.isfinite(latency) else "-",
+            str(servers.get(shard_id, 0)),
+            str(len(league_caches.get(shard_id, {}))),
+            str(metrics.commands),
+            str(metrics.disconnects),
+            format_uptime(metrics.ready_at)
+        ))
+
+    embed = discord.Embed(
+        title="🛰️ Shard Status",
+        description=render_table(SHARD_STATUS_COLUMNS, rows[:TABLE_ROWS_PER_PAGE]),
+        color=discord.Color.blurple()
+    )
+    mode = f"{bot.shard_count} shard(s)" if SHARDED else "Unsharded"
+    embed.set_footer(text=f"{mode} | {len(bot.guilds)} server(s) | This server: shard {shard_of(interaction.guild_id)}")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+# ==================== OUTBOX ====================
+
+# Discord side-effects of league changes, by name. Each one refreshes a channel
+# from the league's current state, so running it late or twice is harmless.
+SIDE_EFFECTS = {
+    'teams_list': update_teams_list,
+    'power_rankings': update_power_rankings_channel
+}
+
+class OutboxEntry:
+    """A side-effect waiting to be carried out"""
+
+    def __init__(self, requested_at, due):
+        self.requested_at = requested_at
+        self.due = due
+        self.attempts = 0
+
+# (guild ID, effect) -> OutboxEntry for the leagues this instance serves. The
+# stored outbox (database table or JSON file) is what survives a restart.
+outbox = {}
+
+def schedule_side_effect(guild_id, effect, requested_at):
+    """Add a side-effect to the worker's queue, merging it with one already waiting"""
+    entry = outbox.get((guild_id, effect))
+    if entry is None:
+        due = asyncio.get_running_loop().time() + OUTBOX_COALESCE_SECONDS
+        outbox[(guild_id, effect)] = OutboxEntry(requested_at, due)
+    else:
+        entry.requested_at = max(entry.requested_at, requested_at)
+
+async def queue_side_effect(effect):
+    """Record a Discord side-effect for the league in scope; the outbox worker carries it out"""
+    requested_at = datetime.utcnow()
+    if db.pool:
+        await db.add_outbox_effect(effect, requested_at)
+    else:
+        pending = load_json(OUTBOX_FILE)
+        pending[effect] = requested_at.isoformat()
+        save_json(OUTBOX_FILE, pending)
+    schedule_side_effect(db.league_id(), effect, requested_at)
+
+async def restore_outbox(guild):
+    """Queue the side-effects a previous run left unfinished"""
+    with league_scope(guild.id):
+        if db.pool:
+            pending = await db.get_outbox_effects()
+        else:
+            pending = {effect: datetime.fromisoformat(at) for effect, at in load_json(OUTBOX_FILE).items()}
+        for effect, requested_at in pending.items():
+            if effect in SIDE_EFFECTS:
+                schedule_side_effect(db.league_id(), effect, requested_at)
+
+async def clear_side_effect(effect, requested_at):
+    """Remove a finished side-effect from the stored outbox unless it was requested again since"""
+    if db.pool:
+        await db.delete_outbox_effect(effect, requested_at)
+    else:
+        pending = load_json(OUTBOX_FILE)
+        if effect in pending and datetime.fromisoformat(pending[effect]) <= requested_at:
+            del pending[effect]
+            save_json(OUTBOX_FILE, pending)
+
+def side_effect_retry_delay(error, attempts):
+    """Seconds to wait before retrying a failed side-effect"""
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    return min(OUTBOX_RETRY_SECONDS * 2 ** (attempts - 1), OUTBOX_MAX_BACKOFF_SECONDS)
+
+async def run_side_effect(guild_id, effect, entry):
+    """Carry out one side-effect, rescheduling it if it fails or was requested again meanwhile"""
+    loop = asyncio.get_running_loop()
+    guild = bot.get_guild(int(guild_id))
+    requested_at = entry.requested_at
+    with league_scope(guild_id):
+        # A server the bot has left has nothing to update
+        if guild is not None:
+            try:
+                await SIDE_EFFECTS[effect](guild)
+            except Exception as e:
+                entry.attempts += 1
+                if entry.attempts < OUTBOX_MAX_ATTEMPTS:
+                    entry.due = loop.time() + side_effect_retry_delay(e, entry.attempts)
+                    print(f'Side-effect {effect} failed for {guild.name} (attempt {entry.attempts}): {e}')
+                    return
+                print(f'Giving up on side-effect {effect} for {guild.name}: {e}')
+
+        if entry.requested_at > requested_at:
+            # The league changed again while this ran; refresh once more
+            entry.attempts = 0
+            entry.due = loop.time() + OUTBOX_COALESCE_SECONDS
+            return
+        del outbox[(guild_id, effect)]
+        await clear_side_effect(effect, requested_at)
+
+@tasks.loop(seconds=OUTBOX_POLL_SECONDS)
+async def drain_outbox():
+    """Carry out due side-effects, a few per pass so bursts are spread under Discord's rate limits"""
+    now = asyncio.get_running_loop().time()
+    due = sorted((entry.due, key) for key, entry in outbox.items() if entry.due <= now)
+    for _, (guild_id, effect) in due[:OUTBOX_BATCH]:
+        await run_side_effect(guild_id, effect, outbox[(guild_id, effect)])
+
+# ==================== BACKUPS ====================
+
+# Manual and scheduled backups never run at the same time
+backup_lock = asyncio.Lock()
+
+async def run_backup():
+    """Write a new backup archive of the league in scope and prune old ones.
+
+    Returns (path, row counts, removed files).
+    """
+    backup_dir = league_path(BACKUP_DIR)
+    async with backup_lock:
+        path, counts = await league_backup.export_league(backup_dir, league_dir())
+        removed = await asyncio.to_thread(league_backup.prune_backups, backup_dir, BACKUP_KEEP)
+    return path, counts, removed
+
+@tasks.loop(hours=BACKUP_INTERVAL_HOURS)
+async def scheduled_backup():
+    """Back up every league on a schedule"""
+    for guild in bot.guilds:
+        with league_scope(guild.id):
+            try:
+                path, counts, removed = await run_backup()
+                print(
+                    f'💾 Backup written for {guild.name}: {os.path.basename(path)} '
+                    f'({sum(counts.values())} rows, {len(removed)} pruned)'
+                )
+            except Exception as e:
+                print(f'Scheduled backup failed for {guild.name}: {e}')
+
+def format_backup_counts(counts):
+    """Format per-table row counts"""
+    return "\n".join(f"{table}: {counts.get(table, 0)}" for table in league_backup.BACKUP_TABLES)
+
+async def backup_autocomplete(interaction: discord.Interaction, current: str):
+    """Autocomplete backup archive names"""
+    return [
+        app_commands.Choice(name=name, value=name)
+        for name in league_backup.list_backups(league_path(BACKUP_DIR)) if current.lower() in name.lower()
+    ][:25]
+
+@bot.tree.command(name="backup", description="Back up the league now (Admin only)")
+@is_admin()
+async def backup_command(interaction: discord.Interaction):
+    """Write a backup archive immediately"""
+    await interaction.response.defer(ephemeral=True)
+
+    try:
+        path, counts, removed = await run_backup()
+    except Exception as e:
+        await interaction.followup.send(f"❌ Backup failed: {str(e)}", ephemeral=True)
+        return
+
+    embed = discord.Embed(
+        title="💾 Backup Complete",
+        description=f"`{os.path.basename(path)}` ({os.path.getsize(path) / 1024:.1f} KB)",
+        color=discord.Color.green()
+    )
+    embed.add_field(name="Rows", value=format_backup_counts(counts), inline=False)
+    embed.set_footer(text=f"Keeping the newest {BACKUP_KEEP} backups | {len(removed)} pruned")
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+@bot.tree.command(name="restore_backup", description="Replace all league data with a backup (Admin only)")
+@is_admin()
+@app_commands.describe(backup="Backup archive to restore")
+@app_commands.autocomplete(backup=backup_autocomplete)
+async def restore_backup(interaction: discord.Interaction, backup: str):
+    """Restore teams, standings, games, head-to-head and config from a backup archive"""
+    if backup not in league_backup.list_backups(league_path(BACKUP_DIR)):
+        await interaction.response.send_message(f"❌ No backup named **{backup}**!", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    try:
+        async with backup_lock:
+            counts = await league_backup.restore_league(league_path(os.path.join(BACKUP_DIR, backup)), league_dir())
+    except Exception as e:
+        await interaction.followup.send(f"❌ Restore failed, nothing was changed: {str(e)}", ephemeral=True)
+        return
+
+    drop_league_cache()
+
+    embed = discord.Embed(
+        title="♻️ League Restored",
+        description=f"Restored from `{backup}`",
+        color=discord.Color.green()
+    )
+    embed.add_field(name="Rows", value=format_backup_counts(counts), inline=False)
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
 # ==================== HELP ====================
 
 @bot.tree.command(name="help", description="View all available commands")
@@ -1483,7 +5251,8 @@ async def help_command(interaction: discord.Interaction):
         value=(
             "`/register_team` - Register your team\n"
             "`/teams` - View all teams\n"
-            "`/my_team` - View your team info"
+            "`/my_team` - View your team info\n"
+            "`/team_profile` - View form, streak and splits"
         ),
         inline=False
     )
@@ -1492,9 +5261,21 @@ async def help_command(interaction: discord.Interaction):
         name="🏆 Standings & Results",
         value=(
             "`/standings` - View league standings\n"
+            "`/division_standings` - View division and conference standings\n"
+            "`/schedule` - View a week's or a team's schedule\n"
+            "`/week_status` - See which games are still unreported\n"
+            "`/playoff_seeds` - View the current playoff picture\n"
+            "`/playoff_bracket` - View the playoff bracket\n"
             "`/power_rankings` - View power rankings\n"
+            "`/rank_movement` - View weekly rank movement\n"
+            "`/rank_history` - View a team's rank trajectory\n"
+            "`/head_to_head` - View a head-to-head rivalry\n"
+            "`/all_time` - View all-time records\n"
+            "`/rivalry_history` - View an all-time series\n"
             "`/report_my_game` - Report your game result\n"
-            "`/recent_games` - View recent results"
+            "`/recent_games` - View recent results\n"
+            "`/game_log` - Browse the full game history\n"
+            "`/leaders` - View league leaderboards"
         ),
         inline=False
     )
@@ -1510,11 +5291,22 @@ async def help_command(interaction: discord.Interaction):
         value=(
             "`/report_game` - Report a game result\n"
             "`/announce_sim` - Announce sim advance\n"
+            "`/generate_schedule` - Generate the season schedule\n"
+            "`/remind_unreported` - DM owners who owe results\n"
+            "`/import_results` - Import a CSV/JSON file of results\n"
+            "`/pending_reports` - Review duplicate game reports\n"
+            "`/resolve_report` - Keep or replace a reported result\n"
+            "`/generate_playoffs` - Seed the playoffs and draw the bracket\n"
+            "`/report_playoff_game` - Report a playoff result\n"
             "`/advance_week` - Advance to next week\n"
             "`/set_season` - Set current season\n"
+            "`/rollover_season` - Archive the season and start the next\n"
             "`/assign_team` - Assign team to any user\n"
             "`/reassign_team` - Transfer team to new owner\n"
             "`/remove_team` - Remove a team from league\n"
+            "`/backup` - Back up the league now\n"
+            "`/restore_backup` - Restore the league from a backup\n"
+            "`/shard_status` - View gateway shard health\n"
             "`/reset_league` - Reset all data"
         ),
         inline=False
@@ -1527,6 +5319,7 @@ async def help_command(interaction: discord.Interaction):
             "`/create_team_channel` - Create private team channel\n"
             "`/create_all_team_channels` - Create channels for all teams\n"
             "`/create_matchup` - Create matchup channel for two teams\n"
+            "`/create_playoff_matchups` - Create channels for the playoff round\n"
             "`/archive_matchups` - Delete old week matchup channels\n"
             "`/update_teams_roster` - Update teams roster in #teams\n"
             "`/post_welcome` - Post welcome message\n"
@@ -1837,9 +5630,10 @@ async def create_all_team_channels(interaction: discord.Interaction):
             category = await interaction.guild.create_category("🏈 Team Channels")
         
         created_channels = []
+        members = await resolve_members(interaction.guild, teams)
         
         for user_id, team in teams.items():
-            member = interaction.guild.get_member(int(user_id))
+            member = members[user_id]
             if not member:
                 continue
             
@@ -1912,6 +5706,63 @@ async def create_all_team_channels(interaction: discord.Interaction):
             ephemeral=True
         )
 
+async def open_matchup_channel(guild, category, label, channel_prefix, team1, member1, team2, member2,
+                               report_hint="Winner reports the result with `/report_my_game`"):
+    """Create a private matchup channel for two owners and post the matchup announcement"""
+    # Create channel name
+    channel_name = f"{channel_prefix}-{team1['abbreviation'].lower()}-vs-{team2['abbreviation'].lower()}"
+    
+    # Set permissions - only the two team owners and admins can see
+    overwrites = {
+        guild.default_role: discord.PermissionOverwrite(read_messages=False),
+        member1: discord.PermissionOverwrite(read_messages=True, send_messages=True),
+        member2: discord.PermissionOverwrite(read_messages=True, send_messages=True),
+        guild.me: discord.PermissionOverwrite(read_messages=True)
+    }
+    
+    # Create the channel
+    channel = await guild.create_text_channel(
+        channel_name,
+        category=category,
+        topic=f"{label}: {team1['name']} vs {team2['name']}",
+        overwrites=overwrites
+    )
+    
+    # Send matchup announcement in the channel
+    matchup_embed = discord.Embed(
+        title=f"🏈 {label} Matchup",
+        description=f"{member1.mention} vs {member2.mention}",
+        color=discord.Color.orange()
+    )
+    matchup_embed.add_field(
+        name="Matchup",
+        value=f"**{team1['name']}** ({team1['abbreviation']})\n🆚\n**{team2['name']}** ({team2['abbreviation']})",
+        inline=False
+    )
+    matchup_embed.add_field(
+        name="⏰ What You Need to Do:",
+        value=(
+            "1️⃣ Coordinate a time to play your game\n"
+            f"2️⃣ Play your {label} matchup\n"
+            f"3️⃣ {report_hint}"
+        ),
+        inline=False
+    )
+    matchup_embed.add_field(
+        name="💬 Use This Channel To:",
+        value=(
+            "• Schedule your game time\n"
+            "• Communicate with your opponent\n"
+            "• Discuss any issues\n"
+            "• Coordinate reschedules if needed"
+        ),
+        inline=False
+    )
+    matchup_embed.set_footer(text="Good luck to both teams! 🏆")
+    
+    await channel.send(embed=matchup_embed)
+    return channel
+
 @bot.tree.command(name="create_matchup", description="Create a matchup channel for two teams (Admin only)")
 @is_admin()
 @app_commands.describe(
@@ -1919,21 +5770,17 @@ async def create_all_team_channels(interaction: discord.Interaction):
     team2_abbr="Second team's abbreviation (e.g., BUF)",
     week="Week number for this matchup"
 )
+@app_commands.autocomplete(team1_abbr=team_abbreviation_autocomplete, team2_abbr=team_abbreviation_autocomplete)
 async def create_matchup(interaction: discord.Interaction, team1_abbr: str, team2_abbr: str, week: int):
     """Create a private matchup channel for two teams to schedule their game"""
     teams = await get_teams_data()
     
     # Find teams by abbreviation
-    team1_id = None
-    team2_id = None
     team1_abbr_upper = team1_abbr.upper()
     team2_abbr_upper = team2_abbr.upper()
-    
-    for user_id, team in teams.items():
-        if team['abbreviation'].upper() == team1_abbr_upper:
-            team1_id = user_id
-        if team['abbreviation'].upper() == team2_abbr_upper:
-            team2_id = user_id
+    index = await get_team_index()
+    team1_id = index.owner_by_abbr(team1_abbr_upper)
+    team2_id = index.owner_by_abbr(team2_abbr_upper)
     
     if not team1_id:
         await interaction.response.send_message(
@@ -1960,8 +5807,8 @@ async def create_matchup(interaction: discord.Interaction, team1_abbr: str, team
     team2 = teams[team2_id]
     
     # Get Discord members
-    member1 = interaction.guild.get_member(int(team1_id))
-    member2 = interaction.guild.get_member(int(team2_id))
+    member1 = await resolve_member(interaction.guild, team1_id)
+    member2 = await resolve_member(interaction.guild, team2_id)
     
     if not member1 or not member2:
         await interaction.response.send_message(
@@ -1978,58 +5825,9 @@ async def create_matchup(interaction: discord.Interaction, team1_abbr: str, team
         if not category:
             category = await interaction.guild.create_category("🎮 Week Matchups")
         
-        # Create channel name
-        channel_name = f"week{week}-{team1['abbreviation'].lower()}-vs-{team2['abbreviation'].lower()}"
-        
-        # Set permissions - only the two team owners and admins can see
-        overwrites = {
-            interaction.guild.default_role: discord.PermissionOverwrite(read_messages=False),
-            member1: discord.PermissionOverwrite(read_messages=True, send_messages=True),
-            member2: discord.PermissionOverwrite(read_messages=True, send_messages=True),
-            interaction.guild.me: discord.PermissionOverwrite(read_messages=True)
-        }
-        
-        # Create the channel
-        channel = await interaction.guild.create_text_channel(
-            channel_name,
-            category=category,
-            topic=f"Week {week}: {team1['name']} vs {team2['name']}",
-            overwrites=overwrites
-        )
-        
-        # Send matchup announcement in the channel
-        matchup_embed = discord.Embed(
-            title=f"🏈 Week {week} Matchup",
-            description=f"{member1.mention} vs {member2.mention}",
-            color=discord.Color.orange()
-        )
-        matchup_embed.add_field(
-            name="Matchup",
-            value=f"**{team1['name']}** ({team1['abbreviation']})\n🆚\n**{team2['name']}** ({team2['abbreviation']})",
-            inline=False
-        )
-        matchup_embed.add_field(
-            name="⏰ What You Need to Do:",
-            value=(
-                "1️⃣ Coordinate a time to play your game\n"
-                "2️⃣ Play your Week {week} matchup\n"
-                "3️⃣ Winner reports the result with `/report_my_game`"
-            ).format(week=week),
-            inline=False
-        )
-        matchup_embed.add_field(
-            name="💬 Use This Channel To:",
-            value=(
-                "• Schedule your game time\n"
-                "• Communicate with your opponent\n"
-                "• Discuss any issues\n"
-                "• Coordinate reschedules if needed"
-            ),
-            inline=False
+        channel = await open_matchup_channel(
+            interaction.guild, category, f"Week {week}", f"week{week}", team1, member1, team2, member2
         )
-        matchup_embed.set_footer(text="Good luck to both teams! 🏆")
-        
-        await channel.send(embed=matchup_embed)
         
         # Confirm to admin
         confirm_embed = discord.Embed(
@@ -2260,29 +6058,7 @@ async def post_welcome(interaction: discord.Interaction):
 @bot.tree.command(name="available_teams", description="View all available NFL teams")
 async def available_teams(interaction: discord.Interaction):
     """Display all available NFL teams"""
-    teams = await get_teams_data()
-    
-    # Get list of taken team names and abbreviations
-    taken_teams = set()
-    taken_abbrs = set()
-    for team_data in teams.values():
-        taken_teams.add(team_data['name'].lower())
-        taken_abbrs.add(team_data['abbreviation'].upper())
-    
-    # Helper function to check if a team is taken
-    def is_team_taken(nfl_team, abbr):
-        nfl_lower = nfl_team.lower()
-        # Check exact match
-        if nfl_lower in taken_teams:
-            return True
-        # Check if abbreviation is taken
-        if abbr in taken_abbrs:
-            return True
-        # Check if any taken team name is part of the NFL team name
-        for taken in taken_teams:
-            if taken in nfl_lower or nfl_lower in taken:
-                return True
-        return False
+    index = await get_team_index()
     
     # Build available teams by division
     embed = discord.Embed(
@@ -2302,7 +6078,7 @@ async def available_teams(interaction: discord.Interaction):
         afc_text += f"\n**{division}**\n"
         for team in NFL_TEAMS[division]:
             abbr = TEAM_ABBREVIATIONS[team]
-            is_taken = is_team_taken(team, abbr)
+            is_taken = index.is_nfl_team_taken(team)
             if is_taken:
                 taken_count += 1
             status = "❌" if is_taken else "✅"
@@ -2316,7 +6092,7 @@ async def available_teams(interaction: discord.Interaction):
         nfc_text += f"\n**{division}**\n"
         for team in NFL_TEAMS[division]:
             abbr = TEAM_ABBREVIATIONS[team]
-            is_taken = is_team_taken(team, abbr)
+            is_taken = index.is_nfl_team_taken(team)
             if is_taken:
                 taken_count += 1
             status = "❌" if is_taken else "✅"
@@ -2346,29 +6122,7 @@ async def available_teams(interaction: discord.Interaction):
 ])
 async def available_by_division(interaction: discord.Interaction, division: str):
     """Display available teams in a specific division"""
-    teams = load_json(TEAMS_FILE)
-    
-    # Get list of taken team names and abbreviations
-    taken_teams = set()
-    taken_abbrs = set()
-    for team_data in teams.values():
-        taken_teams.add(team_data['name'].lower())
-        taken_abbrs.add(team_data['abbreviation'].upper())
-    
-    # Helper function to check if a team is taken
-    def is_team_taken(nfl_team, abbr):
-        nfl_lower = nfl_team.lower()
-        # Check exact match
-        if nfl_lower in taken_teams:
-            return True
-        # Check if abbreviation is taken
-        if abbr in taken_abbrs:
-            return True
-        # Check if any taken team name is part of the NFL team name
-        for taken in taken_teams:
-            if taken in nfl_lower or nfl_lower in taken:
-                return True
-        return False
+    index = await get_team_index()
     
     embed = discord.Embed(
         title=f"🏈 {division}",
@@ -2382,7 +6136,7 @@ async def available_by_division(interaction: discord.Interaction, division: str)
     
     for team in division_teams:
         abbr = TEAM_ABBREVIATIONS[team]
-        if is_team_taken(team, abbr):
+        if index.is_nfl_team_taken(team):
             taken_list.append(f"❌ {team} ({abbr})")
         else:
             available_list.append(f"✅ {team} ({abbr})")
@@ -2406,4 +6160,10 @@ if __name__ == "__main__":
         print("Please set your Discord bot token as an environment variable.")
         exit(1)
     
+    if STANDBY:
+        discord.utils.setup_logging()
+        asyncio.run(serve_as_standby(TOKEN))
+        # Only reached when another instance took the gateway lock; exit so the process is restarted as a standby
+        exit(1)
+    
     bot.run(TOKEN)
@@ -4,16 +4,32 @@ Handles all database operations for the Madden League Bot
 """
 
 import os
+import asyncio
 import asyncpg
+import copy
+import functools
 import json
-from typing import Optional, Dict, List
+import socket
+import time
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import AsyncIterator, Optional, Dict, List, Tuple
 
 # Database connection pool
 pool = None
 
 async def init_db():
-    """Initialize database connection pool and create tables"""
-    global pool
+    """Initialize database connection pool and create tables.
+
+    A database that is down at startup doesn't send the bot to the JSON files:
+    it runs offline (see OFFLINE MODE) and creates the tables once it is back.
+    """
+    global pool, tables_ready
+    if pool:
+        return True
     
     database_url = os.getenv('DATABASE_URL')
     if not database_url:
@@ -22,37 +38,66 @@ async def init_db():
     
     try:
         # Create connection pool
-        pool = await asyncpg.create_pool(database_url, min_size=1, max_size=10)
+        pool = await asyncpg.create_pool(
+            database_url, min_size=1, max_size=10, timeout=CONNECT_TIMEOUT_SECONDS
+        )
         print("✅ Connected to Supabase database")
-        
+    except Exception as e:
+        print(f"❌ Database connection failed: {e}")
+        try:
+            # Stay on the database rather than splitting the league across two
+            # stores; connections are opened on demand once it is back
+            pool = await asyncpg.create_pool(
+                database_url, min_size=0, max_size=10, timeout=CONNECT_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            print(f"❌ Invalid database configuration: {e}")
+            return False
+        breaker.trip()
+    
+    load_write_log()
+    try:
         # Create tables
         await create_tables()
-        return True
+        tables_ready = True
+    except DatabaseUnavailable:
+        pass
     except Exception as e:
-        print(f"❌ Database connection failed: {e}")
+        print(f"❌ Error creating tables: {e}")
         return False
+    return True
 
 async def create_tables():
     """Create all necessary database tables"""
-    async with pool.acquire() as conn:
+    async with acquire() as conn:
+        # Deployments from before leagues were scoped by guild are converted first
+        await scope_legacy_tables(conn)
+        
         # Teams table
         await conn.execute('''
             CREATE TABLE IF NOT EXISTS teams (
-                user_id TEXT PRIMARY KEY,
+                guild_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
                 name TEXT NOT NULL,
-                abbreviation TEXT NOT NULL UNIQUE,
-                created_at TIMESTAMP DEFAULT NOW()
+                abbreviation TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT NOW(),
+                PRIMARY KEY (guild_id, user_id),
+                UNIQUE (guild_id, abbreviation)
             )
         ''')
         
         # Standings table
         await conn.execute('''
             CREATE TABLE IF NOT EXISTS standings (
-                user_id TEXT PRIMARY KEY REFERENCES teams(user_id) ON DELETE CASCADE,
+                guild_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
                 wins INTEGER DEFAULT 0,
                 losses INTEGER DEFAULT 0,
                 points_for INTEGER DEFAULT 0,
-                points_against INTEGER DEFAULT 0
+                points_against INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, user_id),
+                FOREIGN KEY (guild_id, user_id) REFERENCES teams (guild_id, user_id)
+                    ON DELETE CASCADE ON UPDATE CASCADE
             )
         ''')
         
@@ -60,162 +105,852 @@ async def create_tables():
         await conn.execute('''
             CREATE TABLE IF NOT EXISTS games (
                 id SERIAL PRIMARY KEY,
+                guild_id TEXT NOT NULL,
                 week INTEGER NOT NULL,
-                winner_id TEXT REFERENCES teams(user_id),
-                loser_id TEXT REFERENCES teams(user_id),
+                winner_id TEXT,
+                loser_id TEXT,
                 winner_team TEXT,
                 winner_abbr TEXT,
                 loser_team TEXT,
                 loser_abbr TEXT,
                 winner_score INTEGER,
                 loser_score INTEGER,
-                date TIMESTAMP DEFAULT NOW()
+                date TIMESTAMP DEFAULT NOW(),
+                FOREIGN KEY (guild_id, winner_id) REFERENCES teams (guild_id, user_id) ON UPDATE CASCADE,
+                FOREIGN KEY (guild_id, loser_id) REFERENCES teams (guild_id, user_id) ON UPDATE CASCADE
             )
         ''')
+        await conn.execute('ALTER TABLE games ADD COLUMN IF NOT EXISTS season INTEGER')
+        await conn.execute('ALTER TABLE games ADD COLUMN IF NOT EXISTS home_id TEXT')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS games_date_id_idx ON games (guild_id, date DESC, id DESC)
+        ''')
+        # One result per matchup per week, whichever owner reports it
+        try:
+            await conn.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS games_matchup_key ON games
+                (guild_id, season, week, LEAST(winner_id, loser_id), GREATEST(winner_id, loser_id))
+                WHERE season IS NOT NULL
+            ''')
+        except asyncpg.UniqueViolationError:
+            print("⚠️  Duplicate games already recorded; resolve them to enable the matchup unique index")
         
         # Head to head table
         await conn.execute('''
             CREATE TABLE IF NOT EXISTS head_to_head (
                 id SERIAL PRIMARY KEY,
-                winner_id TEXT REFERENCES teams(user_id),
-                loser_id TEXT REFERENCES teams(user_id),
+                guild_id TEXT NOT NULL,
+                winner_id TEXT,
+                loser_id TEXT,
                 wins INTEGER DEFAULT 1,
-                UNIQUE(winner_id, loser_id)
+                UNIQUE (guild_id, winner_id, loser_id),
+                FOREIGN KEY (guild_id, winner_id) REFERENCES teams (guild_id, user_id) ON UPDATE CASCADE,
+                FOREIGN KEY (guild_id, loser_id) REFERENCES teams (guild_id, user_id) ON UPDATE CASCADE
             )
         ''')
         
-        # Config table
+        # Weekly ranking snapshots table
         await conn.execute('''
-            CREATE TABLE IF NOT EXISTS config (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
+            CREATE TABLE IF NOT EXISTS ranking_snapshots (
+                guild_id TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                week INTEGER NOT NULL,
+                user_id TEXT NOT NULL,
+                abbreviation TEXT,
+                rank INTEGER NOT NULL,
+                wins INTEGER DEFAULT 0,
+                losses INTEGER DEFAULT 0,
+                points_for INTEGER DEFAULT 0,
+                points_against INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, season, week, user_id)
+            )
+        ''')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS ranking_snapshots_team_idx
+            ON ranking_snapshots (guild_id, season, user_id, week)
+        ''')
+        
+        # Schedule table (one row per scheduled game)
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS schedule (
+                guild_id TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                week INTEGER NOT NULL,
+                home_id TEXT NOT NULL,
+                away_id TEXT NOT NULL,
+                home_abbr TEXT,
+                away_abbr TEXT,
+                PRIMARY KEY (guild_id, season, week, home_id)
+            )
+        ''')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS schedule_home_idx ON schedule (guild_id, season, home_id)
+        ''')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS schedule_away_idx ON schedule (guild_id, season, away_id)
+        ''')
+        
+        # Cold storage for closed seasons
+        await conn.execute('CREATE TABLE IF NOT EXISTS games_archive (LIKE games INCLUDING DEFAULTS)')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS games_archive_season_idx ON games_archive (guild_id, season, week)
+        ''')
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS season_standings (
+                guild_id TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                user_id TEXT NOT NULL,
+                abbreviation TEXT,
+                wins INTEGER DEFAULT 0,
+                losses INTEGER DEFAULT 0,
+                points_for INTEGER DEFAULT 0,
+                points_against INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, season, user_id)
+            )
+        ''')
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS season_head_to_head (
+                guild_id TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                winner_id TEXT NOT NULL,
+                loser_id TEXT NOT NULL,
+                wins INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, season, winner_id, loser_id)
+            )
+        ''')
+        
+        # All-time aggregates over closed seasons
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS all_time_records (
+                guild_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                wins INTEGER DEFAULT 0,
+                losses INTEGER DEFAULT 0,
+                points_for INTEGER DEFAULT 0,
+                points_against INTEGER DEFAULT 0,
+                seasons INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, user_id)
+            )
+        ''')
+        await conn.execute('ALTER TABLE all_time_records ADD COLUMN IF NOT EXISTS championships INTEGER DEFAULT 0')
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS all_time_head_to_head (
+                guild_id TEXT NOT NULL,
+                winner_id TEXT NOT NULL,
+                loser_id TEXT NOT NULL,
+                wins INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, winner_id, loser_id)
             )
         ''')
         
-        # Initialize default config if not exists
+        # Reports held for commissioner confirmation
         await conn.execute('''
-            INSERT INTO config (key, value) VALUES ('league_name', 'Madden Franchise League')
-            ON CONFLICT (key) DO NOTHING
+            CREATE TABLE IF NOT EXISTS pending_reports (
+                id SERIAL PRIMARY KEY,
+                guild_id TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                week INTEGER NOT NULL,
+                winner_id TEXT NOT NULL,
+                loser_id TEXT NOT NULL,
+                winner_score INTEGER NOT NULL,
+                loser_score INTEGER NOT NULL,
+                home_id TEXT,
+                reported_by TEXT,
+                reason TEXT,
+                created_at TIMESTAMP DEFAULT NOW()
+            )
         ''')
+        
+        # Playoff brackets table (one bracket document per season)
         await conn.execute('''
-            INSERT INTO config (key, value) VALUES ('season', '1')
-            ON CONFLICT (key) DO NOTHING
+            CREATE TABLE IF NOT EXISTS playoff_brackets (
+                guild_id TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                bracket JSONB NOT NULL,
+                updated_at TIMESTAMP DEFAULT NOW(),
+                PRIMARY KEY (guild_id, season)
+            )
         ''')
+        
+        # Last offline write each write log has replayed (see OFFLINE MODE)
         await conn.execute('''
-            INSERT INTO config (key, value) VALUES ('week', '1')
-            ON CONFLICT (key) DO NOTHING
+            CREATE TABLE IF NOT EXISTS replayed_writes (
+                log_id TEXT PRIMARY KEY,
+                seq BIGINT NOT NULL
+            )
         ''')
+        
+        # Discord side-effects waiting to be carried out, one row per kind so
+        # repeated requests coalesce
         await conn.execute('''
-            INSERT INTO config (key, value) VALUES ('admin_role', 'League Admin')
-            ON CONFLICT (key) DO NOTHING
+            CREATE TABLE IF NOT EXISTS outbox (
+                guild_id TEXT NOT NULL,
+                effect TEXT NOT NULL,
+                requested_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (guild_id, effect)
+            )
+        ''')
+        
+        # Config table
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS config (
+                guild_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (guild_id, key)
+            )
         ''')
         
         print("✅ Database tables created/verified")
 
+# ==================== OFFLINE MODE ====================
+
+# After BREAKER_THRESHOLD connection failures in a row the database is treated
+# as down: calls fail at once instead of each waiting out a connect timeout,
+# and one call every BREAKER_COOLDOWN_SECONDS is let through to probe it.
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 15
+CONNECT_TIMEOUT_SECONDS = 5
+# Writes made while the database is down are appended to the write log and
+# replayed in order, REPLAY_BATCH_SIZE per pass, once it is back
+WRITE_LOG_FILE = os.getenv('DB_WRITE_LOG', os.path.join('data', 'db_write_log.ndjson'))
+WRITE_LOG_PROGRESS_FILE = WRITE_LOG_FILE + '.replayed'
+# Names this write log in the replayed_writes table, which records how far
+# replay got in the same transaction as each write
+WRITE_LOG_ID_FILE = WRITE_LOG_FILE + '.id'
+REPLAY_BATCH_SIZE = 50
+
+# Errors that mean a connection was lost mid-query (rather than a bad query)
+CONNECTION_ERRORS = (
+    ConnectionError, asyncio.TimeoutError, asyncpg.PostgresConnectionError,
+    asyncpg.CannotConnectNowError, asyncpg.ConnectionDoesNotExistError
+)
+
+class DatabaseUnavailable(Exception):
+    """The database can't be reached right now"""
+
+class CircuitBreaker:
+    """Tracks connection failures and decides when the database is worth trying"""
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        """Whether to try the database now; while open, one call per cooldown gets through"""
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return False
+        self.opened_at = time.monotonic()
+        return True
+
+    def trip(self):
+        if self.opened_at is None:
+            print("⚠️  Database unreachable; logging writes and serving reads from memory until it is back")
+        self.opened_at = time.monotonic()
+
+    def record_success(self):
+        if self.opened_at is not None:
+            print("✅ Database reachable again")
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.threshold:
+            self.trip()
+
+breaker = CircuitBreaker(BREAKER_THRESHOLD, BREAKER_COOLDOWN_SECONDS)
+# Whether create_tables has run; not yet when the database was down at startup
+tables_ready = False
+
+# The connection a logged write is being replayed on (see replay_entry)
+replay_connection = ContextVar('replay_connection', default=None)
+
+@asynccontextmanager
+async def acquire():
+    """Get a pool connection through the circuit breaker.
+
+    Raises DatabaseUnavailable instead of waiting on a database that is down.
+    While a logged write is replayed, its writes share the replay's connection
+    and transaction.
+    """
+    conn = replay_connection.get()
+    if conn is not None:
+        try:
+            yield conn
+        except CONNECTION_ERRORS as e:
+            raise DatabaseUnavailable(str(e) or type(e).__name__) from e
+        return
+    if not breaker.allow():
+        raise DatabaseUnavailable("database unreachable")
+    try:
+        conn = await pool.acquire(timeout=CONNECT_TIMEOUT_SECONDS)
+    except Exception as e:
+        breaker.record_failure()
+        raise DatabaseUnavailable(str(e) or type(e).__name__) from e
+    try:
+        yield conn
+    except CONNECTION_ERRORS as e:
+        breaker.record_failure()
+        raise DatabaseUnavailable(str(e) or type(e).__name__) from e
+    else:
+        breaker.record_success()
+    finally:
+        await pool.release(conn)
+
+# Logged writes not yet replayed, oldest first: {'seq', 'op', 'guild_id', 'args'}
+write_log = deque()
+write_log_seq = 0
+write_log_id = None
+# Writes that can be logged, by name (the undecorated functions, used for replay)
+OFFLINE_WRITES = {}
+
+def encode_log_value(value):
+    if isinstance(value, datetime):
+        return {'$datetime': value.isoformat()}
+    raise TypeError(f"Can't log value of type {type(value).__name__}")
+
+def decode_log_value(value):
+    if '$datetime' in value:
+        return datetime.fromisoformat(value['$datetime'])
+    return value
+
+def load_write_log():
+    """Pick up writes a previous run logged but didn't replay"""
+    global write_log_seq, write_log_id
+    if os.path.exists(WRITE_LOG_ID_FILE):
+        with open(WRITE_LOG_ID_FILE, 'r') as f:
+            write_log_id = f.read().strip()
+    if not write_log_id:
+        write_log_id = uuid.uuid4().hex
+        os.makedirs(os.path.dirname(WRITE_LOG_ID_FILE) or '.', exist_ok=True)
+        with open(WRITE_LOG_ID_FILE, 'w') as f:
+            f.write(write_log_id)
+
+    replayed = 0
+    if os.path.exists(WRITE_LOG_PROGRESS_FILE):
+        with open(WRITE_LOG_PROGRESS_FILE, 'r') as f:
+            replayed = int(f.read().strip() or 0)
+    write_log_seq = replayed
+    if os.path.exists(WRITE_LOG_FILE):
+        with open(WRITE_LOG_FILE, 'r') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line, object_hook=decode_log_value)
+                    write_log_seq = max(write_log_seq, entry['seq'])
+                    if entry['seq'] > replayed:
+                        write_log.append(entry)
+    if write_log:
+        print(f"📒 {len(write_log)} logged write(s) waiting to be replayed")
+
+def log_write(op: str, args: Tuple):
+    """Append a write to the log; it reaches the database on replay"""
+    global write_log_seq
+    write_log_seq += 1
+    entry = {'seq': write_log_seq, 'op': op, 'guild_id': league_id(), 'args': list(args)}
+    os.makedirs(os.path.dirname(WRITE_LOG_FILE) or '.', exist_ok=True)
+    with open(WRITE_LOG_FILE, 'a') as f:
+        f.write(json.dumps(entry, default=encode_log_value) + "\n")
+    write_log.append(entry)
+
+def mark_replayed(seq: int):
+    with open(WRITE_LOG_PROGRESS_FILE, 'w') as f:
+        f.write(str(seq))
+    if not write_log:
+        # Everything is in the database; start the next outage with an empty file
+        open(WRITE_LOG_FILE, 'w').close()
+
+def offline_write(func):
+    """Log a write instead of losing it while the database is unreachable.
+
+    Writes also queue behind any that are still waiting to be replayed, so
+    the database always receives them in order. A logged write counts as
+    successful and is applied to the league's mirror right away.
+    """
+    OFFLINE_WRITES[func.__name__] = func
+
+    @functools.wraps(func)
+    async def write(*args):
+        if not pool:
+            return await func(*args)
+        if not write_log:
+            try:
+                done = await func(*args)
+                if done:
+                    apply_to_mirror(func.__name__, args)
+                return done
+            except DatabaseUnavailable:
+                pass
+        log_write(func.__name__, args)
+        apply_to_mirror(func.__name__, args)
+        return True
+    return write
+
+async def replayed_seq() -> int:
+    """The last logged write the database has committed (0 if none)"""
+    async with acquire() as conn:
+        return await conn.fetchval('SELECT seq FROM replayed_writes WHERE log_id = $1', write_log_id) or 0
+
+async def replay_entry(entry: Dict):
+    """Replay a logged write in one transaction with the record of its replay.
+
+    A crash between the write and marking it replayed can't apply it twice:
+    either both are committed, and replayed_seq skips it next time, or
+    neither is. Returns the write's result (False if it was rejected).
+    """
+    token = current_league.set(entry['guild_id'])
+    try:
+        async with acquire() as conn:
+            async with conn.transaction():
+                conn_token = replay_connection.set(conn)
+                try:
+                    done = await OFFLINE_WRITES[entry['op']](*entry['args'])
+                except DatabaseUnavailable:
+                    raise
+                except Exception as e:
+                    print(f"Error replaying logged write {entry['op']}: {e}")
+                    done = False
+                finally:
+                    replay_connection.reset(conn_token)
+                if done is not False:
+                    await conn.execute(
+                        '''INSERT INTO replayed_writes (log_id, seq) VALUES ($1, $2)
+                           ON CONFLICT (log_id) DO UPDATE SET seq = EXCLUDED.seq''',
+                        write_log_id, entry['seq']
+                    )
+    finally:
+        current_league.reset(token)
+    return done
+
+async def replay_write_log() -> Tuple[int, List[str]]:
+    """Send the next batch of logged writes to the database, oldest first.
+
+    Creates the tables first if the database was down at startup. Each write
+    is applied exactly once (see replay_entry). Returns how many writes were
+    replayed and the leagues with writes the database rejected (their mirrors
+    are dropped, so they are read afresh).
+    """
+    global tables_ready
+    replayed = 0
+    rejected = []
+    if not pool or (tables_ready and not write_log):
+        return replayed, rejected
+
+    try:
+        if not tables_ready:
+            await create_tables()
+            tables_ready = True
+        committed = await replayed_seq() if write_log else 0
+        while write_log and replayed < REPLAY_BATCH_SIZE:
+            entry = write_log[0]
+            # Writes up to committed reached the database before a crash kept them from being marked here
+            done = await replay_entry(entry) if entry['seq'] > committed else True
+            write_log.popleft()
+            mark_replayed(entry['seq'])
+            replayed += 1
+            if done is False:
+                print(f"Logged write {entry['op']} for league {entry['guild_id']} was rejected by the database")
+                mirrors.pop(entry['guild_id'], None)
+                rejected.append(entry['guild_id'])
+    except DatabaseUnavailable:
+        pass
+    return replayed, rejected
+
+# Guild ID -> the league's teams, standings, head-to-head and config as last
+# read, with every write since applied. Reads are served from it while the
+# database is down or writes are waiting to be replayed.
+mirrors = {}
+MIRROR_PARTS = ('teams', 'standings', 'head_to_head', 'config')
+MISSING = object()
+
+def league_mirror() -> Dict:
+    mirror = mirrors.get(league_id())
+    if mirror is None:
+        mirror = mirrors[league_id()] = dict.fromkeys(MIRROR_PARTS)
+    return mirror
+
+def mirrored_read(from_mirror, to_mirror=None):
+    """Serve a read from the league's mirror when the database can't give a current answer.
+
+    ``from_mirror(mirror, *args)`` returns the result, or MISSING if the
+    mirror doesn't hold it; ``to_mirror(mirror, result, *args)`` records a
+    fresh result.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def read(*args):
+            mirror = mirrors.get(league_id()) if pool else None
+            if mirror is not None and write_log:
+                # The database is behind the logged writes
+                result = from_mirror(mirror, *args)
+                if result is not MISSING:
+                    return copy.deepcopy(result)
+            try:
+                result = await func(*args)
+            except DatabaseUnavailable:
+                result = from_mirror(mirror, *args) if mirror is not None else MISSING
+                if result is MISSING:
+                    raise
+                return copy.deepcopy(result)
+            if pool and to_mirror and not write_log:
+                to_mirror(league_mirror(), copy.deepcopy(result), *args)
+            return result
+        return read
+    return decorator
+
+def mirror_part(part):
+    """from_mirror/to_mirror for reads returning a whole mirror part"""
+    def get(mirror):
+        return MISSING if mirror[part] is None else mirror[part]
+    def put(mirror, result):
+        mirror[part] = result
+    return get, put
+
+def mirror_row(part):
+    """from_mirror for reads returning one row of a mirror part"""
+    def get(mirror, user_id):
+        return MISSING if mirror[part] is None else mirror[part].get(user_id)
+    return get
+
+def snapshot_from_mirror(mirror, include_head_to_head=True):
+    needed = MIRROR_PARTS if include_head_to_head else ('teams', 'standings', 'config')
+    if any(mirror[part] is None for part in needed):
+        return MISSING
+    return {part: mirror[part] if part in needed else {} for part in MIRROR_PARTS}
+
+def snapshot_to_mirror(mirror, snapshot, include_head_to_head=True):
+    for part in MIRROR_PARTS:
+        if include_head_to_head or part != 'head_to_head':
+            mirror[part] = snapshot[part]
+
+def apply_to_mirror(op: str, args: Tuple):
+    """Apply a write to the league's mirror, for the parts it holds"""
+    mirror = mirrors.get(league_id())
+    if mirror is None:
+        return
+    teams, standings, head_to_head, config = (mirror[part] for part in MIRROR_PARTS)
+    if op == 'create_team':
+        user_id, name, abbreviation = args
+        if teams is not None:
+            teams[user_id] = {'user_id': user_id, 'name': name, 'abbreviation': abbreviation}
+        if standings is not None:
+            standings[user_id] = {'user_id': user_id, 'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0}
+    elif op == 'update_team' and teams is not None and args[0] in teams:
+        user_id, name, abbreviation = args
+        teams[user_id].update(name=name, abbreviation=abbreviation)
+    elif op == 'delete_team':
+        for part in (teams, standings):
+            if part is not None:
+                part.pop(args[0], None)
+    elif op == 'update_standing' and standings is not None and args[0] in standings:
+        user_id, wins, losses, points_for, points_against = args
+        standings[user_id].update(wins=wins, losses=losses, points_for=points_for, points_against=points_against)
+    elif op == 'record_game':
+        game, winner_standing, loser_standing = args
+        if standings is not None:
+            for user_id, record in ((game['winner_id'], winner_standing), (game['loser_id'], loser_standing)):
+                if user_id in standings:
+                    standings[user_id].update(
+                        {key: record[key] for key in ('wins', 'losses', 'points_for', 'points_against')}
+                    )
+        if head_to_head is not None:
+            key = f"{game['winner_id']}_{game['loser_id']}"
+            head_to_head[key] = {'wins': head_to_head.get(key, {}).get('wins', 0) + 1}
+    elif op in ('update_head_to_head', 'undo_head_to_head') and head_to_head is not None:
+        key = f"{args[0]}_{args[1]}"
+        wins = head_to_head.get(key, {}).get('wins', 0)
+        if op == 'update_head_to_head':
+            head_to_head[key] = {'wins': wins + 1}
+        elif key in head_to_head:
+            head_to_head[key] = {'wins': max(wins - 1, 0)}
+    elif op == 'set_config' and config is not None:
+        config.update(parse_config([(args[0], str(args[1]))]))
+    elif op == 'init_league' and config is not None:
+        for key, value in parse_config(DEFAULT_CONFIG.items()).items():
+            config.setdefault(key, value)
+
+# ==================== LEAGUES ====================
+
+# Every table is scoped by the Discord guild (league) that owns its rows.
+# The bot sets the league for each interaction; queries read it from here.
+current_league: ContextVar[str] = ContextVar('current_league')
+
+# Owner of rows written before leagues were scoped by guild, until a guild adopts them
+LEGACY_LEAGUE = ''
+
+# Key of each table once scoped by guild: (primary key, unique constraint).
+# None keeps the table's existing key.
+LEAGUE_TABLE_KEYS = {
+    'teams': ('guild_id, user_id', 'guild_id, abbreviation'),
+    'standings': ('guild_id, user_id', None),
+    'games': (None, None),
+    'head_to_head': (None, 'guild_id, winner_id, loser_id'),
+    'ranking_snapshots': ('guild_id, season, week, user_id', None),
+    'schedule': ('guild_id, season, week, home_id', None),
+    'games_archive': (None, None),
+    'season_standings': ('guild_id, season, user_id', None),
+    'season_head_to_head': ('guild_id, season, winner_id, loser_id', None),
+    'all_time_records': ('guild_id, user_id', None),
+    'all_time_head_to_head': ('guild_id, winner_id, loser_id', None),
+    'pending_reports': (None, None),
+    'playoff_brackets': ('guild_id, season', None),
+    'config': ('guild_id, key', None)
+}
+
+# Foreign keys to teams: (table, columns, ON DELETE action)
+TEAM_REFERENCES = [
+    ('standings', 'guild_id, user_id', 'CASCADE'),
+    ('games', 'guild_id, winner_id', 'NO ACTION'),
+    ('games', 'guild_id, loser_id', 'NO ACTION'),
+    ('head_to_head', 'guild_id, winner_id', 'NO ACTION'),
+    ('head_to_head', 'guild_id, loser_id', 'NO ACTION')
+]
+
+# Indexes that gained a guild_id column; dropped so create_tables() rebuilds them
+LEGACY_INDEXES = [
+    'games_date_id_idx', 'games_matchup_key', 'ranking_snapshots_team_idx',
+    'schedule_home_idx', 'schedule_away_idx', 'games_archive_season_idx'
+]
+
+DEFAULT_CONFIG = {
+    'league_name': 'Madden Franchise League',
+    'season': '1',
+    'week': '1',
+    'admin_role': 'League Admin'
+}
+
+def league_id() -> str:
+    """Get the guild ID of the league in scope"""
+    return current_league.get()
+
+async def scope_legacy_tables(conn):
+    """Add guild_id to tables created before leagues were scoped by guild.
+    
+    Existing rows are kept under LEGACY_LEAGUE until adopt_legacy_league()
+    hands them to a guild. Runs once, in a single transaction.
+    """
+    rows = await conn.fetch(
+        '''SELECT t.table_name FROM information_schema.tables t
+           WHERE t.table_schema = current_schema() AND t.table_name = ANY($1::text[])
+             AND NOT EXISTS (
+                 SELECT 1 FROM information_schema.columns c
+                 WHERE c.table_schema = t.table_schema AND c.table_name = t.table_name
+                   AND c.column_name = 'guild_id'
+             )''',
+        list(LEAGUE_TABLE_KEYS)
+    )
+    legacy = {row['table_name'] for row in rows}
+    if not legacy:
+        return
+    
+    print(f"🔄 Scoping {len(legacy)} table(s) by guild...")
+    async with conn.transaction():
+        if 'teams' in legacy:
+            references = await conn.fetch(
+                '''SELECT conrelid::regclass::text AS table_name, conname FROM pg_constraint
+                   WHERE contype = 'f' AND confrelid = 'teams'::regclass'''
+            )
+            for row in references:
+                await conn.execute(f'ALTER TABLE {row["table_name"]} DROP CONSTRAINT {row["conname"]}')
+        for index in LEGACY_INDEXES:
+            await conn.execute(f'DROP INDEX IF EXISTS {index}')
+        
+        for table in legacy:
+            primary_key, unique = LEAGUE_TABLE_KEYS[table]
+            await conn.execute(
+                f"ALTER TABLE {table} ADD COLUMN guild_id TEXT NOT NULL DEFAULT '{LEGACY_LEAGUE}'"
+            )
+            constraints = await conn.fetch(
+                '''SELECT conname, contype FROM pg_constraint
+                   WHERE conrelid = $1::regclass AND contype IN ('p', 'u')''',
+                table
+            )
+            for row in constraints:
+                if (row['contype'] == 'p' and primary_key) or (row['contype'] == 'u' and unique):
+                    await conn.execute(f'ALTER TABLE {table} DROP CONSTRAINT {row["conname"]}')
+            if primary_key:
+                await conn.execute(f'ALTER TABLE {table} ADD PRIMARY KEY ({primary_key})')
+            if unique:
+                await conn.execute(f'ALTER TABLE {table} ADD UNIQUE ({unique})')
+        
+        if 'teams' in legacy:
+            for table, columns, on_delete in TEAM_REFERENCES:
+                await conn.execute(
+                    f'''ALTER TABLE {table} ADD FOREIGN KEY ({columns})
+                        REFERENCES teams (guild_id, user_id) ON DELETE {on_delete} ON UPDATE CASCADE'''
+                )
+
+async def adopt_legacy_league(guild_id: str) -> bool:
+    """Hand the rows written before guild scoping to a guild.
+    
+    Only a guild without a league of its own can adopt them. Returns True
+    if rows were moved.
+    """
+    if not pool:
+        return False
+    
+    async with acquire() as conn:
+        async with conn.transaction():
+            has_legacy = await conn.fetchval(
+                'SELECT EXISTS (SELECT 1 FROM config WHERE guild_id = $1)', LEGACY_LEAGUE
+            )
+            has_own = await conn.fetchval(
+                'SELECT EXISTS (SELECT 1 FROM config WHERE guild_id = $1)', guild_id
+            )
+            if not has_legacy or has_own:
+                return False
+            # Rows referencing teams follow them through ON UPDATE CASCADE
+            for table in LEAGUE_TABLE_KEYS:
+                await conn.execute(
+                    f'UPDATE {table} SET guild_id = $1 WHERE guild_id = $2',
+                    guild_id, LEGACY_LEAGUE
+                )
+    return True
+
+@offline_write
+async def init_league(guild_id: str):
+    """Create a league's default config if it doesn't have one yet"""
+    if not pool:
+        return
+    
+    async with acquire() as conn:
+        await conn.executemany(
+            '''INSERT INTO config (guild_id, key, value) VALUES ($1, $2, $3)
+               ON CONFLICT (guild_id, key) DO NOTHING''',
+            [(guild_id, key, value) for key, value in DEFAULT_CONFIG.items()]
+        )
+
 # ==================== TEAMS ====================
 
+@mirrored_read(*mirror_part('teams'))
 async def get_all_teams() -> Dict:
     """Get all teams"""
     if not pool:
         return {}
     
-    async with pool.acquire() as conn:
-        rows = await conn.fetch('SELECT * FROM teams')
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT * FROM teams WHERE guild_id = $1', league_id())
         return {row['user_id']: dict(row) for row in rows}
 
+@mirrored_read(mirror_row('teams'))
 async def get_team(user_id: str) -> Optional[Dict]:
     """Get a specific team"""
     if not pool:
         return None
     
-    async with pool.acquire() as conn:
-        row = await conn.fetchrow('SELECT * FROM teams WHERE user_id = $1', user_id)
+    async with acquire() as conn:
+        row = await conn.fetchrow('SELECT * FROM teams WHERE guild_id = $1 AND user_id = $2', league_id(), user_id)
         return dict(row) if row else None
 
+@offline_write
 async def create_team(user_id: str, name: str, abbreviation: str) -> bool:
     """Create a new team"""
     if not pool:
         return False
     
     try:
-        async with pool.acquire() as conn:
+        async with acquire() as conn:
             await conn.execute(
-                'INSERT INTO teams (user_id, name, abbreviation) VALUES ($1, $2, $3)',
-                user_id, name, abbreviation
+                'INSERT INTO teams (guild_id, user_id, name, abbreviation) VALUES ($1, $2, $3, $4)',
+                league_id(), user_id, name, abbreviation
             )
             # Also create standings entry
             await conn.execute(
-                'INSERT INTO standings (user_id, wins, losses, points_for, points_against) VALUES ($1, 0, 0, 0, 0)',
-                user_id
+                '''INSERT INTO standings (guild_id, user_id, wins, losses, points_for, points_against)
+                   VALUES ($1, $2, 0, 0, 0, 0)''',
+                league_id(), user_id
             )
         return True
+    except DatabaseUnavailable:
+        raise
     except Exception as e:
         print(f"Error creating team: {e}")
         return False
 
+@offline_write
 async def update_team(user_id: str, name: str, abbreviation: str) -> bool:
     """Update a team"""
     if not pool:
         return False
     
     try:
-        async with pool.acquire() as conn:
+        async with acquire() as conn:
             await conn.execute(
-                'UPDATE teams SET name = $1, abbreviation = $2 WHERE user_id = $3',
-                name, abbreviation, user_id
+                'UPDATE teams SET name = $1, abbreviation = $2 WHERE guild_id = $3 AND user_id = $4',
+                name, abbreviation, league_id(), user_id
             )
         return True
+    except DatabaseUnavailable:
+        raise
     except Exception as e:
         print(f"Error updating team: {e}")
         return False
 
+@offline_write
 async def delete_team(user_id: str) -> bool:
     """Delete a team"""
     if not pool:
         return False
     
     try:
-        async with pool.acquire() as conn:
-            await conn.execute('DELETE FROM teams WHERE user_id = $1', user_id)
+        async with acquire() as conn:
+            await conn.execute('DELETE FROM teams WHERE guild_id = $1 AND user_id = $2', league_id(), user_id)
         return True
+    except DatabaseUnavailable:
+        raise
     except Exception as e:
         print(f"Error deleting team: {e}")
         return False
 
 # ==================== STANDINGS ====================
 
+@mirrored_read(*mirror_part('standings'))
 async def get_all_standings() -> Dict:
     """Get all standings"""
     if not pool:
         return {}
     
-    async with pool.acquire() as conn:
-        rows = await conn.fetch('SELECT * FROM standings')
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT * FROM standings WHERE guild_id = $1', league_id())
         return {row['user_id']: dict(row) for row in rows}
 
+@mirrored_read(mirror_row('standings'))
 async def get_standing(user_id: str) -> Optional[Dict]:
     """Get a specific team's standing"""
     if not pool:
         return None
     
-    async with pool.acquire() as conn:
-        row = await conn.fetchrow('SELECT * FROM standings WHERE user_id = $1', user_id)
+    async with acquire() as conn:
+        row = await conn.fetchrow(
+            'SELECT * FROM standings WHERE guild_id = $1 AND user_id = $2', league_id(), user_id
+        )
         return dict(row) if row else None
 
+@offline_write
 async def update_standing(user_id: str, wins: int, losses: int, points_for: int, points_against: int) -> bool:
     """Update a team's standing"""
     if not pool:
         return False
     
     try:
-        async with pool.acquire() as conn:
+        async with acquire() as conn:
             await conn.execute(
                 '''UPDATE standings 
                    SET wins = $1, losses = $2, points_for = $3, points_against = $4 
-                   WHERE user_id = $5''',
-                wins, losses, points_for, points_against, user_id
+                   WHERE guild_id = $5 AND user_id = $6''',
+                wins, losses, points_for, points_against, league_id(), user_id
             )
         return True
+    except DatabaseUnavailable:
+        raise
     except Exception as e:
         print(f"Error updating standing: {e}")
         return False
@@ -227,8 +962,8 @@ async def get_all_games() -> List[Dict]:
     if not pool:
         return []
     
-    async with pool.acquire() as conn:
-        rows = await conn.fetch('SELECT * FROM games ORDER BY date DESC')
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT * FROM games WHERE guild_id = $1 ORDER BY date DESC', league_id())
         return [dict(row) for row in rows]
 
 async def get_recent_games(limit: int = 5) -> List[Dict]:
@@ -236,66 +971,717 @@ async def get_recent_games(limit: int = 5) -> List[Dict]:
     if not pool:
         return []
     
-    async with pool.acquire() as conn:
-        rows = await conn.fetch('SELECT * FROM games ORDER BY date DESC LIMIT $1', limit)
+    async with acquire() as conn:
+        rows = await conn.fetch(
+            'SELECT * FROM games WHERE guild_id = $1 ORDER BY date DESC LIMIT $2', league_id(), limit
+        )
         return [dict(row) for row in rows]
 
-async def create_game(week: int, winner_id: str, loser_id: str, winner_team: str, winner_abbr: str,
-                     loser_team: str, loser_abbr: str, winner_score: int, loser_score: int) -> bool:
-    """Create a new game record"""
+async def get_games_page(limit: int, cursor: Optional[Tuple] = None, newer: bool = False,
+                         week: Optional[int] = None, team_id: Optional[str] = None,
+                         season: Optional[int] = None) -> List[Dict]:
+    """Get one page of games using keyset pagination over (date, id).
+    
+    Pages run newest first. ``cursor`` is the (date, id) of the last game on
+    the current page (or the first one when ``newer`` is set).
+    """
+    if not pool:
+        return []
+    
+    conditions = ['guild_id = $1']
+    params = [league_id()]
+    if week is not None:
+        params.append(week)
+        conditions.append(f'week = ${len(params)}')
+    if team_id is not None:
+        params.append(team_id)
+        conditions.append(f'(winner_id = ${len(params)} OR loser_id = ${len(params)})')
+    if season is not None:
+        params.append(season)
+        conditions.append(f'season = ${len(params)}')
+    if cursor is not None:
+        params.extend(cursor)
+        operator = '>' if newer else '<'
+        conditions.append(f'(date, id) {operator} (${len(params) - 1}, ${len(params)})')
+    
+    where = f"WHERE {' AND '.join(conditions)}"
+    order = 'ASC' if newer else 'DESC'
+    params.append(limit)
+    
+    async with acquire() as conn:
+        rows = await conn.fetch(
+            f'SELECT * FROM games {where} ORDER BY date {order}, id {order} LIMIT ${len(params)}',
+            *params
+        )
+    games = [dict(row) for row in rows]
+    if newer:
+        games.reverse()
+    return games
+
+class DuplicateGame(Exception):
+    """The week's matchup already has a recorded game"""
+
+@offline_write
+async def record_game(game: Dict, winner_standing: Dict, loser_standing: Dict) -> bool:
+    """Record a reported game with both teams' new standings and the head-to-head win.
+
+    Everything is written in one transaction, and logged as one write while
+    the database is down, so a game that is rejected leaves the standings
+    alone. ``game`` is the bot's game record, dated with an ISO timestamp.
+    Raises DuplicateGame if the matchup unique index rejects it; returns
+    False for any other failure.
+    """
     if not pool:
         return False
     
+    guild_id = league_id()
     try:
-        async with pool.acquire() as conn:
-            await conn.execute(
-                '''INSERT INTO games (week, winner_id, loser_id, winner_team, winner_abbr, 
-                                     loser_team, loser_abbr, winner_score, loser_score)
-                   VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)''',
-                week, winner_id, loser_id, winner_team, winner_abbr, loser_team, loser_abbr,
-                winner_score, loser_score
-            )
+        async with acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    '''INSERT INTO games (guild_id, week, winner_id, loser_id, winner_team, winner_abbr,
+                                         loser_team, loser_abbr, winner_score, loser_score, season, home_id, date)
+                       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)''',
+                    guild_id, game['week'], game['winner_id'], game['loser_id'], game['winner_team'],
+                    game['winner_abbr'], game['loser_team'], game['loser_abbr'], game['winner_score'],
+                    game['loser_score'], game['season'], game['home_id'], datetime.fromisoformat(game['date'])
+                )
+                await conn.executemany(
+                    '''UPDATE standings
+                       SET wins = $1, losses = $2, points_for = $3, points_against = $4
+                       WHERE guild_id = $5 AND user_id = $6''',
+                    [
+                        (record['wins'], record['losses'], record['points_for'], record['points_against'],
+                         guild_id, user_id)
+                        for user_id, record in ((game['winner_id'], winner_standing), (game['loser_id'], loser_standing))
+                    ]
+                )
+                await conn.execute(
+                    '''INSERT INTO head_to_head (guild_id, winner_id, loser_id, wins)
+                       VALUES ($1, $2, $3, 1)
+                       ON CONFLICT (guild_id, winner_id, loser_id)
+                       DO UPDATE SET wins = head_to_head.wins + 1''',
+                    guild_id, game['winner_id'], game['loser_id']
+                )
         return True
+    except DatabaseUnavailable:
+        raise
+    except asyncpg.UniqueViolationError as e:
+        raise DuplicateGame(
+            f"Game already recorded for week {game['week']}: {game['winner_abbr']} vs {game['loser_abbr']}"
+        ) from e
     except Exception as e:
-        print(f"Error creating game: {e}")
+        print(f"Error recording game: {e}")
+        return False
+
+async def import_game_results(games: List[Dict], standings: Dict, head_to_head_wins: Dict) -> bool:
+    """Insert a batch of games with their standings and head-to-head updates in one transaction"""
+    if not pool:
+        return False
+    
+    guild_id = league_id()
+    try:
+        async with acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(
+                    '''INSERT INTO games (guild_id, week, winner_id, loser_id, winner_team, winner_abbr,
+                                         loser_team, loser_abbr, winner_score, loser_score, season, home_id)
+                       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)''',
+                    [
+                        (guild_id, game['week'], game['winner_id'], game['loser_id'], game['winner_team'],
+                         game['winner_abbr'], game['loser_team'], game['loser_abbr'], game['winner_score'],
+                         game['loser_score'], game['season'], game['home_id'])
+                        for game in games
+                    ]
+                )
+                await conn.executemany(
+                    '''UPDATE standings
+                       SET wins = $1, losses = $2, points_for = $3, points_against = $4
+                       WHERE guild_id = $5 AND user_id = $6''',
+                    [
+                        (record['wins'], record['losses'], record['points_for'], record['points_against'],
+                         guild_id, user_id)
+                        for user_id, record in standings.items()
+                    ]
+                )
+                await conn.executemany(
+                    '''INSERT INTO head_to_head (guild_id, winner_id, loser_id, wins)
+                       VALUES ($1, $2, $3, $4)
+                       ON CONFLICT (guild_id, winner_id, loser_id)
+                       DO UPDATE SET wins = head_to_head.wins + EXCLUDED.wins''',
+                    [(guild_id, winner_id, loser_id, wins) for (winner_id, loser_id), wins in head_to_head_wins.items()]
+                )
+        return True
+    except Exception as e:
+        print(f"Error importing game results: {e}")
+        return False
+
+async def get_matchup_game(season: int, week: int, team1_id: str, team2_id: str) -> Optional[Dict]:
+    """Get the recorded game between two teams in a week"""
+    if not pool:
+        return None
+    
+    async with acquire() as conn:
+        row = await conn.fetchrow(
+            '''SELECT * FROM games
+               WHERE guild_id = $1 AND season = $2 AND week = $3
+                 AND LEAST(winner_id, loser_id) = LEAST($4, $5)
+                 AND GREATEST(winner_id, loser_id) = GREATEST($4, $5)''',
+            league_id(), season, week, team1_id, team2_id
+        )
+        return dict(row) if row else None
+
+@offline_write
+async def delete_game(game_id: int) -> bool:
+    """Delete a game record"""
+    if not pool:
+        return False
+    
+    try:
+        async with acquire() as conn:
+            await conn.execute('DELETE FROM games WHERE guild_id = $1 AND id = $2', league_id(), game_id)
+        return True
+    except DatabaseUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error deleting game: {e}")
         return False
 
 # ==================== HEAD TO HEAD ====================
 
+@mirrored_read(*mirror_part('head_to_head'))
 async def get_all_head_to_head() -> Dict:
     """Get all head-to-head records"""
     if not pool:
         return {}
     
-    async with pool.acquire() as conn:
-        rows = await conn.fetch('SELECT * FROM head_to_head')
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT * FROM head_to_head WHERE guild_id = $1', league_id())
         result = {}
         for row in rows:
             key = f"{row['winner_id']}_{row['loser_id']}"
             result[key] = {"wins": row['wins']}
         return result
 
+@offline_write
 async def update_head_to_head(winner_id: str, loser_id: str) -> bool:
     """Update head-to-head record"""
     if not pool:
         return False
     
     try:
-        async with pool.acquire() as conn:
+        async with acquire() as conn:
             await conn.execute(
-                '''INSERT INTO head_to_head (winner_id, loser_id, wins)
-                   VALUES ($1, $2, 1)
-                   ON CONFLICT (winner_id, loser_id)
+                '''INSERT INTO head_to_head (guild_id, winner_id, loser_id, wins)
+                   VALUES ($1, $2, $3, 1)
+                   ON CONFLICT (guild_id, winner_id, loser_id)
                    DO UPDATE SET wins = head_to_head.wins + 1''',
-                winner_id, loser_id
+                league_id(), winner_id, loser_id
             )
         return True
+    except DatabaseUnavailable:
+        raise
     except Exception as e:
         print(f"Error updating head-to-head: {e}")
         return False
 
+@offline_write
+async def undo_head_to_head(winner_id: str, loser_id: str) -> bool:
+    """Take back one head-to-head win"""
+    if not pool:
+        return False
+    
+    try:
+        async with acquire() as conn:
+            await conn.execute(
+                '''UPDATE head_to_head SET wins = GREATEST(wins - 1, 0)
+                   WHERE guild_id = $1 AND winner_id = $2 AND loser_id = $3''',
+                league_id(), winner_id, loser_id
+            )
+        return True
+    except DatabaseUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error updating head-to-head: {e}")
+        return False
+
+# ==================== PENDING REPORTS ====================
+
+async def create_pending_report(report: Dict) -> Optional[int]:
+    """Queue a report for confirmation, returning its id"""
+    if not pool:
+        return None
+    
+    try:
+        async with acquire() as conn:
+            return await conn.fetchval(
+                '''INSERT INTO pending_reports (guild_id, season, week, winner_id, loser_id, winner_score,
+                                              loser_score, home_id, reported_by, reason)
+                   VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                   RETURNING id''',
+                league_id(), report['season'], report['week'], report['winner_id'], report['loser_id'],
+                report['winner_score'], report['loser_score'], report.get('home_id'),
+                report.get('reported_by'), report.get('reason')
+            )
+    except Exception as e:
+        print(f"Error creating pending report: {e}")
+        return None
+
+async def get_pending_reports() -> List[Dict]:
+    """Get every queued report, oldest first"""
+    if not pool:
+        return []
+    
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT * FROM pending_reports WHERE guild_id = $1 ORDER BY id', league_id())
+        return [dict(row) for row in rows]
+
+@offline_write
+async def delete_pending_report(report_id: int) -> bool:
+    """Remove a queued report"""
+    if not pool:
+        return False
+    
+    try:
+        async with acquire() as conn:
+            await conn.execute(
+                'DELETE FROM pending_reports WHERE guild_id = $1 AND id = $2', league_id(), report_id
+            )
+        return True
+    except DatabaseUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error deleting pending report: {e}")
+        return False
+
+# ==================== OUTBOX ====================
+
+@offline_write
+async def add_outbox_effect(effect: str, requested_at) -> bool:
+    """Record a pending side-effect, merging it with one already waiting"""
+    if not pool:
+        return False
+    
+    try:
+        async with acquire() as conn:
+            await conn.execute(
+                '''INSERT INTO outbox (guild_id, effect, requested_at) VALUES ($1, $2, $3)
+                   ON CONFLICT (guild_id, effect) DO UPDATE SET requested_at = EXCLUDED.requested_at''',
+                league_id(), effect, requested_at
+            )
+        return True
+    except DatabaseUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error recording side-effect: {e}")
+        return False
+
+async def get_outbox_effects() -> Dict:
+    """Get pending side-effects as {effect: requested_at}"""
+    if not pool:
+        return {}
+    
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT effect, requested_at FROM outbox WHERE guild_id = $1', league_id())
+        return {row['effect']: row['requested_at'] for row in rows}
+
+@offline_write
+async def delete_outbox_effect(effect: str, requested_at) -> bool:
+    """Clear a side-effect once done, unless it was requested again since"""
+    if not pool:
+        return False
+    
+    try:
+        async with acquire() as conn:
+            await conn.execute(
+                'DELETE FROM outbox WHERE guild_id = $1 AND effect = $2 AND requested_at <= $3',
+                league_id(), effect, requested_at
+            )
+        return True
+    except DatabaseUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error clearing side-effect: {e}")
+        return False
+
+# ==================== LEAGUE SNAPSHOT ====================
+
+@mirrored_read(snapshot_from_mirror, snapshot_to_mirror)
+async def get_league_snapshot(include_head_to_head: bool = True) -> Dict:
+    """Get teams joined with standings, head-to-head rows and config in one round-trip"""
+    if not pool:
+        return {'teams': {}, 'standings': {}, 'head_to_head': {}, 'config': await get_config()}
+    
+    async with acquire() as conn:
+        row = await conn.fetchrow('''
+            SELECT
+                (SELECT COALESCE(json_agg(json_build_object(
+                            'user_id', t.user_id,
+                            'name', t.name,
+                            'abbreviation', t.abbreviation,
+                            'wins', s.wins,
+                            'losses', s.losses,
+                            'points_for', s.points_for,
+                            'points_against', s.points_against
+                        )), '[]'::json)
+                 FROM teams t
+                 LEFT JOIN standings s ON s.guild_id = t.guild_id AND s.user_id = t.user_id
+                 WHERE t.guild_id = $1) AS teams,
+                (SELECT COALESCE(json_agg(json_build_object(
+                            'winner_id', h.winner_id,
+                            'loser_id', h.loser_id,
+                            'wins', h.wins
+                        )), '[]'::json)
+                 FROM head_to_head h WHERE h.guild_id = $1 AND $2) AS head_to_head,
+                (SELECT COALESCE(json_object_agg(c.key, c.value), '{}'::json)
+                 FROM config c WHERE c.guild_id = $1) AS config
+        ''', league_id(), include_head_to_head)
+    
+    teams = {}
+    standings = {}
+    for team in json.loads(row['teams']):
+        user_id = team['user_id']
+        teams[user_id] = {
+            'user_id': user_id,
+            'name': team['name'],
+            'abbreviation': team['abbreviation']
+        }
+        if team['wins'] is not None:
+            standings[user_id] = {
+                'user_id': user_id,
+                'wins': team['wins'],
+                'losses': team['losses'],
+                'points_for': team['points_for'],
+                'points_against': team['points_against']
+            }
+    
+    head_to_head = {
+        f"{h2h['winner_id']}_{h2h['loser_id']}": {"wins": h2h['wins']}
+        for h2h in json.loads(row['head_to_head'])
+    }
+    
+    return {
+        'teams': teams,
+        'standings': standings,
+        'head_to_head': head_to_head,
+        'config': parse_config(json.loads(row['config']).items())
+    }
+
+# ==================== RANKING SNAPSHOTS ====================
+
+@offline_write
+async def save_ranking_snapshot(season: int, week: int, rows: List[Dict]) -> bool:
+    """Replace the ranking snapshot for a season/week"""
+    if not pool:
+        return False
+    
+    guild_id = league_id()
+    try:
+        async with acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    'DELETE FROM ranking_snapshots WHERE guild_id = $1 AND season = $2 AND week = $3',
+                    guild_id, season, week
+                )
+                await conn.executemany(
+                    '''INSERT INTO ranking_snapshots (guild_id, season, week, user_id, abbreviation, rank,
+                                                     wins, losses, points_for, points_against)
+                       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)''',
+                    [
+                        (guild_id, season, week, row['user_id'], row['abbreviation'], row['rank'],
+                         row['wins'], row['losses'], row['points_for'], row['points_against'])
+                        for row in rows
+                    ]
+                )
+        return True
+    except DatabaseUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error saving ranking snapshot: {e}")
+        return False
+
+async def get_ranking_snapshots(season: int) -> List[Dict]:
+    """Get every ranking snapshot row for a season, ordered by week"""
+    if not pool:
+        return []
+    
+    async with acquire() as conn:
+        rows = await conn.fetch(
+            'SELECT * FROM ranking_snapshots WHERE guild_id = $1 AND season = $2 ORDER BY week, rank',
+            league_id(), season
+        )
+        return [dict(row) for row in rows]
+
+# ==================== SCHEDULE ====================
+
+@offline_write
+async def save_schedule(season: int, games: List[Dict]) -> bool:
+    """Replace a season's schedule"""
+    if not pool:
+        return False
+    
+    guild_id = league_id()
+    try:
+        async with acquire() as conn:
+            async with conn.transaction():
+                await conn.execute('DELETE FROM schedule WHERE guild_id = $1 AND season = $2', guild_id, season)
+                await conn.executemany(
+                    '''INSERT INTO schedule (guild_id, season, week, home_id, away_id, home_abbr, away_abbr)
+                       VALUES ($1, $2, $3, $4, $5, $6, $7)''',
+                    [
+                        (guild_id, season, game['week'], game['home_id'], game['away_id'],
+                         game['home_abbr'], game['away_abbr'])
+                        for game in games
+                    ]
+                )
+        return True
+    except DatabaseUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error saving schedule: {e}")
+        return False
+
+async def get_schedule_week(season: int, week: int) -> List[Dict]:
+    """Get the scheduled games for one week"""
+    if not pool:
+        return []
+    
+    async with acquire() as conn:
+        rows = await conn.fetch(
+            'SELECT * FROM schedule WHERE guild_id = $1 AND season = $2 AND week = $3 ORDER BY home_abbr',
+            league_id(), season, week
+        )
+        return [dict(row) for row in rows]
+
+async def get_team_schedule(season: int, team_id: str) -> List[Dict]:
+    """Get one team's scheduled games for a season, ordered by week"""
+    if not pool:
+        return []
+    
+    async with acquire() as conn:
+        rows = await conn.fetch(
+            '''SELECT * FROM schedule WHERE guild_id = $1 AND season = $2 AND home_id = $3
+               UNION ALL
+               SELECT * FROM schedule WHERE guild_id = $1 AND season = $2 AND away_id = $3
+               ORDER BY week''',
+            league_id(), season, team_id
+        )
+        return [dict(row) for row in rows]
+
+async def get_schedule_weeks(season: int) -> int:
+    """Get how many weeks a season's schedule has (0 if none)"""
+    if not pool:
+        return 0
+    
+    async with acquire() as conn:
+        return await conn.fetchval(
+            'SELECT COALESCE(MAX(week), 0) FROM schedule WHERE guild_id = $1 AND season = $2',
+            league_id(), season
+        )
+
+# ==================== PLAYOFFS ====================
+
+async def get_playoff_bracket(season: int) -> Optional[Dict]:
+    """Get the playoff bracket for a season"""
+    if not pool:
+        return None
+    
+    async with acquire() as conn:
+        row = await conn.fetchrow(
+            'SELECT bracket FROM playoff_brackets WHERE guild_id = $1 AND season = $2', league_id(), season
+        )
+        return json.loads(row['bracket']) if row else None
+
+@offline_write
+async def save_playoff_bracket(season: int, bracket: Dict) -> bool:
+    """Create or replace the playoff bracket for a season"""
+    if not pool:
+        return False
+    
+    try:
+        async with acquire() as conn:
+            await conn.execute(
+                '''INSERT INTO playoff_brackets (guild_id, season, bracket) VALUES ($1, $2, $3::jsonb)
+                   ON CONFLICT (guild_id, season) DO UPDATE SET bracket = $3::jsonb, updated_at = NOW()''',
+                league_id(), season, json.dumps(bracket)
+            )
+        return True
+    except DatabaseUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error saving playoff bracket: {e}")
+        return False
+
+# ==================== SEASON ROLLOVER ====================
+
+async def rollover_season(season: int, champion_id: Optional[str] = None) -> Dict[str, int]:
+    """Close a season in one transaction.
+
+    Games without a season are stamped with it, the season's games,
+    standings and head-to-head move to the archive tables, their totals
+    are added to the all-time aggregates, and the hot tables are reset
+    for the next season. Returns row counts of what was archived.
+    """
+    if not pool:
+        return {}
+    
+    guild_id = league_id()
+    async with acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                'UPDATE games SET season = $1 WHERE guild_id = $2 AND season IS NULL', season, guild_id
+            )
+            
+            archived_games = await conn.fetchval(
+                '''WITH moved AS (
+                       INSERT INTO games_archive SELECT * FROM games
+                       WHERE guild_id = $1 AND season <= $2 RETURNING 1
+                   ) SELECT COUNT(*) FROM moved''',
+                guild_id, season
+            )
+            await conn.execute(
+                '''INSERT INTO season_standings (guild_id, season, user_id, abbreviation, wins, losses,
+                                               points_for, points_against)
+                   SELECT $1, $2, s.user_id, t.abbreviation, s.wins, s.losses, s.points_for, s.points_against
+                   FROM standings s JOIN teams t ON t.guild_id = s.guild_id AND t.user_id = s.user_id
+                   WHERE s.guild_id = $1
+                   ON CONFLICT (guild_id, season, user_id) DO UPDATE SET
+                       wins = EXCLUDED.wins, losses = EXCLUDED.losses,
+                       points_for = EXCLUDED.points_for, points_against = EXCLUDED.points_against''',
+                guild_id, season
+            )
+            await conn.execute(
+                '''INSERT INTO season_head_to_head (guild_id, season, winner_id, loser_id, wins)
+                   SELECT $1, $2, winner_id, loser_id, COUNT(*) FROM games
+                   WHERE guild_id = $1 AND season = $2 GROUP BY winner_id, loser_id
+                   ON CONFLICT (guild_id, season, winner_id, loser_id) DO UPDATE SET wins = EXCLUDED.wins''',
+                guild_id, season
+            )
+            
+            await conn.execute(
+                '''INSERT INTO all_time_records (guild_id, user_id, wins, losses, points_for,
+                                               points_against, seasons)
+                   SELECT guild_id, user_id, wins, losses, points_for, points_against, 1 FROM standings
+                   WHERE guild_id = $1 AND wins + losses > 0
+                   ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                       wins = all_time_records.wins + EXCLUDED.wins,
+                       losses = all_time_records.losses + EXCLUDED.losses,
+                       points_for = all_time_records.points_for + EXCLUDED.points_for,
+                       points_against = all_time_records.points_against + EXCLUDED.points_against,
+                       seasons = all_time_records.seasons + 1''',
+                guild_id
+            )
+            if champion_id:
+                await conn.execute(
+                    '''INSERT INTO all_time_records (guild_id, user_id, championships) VALUES ($1, $2, 1)
+                       ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                           championships = all_time_records.championships + 1''',
+                    guild_id, champion_id
+                )
+            await conn.execute(
+                '''INSERT INTO all_time_head_to_head (guild_id, winner_id, loser_id, wins)
+                   SELECT guild_id, winner_id, loser_id, wins FROM head_to_head WHERE guild_id = $1
+                   ON CONFLICT (guild_id, winner_id, loser_id) DO UPDATE SET
+                       wins = all_time_head_to_head.wins + EXCLUDED.wins''',
+                guild_id
+            )
+            
+            await conn.execute('DELETE FROM games WHERE guild_id = $1 AND season <= $2', guild_id, season)
+            await conn.execute('DELETE FROM head_to_head WHERE guild_id = $1', guild_id)
+            teams_reset = await conn.execute(
+                '''UPDATE standings SET wins = 0, losses = 0, points_for = 0, points_against = 0
+                   WHERE guild_id = $1''',
+                guild_id
+            )
+            await conn.execute(
+                '''INSERT INTO config (guild_id, key, value) VALUES ($1, 'season', $2), ($1, 'week', '1')
+                   ON CONFLICT (guild_id, key) DO UPDATE SET value = EXCLUDED.value''',
+                guild_id, str(season + 1)
+            )
+    
+    return {'games': archived_games, 'teams': int(teams_reset.split()[-1])}
+
+async def get_all_time_records() -> Dict:
+    """Get all-time totals over closed seasons, keyed by user ID"""
+    if not pool:
+        return {}
+    
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT * FROM all_time_records WHERE guild_id = $1', league_id())
+        return {row['user_id']: dict(row) for row in rows}
+
+async def get_all_time_head_to_head() -> Dict:
+    """Get all-time head-to-head wins over closed seasons, keyed by 'winner_loser'"""
+    if not pool:
+        return {}
+    
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT * FROM all_time_head_to_head WHERE guild_id = $1', league_id())
+        return {f"{row['winner_id']}_{row['loser_id']}": row['wins'] for row in rows}
+
+# ==================== BACKUP ====================
+
+async def stream_tables(order_by: Dict[str, str], batch_size: int = 500) -> AsyncIterator[Tuple[str, Dict]]:
+    """Yield (table, row) for the league's rows of each table in ``order_by``, sorted by its value.
+
+    Every table is read from one repeatable-read snapshot, so writes made
+    while the rows stream don't leave the tables out of step. Rows come
+    through a server-side cursor, batch_size rows at a time.
+    """
+    if not pool:
+        return
+    
+    guild_id = league_id()
+    async with acquire() as conn:
+        async with conn.transaction(isolation='repeatable_read', readonly=True):
+            for table, columns in order_by.items():
+                query = f'SELECT * FROM {table} WHERE guild_id = $1 ORDER BY {columns}'
+                async for row in conn.cursor(query, guild_id, prefetch=batch_size):
+                    yield table, dict(row)
+
+async def restore_tables(records: AsyncIterator[Tuple[str, Tuple]], columns: Dict[str, List[str]],
+                         batch_size: int = 1000) -> Dict[str, int]:
+    """Replace the league's tables with streamed (table, record) pairs in one transaction.
+
+    Records must arrive grouped by table with teams before the tables that
+    reference them. Other leagues' rows are untouched. Returns the number
+    of rows restored per table.
+    """
+    if not pool:
+        return {}
+    
+    guild_id = league_id()
+    counts = {}
+    async with acquire() as conn:
+        async with conn.transaction():
+            # Standings go with their teams (ON DELETE CASCADE)
+            for table in ('games', 'head_to_head', 'teams', 'config'):
+                await conn.execute(f'DELETE FROM {table} WHERE guild_id = $1', guild_id)
+            
+            batch_table = None
+            batch = []
+            
+            async def flush():
+                if batch:
+                    await conn.copy_records_to_table(
+                        batch_table,
+                        records=[(guild_id, *record) for record in batch],
+                        columns=['guild_id', *columns[batch_table]]
+                    )
+                    counts[batch_table] = counts.get(batch_table, 0) + len(batch)
+                    batch.clear()
+            
+            async for table, record in records:
+                if table != batch_table or len(batch) >= batch_size:
+                    await flush()
+                    batch_table = table
+                batch.append(record)
+            await flush()
+    return counts
+
 # ==================== CONFIG ====================
 
+@mirrored_read(*mirror_part('config'))
 async def get_config() -> Dict:
     """Get all config values"""
     if not pool:
@@ -306,39 +1692,182 @@ async def get_config() -> Dict:
             'admin_role': 'League Admin'
         }
     
-    async with pool.acquire() as conn:
-        rows = await conn.fetch('SELECT * FROM config')
-        config = {}
-        for row in rows:
-            key = row['key']
-            value = row['value']
-            # Convert numeric strings to integers
-            if key in ['season', 'week']:
-                config[key] = int(value)
-            else:
-                config[key] = value
-        return config
+    async with acquire() as conn:
+        rows = await conn.fetch('SELECT * FROM config WHERE guild_id = $1', league_id())
+        return parse_config((row['key'], row['value']) for row in rows)
+
+def parse_config(items) -> Dict:
+    """Build a config dict from (key, value) text pairs"""
+    config = {}
+    for key, value in items:
+        # Convert numeric strings to integers
+        if key in ['season', 'week']:
+            config[key] = int(value)
+        else:
+            config[key] = value
+    return config
 
+@offline_write
 async def set_config(key: str, value: str) -> bool:
     """Set a config value"""
     if not pool:
         return False
     
     try:
-        async with pool.acquire() as conn:
+        async with acquire() as conn:
             await conn.execute(
-                '''INSERT INTO config (key, value) VALUES ($1, $2)
-                   ON CONFLICT (key) DO UPDATE SET value = $2''',
-                key, str(value)
+                '''INSERT INTO config (guild_id, key, value) VALUES ($1, $2, $3)
+                   ON CONFLICT (guild_id, key) DO UPDATE SET value = $3''',
+                league_id(), key, str(value)
             )
         return True
+    except DatabaseUnavailable:
+        raise
     except Exception as e:
         print(f"Error setting config: {e}")
         return False
 
+# ==================== COORDINATION ====================
+
+# Several instances can share one database: one holds the gateway (or the
+# background jobs) and the others stand by. Locks and change notices use
+# dedicated session connections, so when the pool goes through a transaction
+# pooler (Supabase port 6543) point DIRECT_DATABASE_URL at a direct connection.
+INSTANCE_ID = f"{socket.gethostname()}-{os.getpid()}"
+CHANGES_CHANNEL = 'league_changes'
+# First half of every advisory lock key; the second is hashtext(lock name)
+LOCK_NAMESPACE = 0x4D4C42
+# The server drops a dead holder's session (and so its locks) after about
+# idle + interval * count seconds instead of the OS default of hours
+LOCK_KEEPALIVES = {
+    'tcp_keepalives_idle': '5',
+    'tcp_keepalives_interval': '2',
+    'tcp_keepalives_count': '3'
+}
+
+# Lock name -> dedicated connection, and the names whose lock it holds
+lock_connections = {}
+held_locks = set()
+listen_connection = None
+
+def coordination_url() -> Optional[str]:
+    return os.getenv('DIRECT_DATABASE_URL') or os.getenv('DATABASE_URL')
+
+def drop_lock_connection(name: str):
+    conn = lock_connections.pop(name, None)
+    if conn is not None:
+        conn.terminate()
+
+def discard_lock_connection(name: str):
+    held_locks.discard(name)
+    drop_lock_connection(name)
+
+async def hold_lock(name: str) -> bool:
+    """Take or keep a lock shared by every instance. Returns True while this instance holds it.
+
+    Called on a short interval: the holder's call doubles as a heartbeat, and a
+    standby's call takes the lock as soon as the holder's session is gone.
+    A holder whose connection fails keeps the lock while it reconnects, and
+    only gives it up once the new session finds another instance holding it.
+    Always True in JSON mode, which only ever runs one instance.
+    """
+    if not pool:
+        return True
+
+    held = name in held_locks
+    try:
+        conn = lock_connections.get(name)
+        if conn is not None and conn.is_closed():
+            drop_lock_connection(name)
+            conn = None
+        if conn is None:
+            conn = lock_connections[name] = await asyncpg.connect(
+                coordination_url(), timeout=10, server_settings=LOCK_KEEPALIVES
+            )
+        elif held:
+            await conn.fetchval('SELECT 1', timeout=5)
+            return True
+        # A new session has to take the lock again, even if the old one held it
+        if await conn.fetchval('SELECT pg_try_advisory_lock($1, hashtext($2))', LOCK_NAMESPACE, name, timeout=5):
+            if held:
+                print(f"🔄 Reconnected and kept lock '{name}'")
+            held_locks.add(name)
+            return True
+        if held:
+            print(f"❌ Lost lock '{name}' to another instance")
+        discard_lock_connection(name)
+        return False
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+        if held:
+            print(f"⚠️ Lock connection for '{name}' failed, reconnecting: {e}")
+            drop_lock_connection(name)
+            return True
+        discard_lock_connection(name)
+        return False
+
+async def release_lock(name: str):
+    """Give up a lock so a standby can take it right away"""
+    conn = lock_connections.get(name)
+    if conn is not None and name in held_locks and not conn.is_closed():
+        try:
+            await conn.execute('SELECT pg_advisory_unlock($1, hashtext($2))', LOCK_NAMESPACE, name)
+        except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            print(f"Error releasing lock '{name}': {e}")
+    discard_lock_connection(name)
+
+async def listen_for_changes(callback) -> bool:
+    """Call ``callback(guild_id)`` whenever another instance changes a league.
+
+    Returns False in JSON mode or if the listening connection can't be opened.
+    """
+    global listen_connection
+    if not pool:
+        return False
+
+    def on_notice(conn, pid, channel, payload):
+        notice = json.loads(payload)
+        if notice.get('instance') != INSTANCE_ID:
+            callback(notice['guild_id'])
+
+    try:
+        listen_connection = await asyncpg.connect(coordination_url(), timeout=10)
+        await listen_connection.add_listener(CHANGES_CHANNEL, on_notice)
+        return True
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+        print(f"Error listening for league changes: {e}")
+        listen_connection = None
+        return False
+
+def is_listening() -> bool:
+    return listen_connection is not None and not listen_connection.is_closed()
+
+async def notify_league_changed(guild_id: str) -> bool:
+    """Tell the other instances a league changed so they drop what they cached for it"""
+    if not pool:
+        return False
+
+    try:
+        payload = json.dumps({'instance': INSTANCE_ID, 'guild_id': guild_id})
+        async with acquire() as conn:
+            await conn.execute('SELECT pg_notify($1, $2)', CHANGES_CHANNEL, payload)
+        return True
+    except Exception as e:
+        print(f"Error announcing league change: {e}")
+        return False
+
+async def close_coordination():
+    """Release every lock and stop listening"""
+    global listen_connection
+    for name in list(lock_connections):
+        await release_lock(name)
+    if listen_connection is not None:
+        await listen_connection.close()
+        listen_connection = None
+
 async def close_db():
     """Close database connection pool"""
     global pool
     if pool:
+        await close_coordination()
         await pool.close()
         print("✅ Database connection closed")
@@ -0,0 +1,224 @@
+"""
+League backup module
+Streams the league stores to gzip-compressed newline-delimited JSON and
+restores them into either backend (Supabase or the JSON files)
+"""
+
+import asyncio
+import gzip
+import json
+import os
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Tuple
+import database as db
+
+BACKUP_FORMAT = "madden-league-backup"
+BACKUP_VERSION = 1
+BACKUP_PREFIX = "league-"
+BACKUP_SUFFIX = ".ndjson.gz"
+
+# Lines are handed to the (blocking) gzip writer in chunks off the event loop
+WRITE_CHUNK_LINES = 500
+
+# Tables in restore order (teams first, since the others reference them) with their columns
+BACKUP_TABLES = {
+    'teams': ['user_id', 'name', 'abbreviation', 'owner', 'owner_id'],
+    'standings': ['user_id', 'wins', 'losses', 'points_for', 'points_against'],
+    'games': [
+        'id', 'season', 'week', 'winner_id', 'loser_id', 'winner_team', 'winner_abbr',
+        'loser_team', 'loser_abbr', 'winner_score', 'loser_score', 'home_id', 'date'
+    ],
+    'head_to_head': ['winner_id', 'loser_id', 'wins'],
+    'config': ['key', 'value']
+}
+# Columns the database doesn't have: the JSON teams store also records the
+# owner's username and ID. Game ids come from a sequence shared by every
+# league, so restores into the database let it assign new ones.
+NOT_RESTORED_TO_DB = {('teams', 'owner'), ('teams', 'owner_id'), ('games', 'id')}
+DB_RESTORE_COLUMNS = {
+    table: [column for column in columns if (table, column) not in NOT_RESTORED_TO_DB]
+    for table, columns in BACKUP_TABLES.items()
+}
+ORDER_BY = {
+    'teams': 'user_id',
+    'standings': 'user_id',
+    'games': 'id',
+    'head_to_head': 'winner_id, loser_id',
+    'config': 'key'
+}
+
+def load_json(filepath, default):
+    """Load a JSON store, or the default if it doesn't exist"""
+    if os.path.exists(filepath):
+        with open(filepath, 'r') as f:
+            return json.load(f)
+    return default
+
+def save_json(filepath, data):
+    """Save a JSON store"""
+    with open(filepath, 'w') as f:
+        json.dump(data, f, indent=4)
+
+# ==================== EXPORT ====================
+
+async def iter_json_records(data_dir: str) -> AsyncIterator[Tuple[str, Dict]]:
+    """Yield (table, row) from the JSON files, one store loaded at a time"""
+    teams = await asyncio.to_thread(load_json, os.path.join(data_dir, 'teams.json'), {})
+    for user_id, team in teams.items():
+        yield 'teams', {'user_id': user_id, **team}
+    del teams
+
+    standings = await asyncio.to_thread(load_json, os.path.join(data_dir, 'standings.json'), {})
+    for user_id, record in standings.items():
+        yield 'standings', {'user_id': user_id, **record}
+    del standings
+
+    games = await asyncio.to_thread(load_json, os.path.join(data_dir, 'games.json'), [])
+    for i, game in enumerate(games):
+        # Older records have no id; they are numbered by position like the bot does
+        yield 'games', {**game, 'id': game.get('id', i + 1)}
+    del games
+
+    head_to_head = await asyncio.to_thread(load_json, os.path.join(data_dir, 'head_to_head.json'), {})
+    for key, data in head_to_head.items():
+        parts = key.split('_')
+        if len(parts) == 2:
+            yield 'head_to_head', {'winner_id': parts[0], 'loser_id': parts[1], 'wins': data.get('wins', 0)}
+    del head_to_head
+
+    config = await asyncio.to_thread(load_json, os.path.join(data_dir, 'config.json'), {})
+    for key, value in config.items():
+        yield 'config', {'key': key, 'value': str(value)}
+
+async def iter_db_records() -> AsyncIterator[Tuple[str, Dict]]:
+    """Yield (table, row) for the league in scope, streaming every table from one snapshot"""
+    async for table, row in db.stream_tables({table: ORDER_BY[table] for table in BACKUP_TABLES}):
+        yield table, row
+
+def iter_league_records(data_dir: str) -> AsyncIterator[Tuple[str, Dict]]:
+    """Yield (table, row) for the whole league from whichever backend is active"""
+    if db.pool:
+        return iter_db_records()
+    return iter_json_records(data_dir)
+
+def encode_value(value):
+    """JSON-encode values the json module doesn't handle (timestamps)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Can't back up value of type {type(value).__name__}")
+
+async def write_backup(path: str, records: AsyncIterator[Tuple[str, Dict]]) -> Dict[str, int]:
+    """Write (table, row) records to a gzip NDJSON archive. Returns row counts per table."""
+    counts = {}
+    header = {'format': BACKUP_FORMAT, 'version': BACKUP_VERSION, 'created': datetime.utcnow().isoformat()}
+    lines = [json.dumps(header)]
+
+    # Write to a temporary name so a half-written archive is never mistaken for a backup
+    partial_path = path + ".partial"
+    archive = await asyncio.to_thread(gzip.open, partial_path, 'wt', encoding='utf-8')
+    try:
+        async for table, row in records:
+            columns = BACKUP_TABLES[table]
+            lines.append(json.dumps(
+                {'table': table, 'row': {column: row.get(column) for column in columns}},
+                default=encode_value
+            ))
+            counts[table] = counts.get(table, 0) + 1
+            if len(lines) >= WRITE_CHUNK_LINES:
+                await asyncio.to_thread(archive.write, "\n".join(lines) + "\n")
+                lines = []
+        if lines:
+            await asyncio.to_thread(archive.write, "\n".join(lines) + "\n")
+    finally:
+        await asyncio.to_thread(archive.close)
+
+    os.replace(partial_path, path)
+    return counts
+
+async def export_league(backup_dir: str, data_dir: str) -> Tuple[str, Dict[str, int]]:
+    """Back up the league into a new timestamped archive. Returns (path, row counts)."""
+    os.makedirs(backup_dir, exist_ok=True)
+    filename = f"{BACKUP_PREFIX}{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}{BACKUP_SUFFIX}"
+    path = os.path.join(backup_dir, filename)
+    counts = await write_backup(path, iter_league_records(data_dir))
+    return path, counts
+
+def list_backups(backup_dir: str) -> List[str]:
+    """Get backup filenames, newest first"""
+    if not os.path.isdir(backup_dir):
+        return []
+    return sorted(
+        (name for name in os.listdir(backup_dir) if name.startswith(BACKUP_PREFIX) and name.endswith(BACKUP_SUFFIX)),
+        reverse=True
+    )
+
+def prune_backups(backup_dir: str, keep: int) -> List[str]:
+    """Delete all but the newest ``keep`` backups. Returns the removed filenames."""
+    removed = list_backups(backup_dir)[keep:]
+    for name in removed:
+        os.remove(os.path.join(backup_dir, name))
+    return removed
+
+# ==================== RESTORE ====================
+
+async def read_backup(path: str) -> AsyncIterator[Tuple[str, Dict]]:
+    """Yield (table, row) from an archive, reading it in chunks off the event loop"""
+    archive = await asyncio.to_thread(gzip.open, path, 'rt', encoding='utf-8')
+    try:
+        header = json.loads(await asyncio.to_thread(archive.readline) or "{}")
+        if header.get('format') != BACKUP_FORMAT:
+            raise ValueError("not a league backup")
+        if header.get('version', 0) > BACKUP_VERSION:
+            raise ValueError(f"backup version {header['version']} is newer than this bot supports")
+
+        while True:
+            lines = await asyncio.to_thread(archive.readlines, 1 << 20)
+            if not lines:
+                break
+            for line in lines:
+                if line.strip():
+                    entry = json.loads(line)
+                    if entry['table'] in BACKUP_TABLES:
+                        yield entry['table'], entry['row']
+    finally:
+        await asyncio.to_thread(archive.close)
+
+async def iter_db_restore_records(path: str) -> AsyncIterator[Tuple[str, Tuple]]:
+    """Convert archive rows to COPY records for the database"""
+    async for table, row in read_backup(path):
+        if table == 'games' and row.get('date'):
+            row['date'] = datetime.fromisoformat(row['date'])
+        yield table, tuple(row.get(column) for column in DB_RESTORE_COLUMNS[table])
+
+async def restore_json(path: str, data_dir: str) -> Dict[str, int]:
+    """Rebuild the JSON stores from an archive, writing each file once"""
+    stores = {'teams': {}, 'standings': {}, 'games': [], 'head_to_head': {}, 'config': {}}
+    counts = {}
+    async for table, row in read_backup(path):
+        counts[table] = counts.get(table, 0) + 1
+        if table == 'teams':
+            team = {'name': row['name'], 'abbreviation': row['abbreviation']}
+            # Backups taken from the database (or before owners were kept) have no owner name
+            if row.get('owner') is not None:
+                team['owner'] = row['owner']
+            team['owner_id'] = row.get('owner_id') or row['user_id']
+            stores['teams'][row['user_id']] = team
+        elif table == 'standings':
+            stores['standings'][row['user_id']] = {key: row[key] for key in BACKUP_TABLES['standings'][1:]}
+        elif table == 'games':
+            stores['games'].append(row)
+        elif table == 'head_to_head':
+            stores['head_to_head'][f"{row['winner_id']}_{row['loser_id']}"] = {'wins': row['wins']}
+        else:
+            value = row['value']
+            stores['config'][row['key']] = int(value) if row['key'] in ('season', 'week') else value
+
+    for table, data in stores.items():
+        await asyncio.to_thread(save_json, os.path.join(data_dir, f"{table}.json"), data)
+    return counts
+
+async def restore_league(path: str, data_dir: str) -> Dict[str, int]:
+    """Replace the league with an archive's contents in whichever backend is active"""
+    if db.pool:
+        return await db.restore_tables(iter_db_restore_records(path), DB_RESTORE_COLUMNS)
+    return await restore_json(path, data_dir)
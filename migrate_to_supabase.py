@@ -1,148 +1,358 @@
 """
 Migration script to move data from JSON files to Supabase
-Run this once to migrate your existing league data
+Run this once per league (Discord server) to migrate your existing league data
+
+Each JSON store is loaded once and streamed into staging tables with COPY,
+then merged into the live tables in a single transaction. Progress is kept
+in data/migration_progress.json, so a failed run can simply be started
+again: finished steps are skipped, and the merge is an upsert (games are
+matched on season, week, team pair and date), so it never hits unique
+violations. The result is verified with per-table checksums.
+
+Usage: python migrate_to_supabase.py --guild GUILD_ID [--restart]
 """
 
+import argparse
 import asyncio
+import hashlib
 import json
 import os
+import time
+from datetime import datetime
 from dotenv import load_dotenv
 import database as db
 
 # Load environment variables
 load_dotenv()
 
+DATA_DIR = 'data'
+LEAGUES_DIR = os.path.join(DATA_DIR, 'leagues')
+PROGRESS_FILE = os.path.join(DATA_DIR, 'migration_progress.json')
+SOURCE_FILES = ['teams.json', 'standings.json', 'games.json', 'head_to_head.json', 'config.json']
+
+DEFAULT_CONFIG = {'league_name': 'Madden Franchise League', 'season': 1, 'week': 1, 'admin_role': 'League Admin'}
+
+# Staging tables mirror the live tables without constraints, so COPY never fails on a row
+STAGING_TABLES = {
+    'teams': [('user_id', 'TEXT'), ('name', 'TEXT'), ('abbreviation', 'TEXT')],
+    'standings': [
+        ('user_id', 'TEXT'), ('wins', 'INTEGER'), ('losses', 'INTEGER'),
+        ('points_for', 'INTEGER'), ('points_against', 'INTEGER')
+    ],
+    'games': [
+        ('position', 'INTEGER'), ('season', 'INTEGER'), ('week', 'INTEGER'), ('winner_id', 'TEXT'), ('loser_id', 'TEXT'),
+        ('winner_team', 'TEXT'), ('winner_abbr', 'TEXT'), ('loser_team', 'TEXT'), ('loser_abbr', 'TEXT'),
+        ('winner_score', 'INTEGER'), ('loser_score', 'INTEGER'), ('home_id', 'TEXT'), ('date', 'TIMESTAMP')
+    ],
+    'head_to_head': [('winner_id', 'TEXT'), ('loser_id', 'TEXT'), ('wins', 'INTEGER')],
+    'config': [('key', 'TEXT'), ('value', 'TEXT')]
+}
+
+# Upserts from staging into the live tables of the league ($1). Rows that
+# reference a team that doesn't exist (e.g. games of a removed team) are skipped.
+MERGE_STATEMENTS = {
+    'config': '''
+        INSERT INTO config (guild_id, key, value)
+        SELECT $1, key, value FROM migration_config
+        ON CONFLICT (guild_id, key) DO UPDATE SET value = EXCLUDED.value
+    ''',
+    'teams': '''
+        INSERT INTO teams (guild_id, user_id, name, abbreviation)
+        SELECT $1, user_id, name, abbreviation FROM migration_teams
+        ON CONFLICT (guild_id, user_id) DO UPDATE SET name = EXCLUDED.name, abbreviation = EXCLUDED.abbreviation
+    ''',
+    'standings': '''
+        INSERT INTO standings (guild_id, user_id, wins, losses, points_for, points_against)
+        SELECT $1, s.user_id, s.wins, s.losses, s.points_for, s.points_against
+        FROM migration_standings s JOIN teams t ON t.guild_id = $1 AND t.user_id = s.user_id
+        ON CONFLICT (guild_id, user_id) DO UPDATE SET
+            wins = EXCLUDED.wins, losses = EXCLUDED.losses,
+            points_for = EXCLUDED.points_for, points_against = EXCLUDED.points_against
+    ''',
+    # Game ids come from a sequence shared by every league, so the sequence
+    # assigns them; a game already in the league is recognised by its natural
+    # key (season, week, team pair, date) and skipped. A live game for the same
+    # matchup on another date is left alone and shows up in verification.
+    'games': '''
+        INSERT INTO games (guild_id, season, week, winner_id, loser_id, winner_team, winner_abbr,
+                           loser_team, loser_abbr, winner_score, loser_score, home_id, date)
+        SELECT $1, g.season, g.week, g.winner_id, g.loser_id, g.winner_team, g.winner_abbr,
+               g.loser_team, g.loser_abbr, g.winner_score, g.loser_score, g.home_id, g.date
+        FROM (
+            SELECT DISTINCT ON (season, week, LEAST(winner_id, loser_id), GREATEST(winner_id, loser_id), date) *
+            FROM migration_games
+            ORDER BY season, week, LEAST(winner_id, loser_id), GREATEST(winner_id, loser_id), date, position
+        ) g
+        WHERE g.winner_id IN (SELECT user_id FROM teams WHERE guild_id = $1)
+          AND g.loser_id IN (SELECT user_id FROM teams WHERE guild_id = $1)
+          AND NOT EXISTS (
+              SELECT 1 FROM games e
+              WHERE e.guild_id = $1 AND e.season IS NOT DISTINCT FROM g.season AND e.week = g.week
+                AND LEAST(e.winner_id, e.loser_id) = LEAST(g.winner_id, g.loser_id)
+                AND GREATEST(e.winner_id, e.loser_id) = GREATEST(g.winner_id, g.loser_id)
+                AND e.date = g.date
+          )
+        ORDER BY g.date, g.position
+        ON CONFLICT DO NOTHING
+    ''',
+    'head_to_head': '''
+        INSERT INTO head_to_head (guild_id, winner_id, loser_id, wins)
+        SELECT $1, h.winner_id, h.loser_id, h.wins
+        FROM migration_head_to_head h
+        WHERE h.winner_id IN (SELECT user_id FROM teams WHERE guild_id = $1)
+          AND h.loser_id IN (SELECT user_id FROM teams WHERE guild_id = $1)
+        ON CONFLICT (guild_id, winner_id, loser_id) DO UPDATE SET wins = EXCLUDED.wins
+    '''
+}
+
+# Canonical '|'-joined line per row, matched by checksum_lines() on the Python side.
+# concat_ws skips NULLs, and checksum_lines() skips None the same way.
+CHECKSUM_QUERIES = {
+    'teams': ("concat_ws('|', user_id, name, abbreviation)", 'teams', 'user_id'),
+    'standings': (
+        "concat_ws('|', user_id, wins, losses, points_for, points_against)", 'standings', 'user_id'
+    ),
+    'games': (
+        "concat_ws('|', season, week, winner_id, loser_id, winner_score, loser_score, home_id)", 'games',
+        "concat_ws('|', season, week, LEAST(winner_id, loser_id), GREATEST(winner_id, loser_id), date)"
+    ),
+    'head_to_head': ("concat_ws('|', winner_id, loser_id, wins)", 'head_to_head', "winner_id || '_' || loser_id"),
+    'config': ("concat_ws('|', key, value)", 'config', 'key')
+}
+
 def load_json(filepath):
     """Load JSON file"""
     try:
         with open(filepath, 'r') as f:
             return json.load(f)
     except FileNotFoundError:
-        return {} if 'config' not in filepath else {'league_name': 'Madden Franchise League', 'season': 1, 'week': 1, 'admin_role': 'League Admin'}
+        return {} if 'config' not in filepath else dict(DEFAULT_CONFIG)
     except json.JSONDecodeError:
         return {}
 
-async def migrate_data():
-    """Migrate all data from JSON to Supabase"""
-    
-    print("🚀 Starting migration to Supabase...")
+def source_dir(guild_id):
+    """Get the league's JSON directory, or DATA_DIR for a single-league layout"""
+    league_dir = os.path.join(LEAGUES_DIR, guild_id)
+    return league_dir if os.path.isdir(league_dir) else DATA_DIR
+
+def source_checksum(guild_id):
+    """Checksum of the raw JSON files, used to tell whether saved progress still applies"""
+    digest = hashlib.md5(guild_id.encode())
+    for filename in SOURCE_FILES:
+        path = os.path.join(source_dir(guild_id), filename)
+        digest.update(filename.encode())
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def load_progress(checksum, restart):
+    """Load saved progress, starting fresh if the source changed or --restart was given"""
+    progress = load_json(PROGRESS_FILE) if os.path.exists(PROGRESS_FILE) else {}
+    if restart or progress.get('source_checksum') != checksum:
+        progress = {'source_checksum': checksum, 'staged': [], 'merged': False, 'verified': False}
+    return progress
+
+def save_progress(progress):
+    """Save the progress marker"""
+    with open(PROGRESS_FILE, 'w') as f:
+        json.dump(progress, f, indent=4)
+
+# Date given to older game records that have none. It is fixed, rather than
+# the time of the run, so a rerun recognises games it already merged.
+UNDATED_GAME_DATE = datetime(1970, 1, 1)
+
+def parse_date(value):
+    """Parse a stored ISO timestamp, defaulting to UNDATED_GAME_DATE"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return UNDATED_GAME_DATE
+
+def build_records(data_dir):
+    """Load every store once and convert it to COPY records keyed by table"""
+    teams = load_json(os.path.join(data_dir, 'teams.json'))
+    standings = load_json(os.path.join(data_dir, 'standings.json'))
+    games = load_json(os.path.join(data_dir, 'games.json'))
+    head_to_head = load_json(os.path.join(data_dir, 'head_to_head.json'))
+    config = load_json(os.path.join(data_dir, 'config.json'))
+
+    records = {
+        'teams': [(user_id, team['name'], team['abbreviation']) for user_id, team in teams.items()],
+        'standings': [
+            (
+                user_id,
+                standing.get('wins', 0),
+                standing.get('losses', 0),
+                standing.get('points_for', 0),
+                standing.get('points_against', 0)
+            )
+            for user_id, standing in standings.items()
+        ],
+        'games': [
+            (
+                # Position in the JSON log, to keep the order of games recorded at the same time
+                i,
+                game.get('season'),
+                game.get('week', 1),
+                game.get('winner_id'),
+                game.get('loser_id'),
+                game.get('winner_team', ''),
+                game.get('winner_abbr', ''),
+                game.get('loser_team', ''),
+                game.get('loser_abbr', ''),
+                game.get('winner_score', 0),
+                game.get('loser_score', 0),
+                game.get('home_id'),
+                parse_date(game.get('date'))
+            )
+            for i, game in enumerate(games)
+        ],
+        'head_to_head': [
+            (*key.split('_'), data.get('wins', 1))
+            for key, data in head_to_head.items() if len(key.split('_')) == 2
+        ],
+        'config': [(key, str(value)) for key, value in config.items()]
+    }
+    return records
+
+def checksum_lines(lines):
+    """Order-independent checksum of canonical row lines"""
+    return hashlib.md5("\n".join(sorted(lines)).encode()).hexdigest()
+
+def canonical_line(values):
+    """Join a row the way concat_ws('|', ...) does"""
+    return "|".join(str(value) for value in values if value is not None)
+
+def expected_rows(table, records, team_ids):
+    """Get {key: canonical line} for the source rows that should have been merged into a table"""
+    if table == 'teams':
+        return {row[0]: canonical_line(row) for row in records}
+    if table == 'standings':
+        return {row[0]: canonical_line(row) for row in records if row[0] in team_ids}
+    if table == 'games':
+        return {
+            canonical_line((row[1], row[2], min(row[3], row[4]), max(row[3], row[4]), row[12])):
+                canonical_line(row[1:5] + row[9:12])
+            for row in records if row[3] in team_ids and row[4] in team_ids
+        }
+    if table == 'head_to_head':
+        return {f"{row[0]}_{row[1]}": canonical_line(row) for row in records if row[0] in team_ids and row[1] in team_ids}
+    return {row[0]: canonical_line(row) for row in records}
+
+async def stage_table(conn, table, records):
+    """Stream one store into its staging table with COPY"""
+    columns = STAGING_TABLES[table]
+    await conn.execute(
+        f"CREATE TABLE IF NOT EXISTS migration_{table} ({', '.join(f'{name} {kind}' for name, kind in columns)})"
+    )
+    await conn.execute(f"TRUNCATE migration_{table}")
+    await conn.copy_records_to_table(
+        f"migration_{table}",
+        records=records,
+        columns=[name for name, _ in columns]
+    )
+
+async def merge_staging(conn, guild_id):
+    """Merge every staging table into the league's live tables in one transaction"""
+    async with conn.transaction():
+        for table in ['config', 'teams', 'standings', 'games', 'head_to_head']:
+            await conn.execute(MERGE_STATEMENTS[table], guild_id)
+
+async def verify_table(conn, guild_id, table, records, team_ids):
+    """Compare a table's checksum over the migrated keys with the source. Returns (ok, expected count, found count)"""
+    expected = expected_rows(table, records, team_ids)
+    line_sql, source_table, key_sql = CHECKSUM_QUERIES[table]
+    row = await conn.fetchrow(
+        f'''SELECT COUNT(*) AS found,
+                   md5(COALESCE(string_agg(line, E'\\n' ORDER BY line COLLATE "C"), '')) AS checksum
+            FROM (SELECT {line_sql} AS line FROM {source_table}
+                  WHERE guild_id = $1 AND ({key_sql})::text = ANY($2::text[])) rows''',
+        guild_id, list(expected)
+    )
+    return row['checksum'] == checksum_lines(expected.values()), len(expected), row['found']
+
+async def migrate_data(guild_id, restart=False):
+    """Migrate a league's data from JSON to Supabase"""
+
+    print(f"🚀 Starting migration of league {guild_id} to Supabase...")
     print("=" * 50)
-    
+    started = time.perf_counter()
+
     # Initialize database
     success = await db.init_db()
     if not success:
         print("❌ Failed to connect to database!")
         print("Make sure DATABASE_URL is set in your .env file")
         return
-    
+
+    progress = load_progress(source_checksum(guild_id), restart)
+    if progress['verified']:
+        print("\n✅ These JSON files were already migrated and verified. Use --restart to migrate again.")
+        await db.close_db()
+        return
+
     # Load JSON data
-    print("\n📂 Loading JSON files...")
-    teams = load_json('data/teams.json')
-    standings = load_json('data/standings.json')
-    games = load_json('data/games.json')
-    head_to_head = load_json('data/head_to_head.json')
-    config = load_json('data/config.json')
-    
-    print(f"   Teams: {len(teams)}")
-    print(f"   Standings: {len(standings)}")
-    print(f"   Games: {len(games)}")
-    print(f"   Head-to-Head: {len(head_to_head)}")
-    
-    # Migrate config
-    print("\n⚙️  Migrating config...")
-    for key, value in config.items():
-        await db.set_config(key, str(value))
-    print("   ✅ Config migrated")
-    
-    # Migrate teams
-    print("\n👥 Migrating teams...")
-    team_count = 0
-    for user_id, team_data in teams.items():
-        success = await db.create_team(
-            user_id,
-            team_data['name'],
-            team_data['abbreviation']
-        )
-        if success:
-            team_count += 1
-            print(f"   ✅ {team_data['name']} ({team_data['abbreviation']})")
-        else:
-            print(f"   ⚠️  Failed to migrate {team_data['name']}")
-    
-    print(f"\n   Total teams migrated: {team_count}/{len(teams)}")
-    
-    # Migrate standings
-    print("\n📊 Migrating standings...")
-    standing_count = 0
-    for user_id, standing_data in standings.items():
-        if user_id in teams:  # Only migrate if team exists
-            success = await db.update_standing(
-                user_id,
-                standing_data.get('wins', 0),
-                standing_data.get('losses', 0),
-                standing_data.get('points_for', 0),
-                standing_data.get('points_against', 0)
-            )
-            if success:
-                standing_count += 1
-                record = f"{standing_data.get('wins', 0)}-{standing_data.get('losses', 0)}"
-                print(f"   ✅ {teams[user_id]['abbreviation']}: {record}")
-    
-    print(f"\n   Total standings migrated: {standing_count}/{len(standings)}")
-    
-    # Migrate games
-    print("\n🏈 Migrating games...")
-    game_count = 0
-    for game in games:
-        success = await db.create_game(
-            game.get('week', 1),
-            game.get('winner_id', ''),
-            game.get('loser_id', ''),
-            game.get('winner_team', ''),
-            game.get('winner_abbr', ''),
-            game.get('loser_team', ''),
-            game.get('loser_abbr', ''),
-            game.get('winner_score', 0),
-            game.get('loser_score', 0)
-        )
-        if success:
-            game_count += 1
-            print(f"   ✅ Week {game.get('week')}: {game.get('winner_abbr')} {game.get('winner_score')} - {game.get('loser_score')} {game.get('loser_abbr')}")
-    
-    print(f"\n   Total games migrated: {game_count}/{len(games)}")
-    
-    # Migrate head-to-head
-    print("\n🆚 Migrating head-to-head records...")
-    h2h_count = 0
-    for key, data in head_to_head.items():
-        parts = key.split('_')
-        if len(parts) == 2:
-            winner_id, loser_id = parts
-            # Update multiple times if wins > 1
-            for _ in range(data.get('wins', 1)):
-                success = await db.update_head_to_head(winner_id, loser_id)
-                if success:
-                    h2h_count += 1
-    
-    print(f"   Total head-to-head records migrated: {h2h_count}")
-    
-    # Verify migration
-    print("\n✅ Verifying migration...")
-    db_teams = await db.get_all_teams()
-    db_standings = await db.get_all_standings()
-    db_games = await db.get_all_games()
-    db_config = await db.get_config()
-    
-    print(f"   Teams in database: {len(db_teams)}")
-    print(f"   Standings in database: {len(db_standings)}")
-    print(f"   Games in database: {len(db_games)}")
-    print(f"   Config in database: {len(db_config)} keys")
-    
-    # Close database connection
-    await db.close_db()
-    
+    data_dir = source_dir(guild_id)
+    print(f"\n📂 Loading JSON files from {data_dir}...")
+    records = build_records(data_dir)
+    for table, rows in records.items():
+        print(f"   {table}: {len(rows)}")
+
+    try:
+        async with db.pool.acquire() as conn:
+            # Stage
+            print("\n📥 Copying into staging tables...")
+            for table, rows in records.items():
+                if table in progress['staged']:
+                    print(f"   ⏭️  {table} already staged")
+                    continue
+                await stage_table(conn, table, rows)
+                progress['staged'].append(table)
+                save_progress(progress)
+                print(f"   ✅ {table}: {len(rows)} rows")
+
+            # Merge
+            if progress['merged']:
+                print("\n⏭️  Staging tables already merged")
+            else:
+                print("\n🔀 Merging into live tables (single transaction)...")
+                await merge_staging(conn, guild_id)
+                progress['merged'] = True
+                save_progress(progress)
+                print("   ✅ Merge committed")
+
+            # Verify
+            print("\n🔎 Verifying checksums...")
+            team_ids = {
+                row['user_id'] for row in await conn.fetch('SELECT user_id FROM teams WHERE guild_id = $1', guild_id)
+            }
+            all_ok = True
+            for table, rows in records.items():
+                ok, expected, found = await verify_table(conn, guild_id, table, rows, team_ids)
+                all_ok = all_ok and ok
+                skipped = len(rows) - expected
+                note = f" ({skipped} skipped: team not registered)" if skipped else ""
+                print(f"   {'✅' if ok else '❌'} {table}: {found}/{expected} rows match{note}")
+
+            if not all_ok:
+                print("\n❌ Verification failed - staging tables kept for inspection. Run again with --restart.")
+                return
+
+            for table in STAGING_TABLES:
+                await conn.execute(f"DROP TABLE IF EXISTS migration_{table}")
+            progress['verified'] = True
+            save_progress(progress)
+    except Exception as e:
+        print(f"\n❌ Migration stopped: {e}")
+        print("Fix the problem and run the script again - it resumes from the last finished step.")
+        return
+    finally:
+        # Close database connection
+        await db.close_db()
+
     print("\n" + "=" * 50)
-    print("🎉 Migration complete!")
+    print(f"🎉 Migration complete in {time.perf_counter() - started:.1f}s!")
     print("\nNext steps:")
     print("1. Verify data in Supabase dashboard")
     print("2. Update bot.py to use database")
@@ -150,5 +360,10 @@ async def migrate_data():
     print("=" * 50)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate league data from JSON files to Supabase")
+    parser.add_argument('--guild', required=True, help="Discord server ID of the league being migrated")
+    parser.add_argument('--restart', action='store_true', help="Ignore saved progress and migrate from scratch")
+    args = parser.parse_args()
+
     # Run migration
-    asyncio.run(migrate_data())
+    asyncio.run(migrate_data(args.guild, args.restart))
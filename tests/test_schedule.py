@@ -0,0 +1,45 @@
+from collections import Counter
+
+import pytest
+
+from bot import generate_schedule, max_schedule_weeks
+
+
+def schedule_counts(team_count, weeks=18):
+    teams = list(range(team_count))
+    groups = [teams[i:i + 4] for i in range(0, team_count, 4)]
+    rounds = generate_schedule(groups, weeks)
+    games = Counter()
+    byes = Counter()
+    meetings = Counter()
+    for pairs in rounds:
+        playing = [team for pair in pairs for team in pair]
+        assert len(playing) == len(set(playing))
+        for home, away in pairs:
+            games[home] += 1
+            games[away] += 1
+            meetings[frozenset((home, away))] += 1
+        for team in set(teams) - set(playing):
+            byes[team] += 1
+    return rounds, [games[team] for team in teams], [byes[team] for team in teams], meetings
+
+
+@pytest.mark.parametrize("team_count, expected_weeks", [(6, 10), (10, 18), (30, 18), (32, 18)])
+def test_every_team_plays_the_same_games_with_one_bye(team_count, expected_weeks):
+    rounds, games, byes, meetings = schedule_counts(team_count)
+    assert len(rounds) == expected_weeks
+    assert set(games) == {expected_weeks - 1}
+    assert set(byes) == {1}
+    assert max(meetings.values()) <= 2
+
+
+def test_odd_team_count_gets_an_odd_number_of_weeks():
+    rounds, games, byes, _ = schedule_counts(31)
+    assert len(rounds) == 17
+    assert set(games) == {16}
+    assert set(byes) == {1}
+
+
+def test_small_leagues_report_fewer_weeks():
+    assert max_schedule_weeks(6) == 10
+    assert max_schedule_weeks(5) == 5